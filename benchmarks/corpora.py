@@ -0,0 +1,81 @@
+# The corpora the benchmarks run on.
+# Everything is generated from a fixed seed, so every run compares exactly the same strings,
+# and nothing has to be downloaded.
+
+import random
+from pathlib import Path
+from typing import Callable, Dict, List
+
+DATA = Path(__file__).parent / "data"
+
+SYLLABLES = [
+    "ka", "ri", "to", "men", "sa", "lo", "ve", "dor", "ni", "qu",
+    "ell", "an", "stra", "ber", "ung", "ché", "ü", "ø", "ña", "ij",
+]  # fmt: skip
+
+PUNCTUATION = ".,-!?'()&/"
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4)))
+
+
+def _decorate(rng: random.Random, string: str) -> str:
+    # Gives the normalization flags something to do: mixed case and punctuation.
+    if rng.random() < 0.3:
+        string = string.title()
+    if rng.random() < 0.3:
+        position = rng.randint(0, len(string))
+        string = string[:position] + rng.choice(PUNCTUATION) + string[position:]
+    return string
+
+
+def typo(rng: random.Random, string: str) -> str:
+    """Returns the string with one random insertion, deletion or substitution."""
+    if not string:
+        return string
+
+    position = rng.randrange(len(string))
+    letter = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    edit = rng.randrange(3)
+
+    if edit == 0:
+        return string[:position] + letter + string[position:]
+    if edit == 1:
+        return string[:position] + string[position + 1 :]
+    return string[:position] + letter + string[position + 1 :]
+
+
+def synthetic(size: int, seed: int = 0) -> List[str]:
+    """Returns `size` made up names of one to four words,
+    with accents, mixed case and punctuation."""
+    rng = random.Random(seed)
+    return [
+        _decorate(rng, " ".join(_word(rng) for _ in range(rng.randint(1, 4))))
+        for _ in range(size)
+    ]
+
+
+def countries(size: int, seed: int = 0) -> List[str]:
+    """Returns `size` country names from the bundled list.
+    Once the list runs out, the names repeat with a typo, like a real list with duplicates would.
+    """
+    rng = random.Random(seed)
+    names = (DATA / "countries.txt").read_text(encoding="utf-8").splitlines()
+    return [
+        names[i] if i < len(names) else typo(rng, rng.choice(names))
+        for i in range(size)
+    ]
+
+
+CORPORA: Dict[str, Callable[[int, int], List[str]]] = {
+    "synthetic": synthetic,
+    "countries": countries,
+}
+
+
+def queries(corpus: List[str], count: int, seed: int = 1) -> List[str]:
+    """Returns `count` queries for a corpus: strings of the corpus with a typo,
+    so every query has a close match, but not an exact one."""
+    rng = random.Random(seed)
+    return [typo(rng, rng.choice(corpus)) for _ in range(count)]
@@ -0,0 +1,441 @@
+# The benchmark suite of stringmatch.
+# Times the Strings, Distance, Ratio, Match and MatchIndex classes across corpus sizes,
+# scorers and keyword arguments, and compares them to calling rapidfuzz directly,
+# which shows how much the library adds on top of rapidfuzz.
+#
+# Run it from the root of the repository, see the README in this folder for all options:
+#   python benchmarks/run.py --sizes 10,1000,100000 --output results.json
+#   python benchmarks/run.py --compare results.json
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+import rapidfuzz
+from corpora import CORPORA, queries
+from rapidfuzz import distance, process
+
+import stringmatch
+from stringmatch import (
+    Distance,
+    JaroScorer,
+    JaroWinklerScorer,
+    LevenshteinScorer,
+    Match,
+    Normalizer,
+    Ratio,
+    Strings,
+)
+
+SCORERS = {
+    "levenshtein": (LevenshteinScorer, distance.Levenshtein.normalized_similarity),
+    "jaro": (JaroScorer, distance.Jaro.normalized_similarity),
+    "jarowinkler": (JaroWinklerScorer, distance.JaroWinkler.normalized_similarity),
+}
+
+# Every normalization flag on its own, compared to the default settings.
+OPTIONS: Dict[str, Dict[str, bool]] = {
+    "default": {},
+    "latinise": {"latinise": True},
+    "case_sensitive": {"ignore_case": False},
+    "remove_punctuation": {"remove_punctuation": True},
+    "alphanumeric": {"alphanumeric": True},
+    "include_partial": {"include_partial": True},
+}
+
+GROUPS = ["Strings", "Distance", "Ratio", "Match", "MatchIndex"]
+
+# The score and limit of the Match benchmarks.
+SCORE = 70
+LIMIT = 5
+
+
+class Case(NamedTuple):
+    """A function to time, called with one query at a time."""
+
+    name: str
+    scorer: str
+    options: str
+    # How many strings one call goes through, for the throughput.
+    work: int
+    func: Callable[[str], Any]
+    # The same work done by calling rapidfuzz directly, if there is an equivalent.
+    baseline: Optional[Callable[[str], Any]] = None
+
+
+def strings_cases(corpus: List[str]) -> Iterator[Case]:
+    strings = Strings()
+    methods: Dict[str, Callable[[str], str]] = {
+        "latinise": strings.latinise,
+        "ignore_case": strings.ignore_case,
+        "remove_punctuation": strings.remove_punctuation,
+        "alphanumeric": strings.alphanumeric,
+    }
+
+    def over_corpus(method: Callable[[str], str]) -> Callable[[str], Any]:
+        return lambda _: list(map(method, corpus))
+
+    for name, method in methods.items():
+        yield Case(f"Strings.{name}", "-", "-", len(corpus), over_corpus(method))
+
+    normalizer = Normalizer(latinise=True, remove_punctuation=True, alphanumeric=True)
+    yield Case(
+        "Normalizer.normalize",
+        "-",
+        "all",
+        len(corpus),
+        lambda _: list(map(normalizer.normalize, corpus)),
+    )
+
+
+def distance_cases(corpus: List[str]) -> Iterator[Case]:
+    dist = Distance()
+    yield Case(
+        "Distance.distance_list",
+        "levenshtein",
+        "-",
+        len(corpus),
+        lambda q: dist.distance_list(q, corpus),
+        lambda q: process.cdist([q], corpus, scorer=distance.Levenshtein.distance),
+    )
+
+
+def ratio_cases(corpus: List[str], scorer: str, options: str) -> Iterator[Case]:
+    scorer_class, rapidfuzz_scorer = SCORERS[scorer]
+    ratio = Ratio(scorer=scorer_class, **OPTIONS[options])
+    baseline = None
+
+    if options == "default":
+        # The default settings only lowercase the strings before scoring them.
+        def baseline(q: str) -> Any:
+            return process.cdist(
+                [q], corpus, scorer=rapidfuzz_scorer, processor=str.lower
+            )
+
+    yield Case(
+        "Ratio.ratio_list",
+        scorer,
+        options,
+        len(corpus),
+        lambda q: ratio.ratio_list(q, corpus),
+        baseline,
+    )
+
+
+def match_cases(corpus: List[str], scorer: str, options: str) -> Iterator[Case]:
+    scorer_class, rapidfuzz_scorer = SCORERS[scorer]
+    match = Match(scorer=scorer_class, **OPTIONS[options])
+    baseline = None
+
+    if options == "default":
+
+        def baseline(q: str) -> Any:
+            return process.extract(
+                q,
+                corpus,
+                scorer=rapidfuzz_scorer,
+                processor=str.lower,
+                score_cutoff=(SCORE - 0.5) / 100,
+                limit=LIMIT,
+            )
+
+    yield Case(
+        "Match.get_best_matches",
+        scorer,
+        options,
+        len(corpus),
+        lambda q: match.get_best_matches(q, corpus, score=SCORE, limit=LIMIT),
+        baseline,
+    )
+
+
+def index_cases(corpus: List[str], scorer: str, options: str) -> Iterator[Case]:
+    scorer_class, rapidfuzz_scorer = SCORERS[scorer]
+    match = Match(scorer=scorer_class, **OPTIONS[options])
+
+    yield Case(
+        "Match.index",
+        scorer,
+        options,
+        len(corpus),
+        lambda _: match.index(corpus),
+    )
+
+    index = match.index(corpus)
+    baseline = None
+
+    if options == "default":
+        # The index holds the prepared strings, so rapidfuzz gets them prepared too.
+        prepared = [s.lower() for s in corpus]
+
+        def baseline(q: str) -> Any:
+            return process.extract(
+                q.lower(),
+                prepared,
+                scorer=rapidfuzz_scorer,
+                score_cutoff=(SCORE - 0.5) / 100,
+                limit=LIMIT,
+            )
+
+    yield Case(
+        "MatchIndex.get_best_matches",
+        scorer,
+        options,
+        len(corpus),
+        lambda q: index.get_best_matches(q, score=SCORE, limit=LIMIT),
+        baseline,
+    )
+
+    # The n-gram index only speeds up the LevenshteinScorer without partial matches.
+    if scorer == "levenshtein" and options != "include_partial":
+        ngram_index = match.index(corpus, ngram_size=3)
+        yield Case(
+            "MatchIndex.get_best_matches[ngram]",
+            scorer,
+            options,
+            len(corpus),
+            lambda q: ngram_index.get_best_matches(q, score=SCORE, limit=LIMIT),
+        )
+
+
+def cases(
+    group: str, corpus: List[str], scorers: List[str], options: List[str]
+) -> Iterator[Case]:
+    if group == "Strings":
+        yield from strings_cases(corpus)
+    elif group == "Distance":
+        yield from distance_cases(corpus)
+    else:
+        factory = {
+            "Ratio": ratio_cases,
+            "Match": match_cases,
+            "MatchIndex": index_cases,
+        }
+        for scorer in scorers:
+            for option in options:
+                yield from factory[group](corpus, scorer, option)
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    # The nearest-rank percentile, there are not always enough calls to interpolate.
+    index = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(
+    func: Callable[[str], Any], query_list: List[str], min_time: float, max_calls: int
+) -> Dict[str, float]:
+    """Calls the function with the queries in turn, until it ran for `min_time` seconds
+    or `max_calls` times, and returns the latency in milliseconds."""
+    # The first call is not counted, it fills the caches and imports things lazily.
+    func(query_list[0])
+
+    latencies: List[float] = []
+    total = 0.0
+
+    while total < min_time and len(latencies) < max_calls:
+        query = query_list[len(latencies) % len(query_list)]
+        start = time.perf_counter()
+        func(query)
+        latencies.append(time.perf_counter() - start)
+        total += latencies[-1]
+
+    latencies.sort()
+
+    return {
+        "calls": len(latencies),
+        "mean_ms": total / len(latencies) * 1000,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p90_ms": percentile(latencies, 90) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def metadata(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "stringmatch": stringmatch.__version__,
+        # mypyc compiles the modules to extensions, the pure Python version is a lot slower.
+        "compiled": not stringmatch.match.__file__.endswith(".py"),
+        "rapidfuzz": rapidfuzz.__version__,
+        "arguments": vars(args),
+    }
+
+
+def key(result: Dict[str, Any]) -> str:
+    return "/".join(
+        str(result[k]) for k in ["name", "corpus", "size", "scorer", "options"]
+    )
+
+
+def describe(result: Dict[str, Any]) -> str:
+    line = (
+        f"{result['name']:<35} {result['corpus']:<10} {result['size']:>8} "
+        f"{result['scorer']:<12} {result['options']:<18} "
+        f"p50 {result['p50_ms']:>10.3f} ms  p99 {result['p99_ms']:>10.3f} ms  "
+        f"{result['strings_per_second']:>14,.0f} strings/s"
+    )
+    if "overhead" in result:
+        line += f"  x{result['overhead']:.2f} of rapidfuzz"
+    return line
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+
+    for corpus_name in args.corpora:
+        for size in args.sizes:
+            corpus = CORPORA[corpus_name](size, args.seed)
+            query_list = queries(corpus, args.queries, args.seed + 1)
+
+            for group in args.groups:
+                for case in cases(group, corpus, args.scorers, args.options):
+                    if args.filter and args.filter not in case.name:
+                        continue
+
+                    result: Dict[str, Any] = {
+                        "name": case.name,
+                        "corpus": corpus_name,
+                        "size": size,
+                        "scorer": case.scorer,
+                        "options": case.options,
+                        **measure(case.func, query_list, args.min_time, args.max_calls),
+                    }
+                    result["strings_per_second"] = case.work / result["mean_ms"] * 1000
+
+                    if case.baseline is not None:
+                        baseline = measure(
+                            case.baseline, query_list, args.min_time, args.max_calls
+                        )
+                        result["baseline_mean_ms"] = baseline["mean_ms"]
+                        result["overhead"] = result["mean_ms"] / baseline["mean_ms"]
+
+                    print(describe(result), flush=True)
+                    results.append(result)
+
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]], path: str, threshold: float
+) -> List[Dict[str, Any]]:
+    """Prints how every benchmark changed compared to an earlier run,
+    and returns the ones that got slower by more than the threshold."""
+    with open(path, encoding="utf-8") as f:
+        previous = {key(r): r for r in json.load(f)["results"]}
+
+    regressions = []
+    print(f"\nCompared to {path}:")
+
+    for result in results:
+        old = previous.get(key(result))
+        if old is None:
+            continue
+
+        change = result["mean_ms"] / old["mean_ms"] - 1
+        marker = ""
+        if change > threshold:
+            marker = "  REGRESSION"
+            regressions.append(result)
+        elif change < -threshold:
+            marker = "  improvement"
+
+        print(f"{key(result):<90} {change:>+8.1%}{marker}")
+
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    def names(choices: List[str]) -> Callable[[str], List[str]]:
+        def parse(value: str) -> List[str]:
+            values = value.split(",")
+            for v in values:
+                if v not in choices:
+                    raise argparse.ArgumentTypeError(
+                        f"{v!r} is not one of {', '.join(choices)}"
+                    )
+            return values
+
+        return parse
+
+    parser = argparse.ArgumentParser(description="The benchmark suite of stringmatch.")
+    parser.add_argument(
+        "--sizes",
+        type=lambda v: [int(s) for s in v.split(",")],
+        default=[10, 100, 1000, 10000],
+        help="The sizes of the corpora, comma separated (default: 10,100,1000,10000).",
+    )
+    parser.add_argument("--corpora", type=names(list(CORPORA)), default=list(CORPORA))
+    parser.add_argument("--groups", type=names(GROUPS), default=GROUPS)
+    parser.add_argument("--scorers", type=names(list(SCORERS)), default=list(SCORERS))
+    parser.add_argument("--options", type=names(list(OPTIONS)), default=list(OPTIONS))
+    parser.add_argument(
+        "--filter", default="", help="Only run benchmarks with this in their name."
+    )
+    parser.add_argument(
+        "--queries", type=int, default=20, help="How many queries to cycle through."
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="How many seconds to time every benchmark for, at least one call.",
+    )
+    parser.add_argument(
+        "--max-calls", type=int, default=1000, help="The most calls per benchmark."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="The JSON file to save the results in.")
+    parser.add_argument(
+        "--compare", help="A JSON file of an earlier run to compare to."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="How much slower a benchmark can get before it counts as a regression (default: 0.1).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    info = metadata(args)
+
+    print(
+        f"stringmatch {info['stringmatch']} ({'compiled' if info['compiled'] else 'pure Python'}), "
+        f"rapidfuzz {info['rapidfuzz']}, Python {info['python']} on {info['machine']}\n"
+    )
+
+    results = run(args)
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps({"metadata": info, "results": results}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print(f"\nSaved {len(results)} results to {args.output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(
+                f"\n{len(regressions)} benchmarks got slower by more than {args.threshold:.0%}."
+            )
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+# Times how long importing stringmatch takes in a fresh interpreter,
+# which is what command line tools and serverless functions pay on every start.
+#
+# Run it from the root of the repository:
+#   python benchmarks/startup.py --output startup.json
+#   python benchmarks/startup.py --compare startup.json
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+STATEMENTS = {
+    "import stringmatch": "import stringmatch",
+    "Distance": "from stringmatch import Distance",
+    "Match": "from stringmatch import Match",
+    "AsyncMatch": "from stringmatch import AsyncMatch",
+    "warmup": "import stringmatch; stringmatch.warmup()",
+}
+
+# Prints how long the statement takes, measured inside the new interpreter,
+# so the time it takes to start Python itself is not included.
+TEMPLATE = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str, runs: int) -> Dict[str, float]:
+    times: List[float] = []
+
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TEMPLATE.format(statement=statement)],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        times.append(float(output) * 1000)
+
+    return {"median_ms": statistics.median(times), "min_ms": min(times)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Times importing stringmatch.")
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--output", help="The JSON file to save the results in.")
+    parser.add_argument(
+        "--compare", help="A JSON file of an earlier run to compare to."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="How much slower an import can get before it counts as a regression (default: 0.2).",
+    )
+    args = parser.parse_args(argv)
+
+    results = {name: measure(s, args.runs) for name, s in STATEMENTS.items()}
+
+    for name, result in results.items():
+        print(
+            f"{name:<20} median {result['median_ms']:>8.2f} ms  min {result['min_ms']:>8.2f} ms"
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.compare:
+        previous = json.loads(Path(args.compare).read_text())
+        # The fastest run is the least noisy, so that is what gets compared.
+        regressions = [
+            name
+            for name, result in results.items()
+            if name in previous
+            and result["min_ms"] > previous[name]["min_ms"] * (1 + args.threshold)
+        ]
+        for name in regressions:
+            print(
+                f"REGRESSION: {name} went from {previous[name]['min_ms']:.2f} ms "
+                f"to {results[name]['min_ms']:.2f} ms"
+            )
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
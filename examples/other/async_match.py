@@ -0,0 +1,47 @@
+# This shows you how to match strings inside of an asyncio application, like a web service or a bot.
+
+import asyncio
+import random
+import string
+
+from stringmatch import AsyncMatch
+
+
+async def heartbeat():
+    # Keeps printing while the search is running, the event loop is never blocked for long.
+    while True:
+        print("Still responsive!")
+        await asyncio.sleep(0.05)
+
+
+async def main():
+    # Uses the same keyword arguments as the Match class.
+    # The strings get scored in the default executor, 1024 at a time.
+    async_match = AsyncMatch(latinise=True, chunk_size=1024)
+
+    choices = [
+        "".join(random.choice(string.ascii_lowercase) for _ in range(15))
+        for _ in range(500_000)
+    ]
+
+    task = asyncio.create_task(heartbeat())
+
+    # Same as Match.get_best_matches, but awaited.
+    # The list of choices could also be an async iterable, like rows streaming in from a database.
+    matches = await async_match.get_best_matches("stringmatchlib", choices, score=60)
+    print(matches)
+
+    # Searches can be cancelled, for example with a timeout.
+    try:
+        await asyncio.wait_for(
+            async_match.get_best_matches("stringmatchlib", choices, score=60),
+            timeout=0.01,
+        )
+    except asyncio.TimeoutError:
+        print("The search took too long and got cancelled.")
+
+    task.cancel()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+# This is a basic benchmark of the Normalizer class,
+# compared to calling the functions of the Strings class one after another,
+# which is how the strings were modified before the Normalizer class was added.
+
+import timeit
+
+from stringmatch import Normalizer, Strings
+
+strings = [
+    "A string",
+    "Some other Strings",
+    "「 Tournament Official 」",
+    "Like a really, really, really damn long string",
+    "Héllö, world!",
+    "ジャパニーズ",
+    "...Hello!!!",
+    "What? À special word!",
+]
+
+normalizer = Normalizer(latinise=True, remove_punctuation=True, alphanumeric=True)
+
+
+def strings_benchmark():
+    results = []
+    for s in strings:
+        s = Strings().latinise(s)
+        s = Strings().ignore_case(s)
+        s = Strings().remove_punctuation(s)
+        s = Strings().alphanumeric(s)
+        results.append(s)
+    return results
+
+
+def old_strings_benchmark():
+    # The character by character implementation the Strings class used before.
+    results = []
+    for s in strings:
+        s = Strings().latinise(s)
+        s = Strings().ignore_case(s)
+        s = "".join(c for c in s if c not in "!\"#'()*+,-./:;<=>?[]^_`{|}~’„“»«")
+        s = "".join(
+            c
+            for c in s
+            if c in "1234567890abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ "
+        )
+        results.append(s)
+    return results
+
+
+def normalizer_benchmark():
+    return [normalizer.normalize(s) for s in strings]
+
+
+def main():
+    assert normalizer_benchmark() == strings_benchmark() == old_strings_benchmark()
+
+    for name in ["normalizer", "strings", "old_strings"]:
+        t = timeit.timeit(
+            f"{name}_benchmark()",
+            setup=f"from __main__ import {name}_benchmark",
+            number=20000,
+        )
+        print(f"{name} time: {round(t, 3)}s")
+
+    # The results on my PC:
+    # normalizer time: 0.56s
+    # strings time: 0.671s
+    # old_strings time: 0.954s
+
+
+if __name__ == "__main__":
+    main()
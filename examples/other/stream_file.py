@@ -0,0 +1,29 @@
+# This shows you how to search through a file that is too large to load into memory.
+
+from stringmatch import Match
+
+
+def main():
+    match = Match(ignore_case=True, remove_punctuation=True)
+
+    # Writing an example file, imagine this having a couple billion lines instead.
+    with open("names.txt", "w", encoding="utf-8") as f:
+        f.write("\n".join(["Jonathan", "Johnathan", "Jon", "Jonas", "Nathan"] * 1000))
+
+    with open("names.txt", "r", encoding="utf-8") as f:
+        lines = (line.rstrip("\n") for line in f)
+
+        # Yields every match as soon as it is found, together with its line number.
+        for line_number, name, score in match.iter_matches("jonathan", lines, score=90):
+            print(line_number, name, score)
+            break
+
+    with open("names.txt", "r", encoding="utf-8") as f:
+        lines = (line.rstrip("\n") for line in f)
+
+        # Only the 3 best matches are kept in memory while reading the file.
+        print(match.stream_best_matches("jonathan", lines, limit=3))
+
+
+if __name__ == "__main__":
+    main()
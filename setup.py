@@ -17,10 +17,12 @@ readme = ""
 with open("README.md", "r", encoding="utf-8") as f:
     readme = f.read()
 
+# The __init__ file imports the other modules lazily with a module __getattr__,
+# which does not work in compiled modules, so it stays a normal Python module.
 all_files = [
     f"stringmatch/{file}"
     for file in os.listdir("./stringmatch")
-    if file.endswith(".py")
+    if file.endswith(".py") and file != "__init__.py"
 ]
 
 # We can append mypy flags to the list of files.
@@ -1,23 +1,101 @@
-from stringmatch.distance import Distance
-from stringmatch.match import Match
-from stringmatch.ratio import Ratio
-from stringmatch.scorer import (
-    BaseScorer,
-    JaroScorer,
-    JaroWinklerScorer,
-    LevenshteinScorer,
-)
-from stringmatch.strings import Strings
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from stringmatch.asyncmatch import AsyncMatch
+    from stringmatch.asyncratio import AsyncRatio
+    from stringmatch.bktree import BKTree
+    from stringmatch.cache import LRUCache
+    from stringmatch.distance import Distance
+    from stringmatch.index import MatchIndex
+    from stringmatch.match import Match
+    from stringmatch.mutable import MutableMatchIndex
+    from stringmatch.ratio import Ratio
+    from stringmatch.scorer import (
+        BaseScorer,
+        JaroScorer,
+        JaroWinklerScorer,
+        LevenshteinScorer,
+    )
+    from stringmatch.sharded import ShardedMatchIndex
+    from stringmatch.stats import Stats
+    from stringmatch.strings import Normalizer, Strings
 
 __title__ = "stringmatch"
 __version__ = "0.14.8"
 __all__ = (
     "Distance",
     "Match",
+    "MatchIndex",
+    "MutableMatchIndex",
+    "ShardedMatchIndex",
     "Ratio",
     "BaseScorer",
     "JaroScorer",
     "JaroWinklerScorer",
     "LevenshteinScorer",
     "Strings",
+    "Normalizer",
+    "LRUCache",
+    "BKTree",
+    "AsyncMatch",
+    "AsyncRatio",
+    "Stats",
+    "warmup",
 )
+
+# The module of every class, they only get imported once they are first used,
+# so importing the package stays fast, and asyncio is only imported if you use the async classes.
+_MODULES: Dict[str, str] = {
+    "Distance": "stringmatch.distance",
+    "Match": "stringmatch.match",
+    "MatchIndex": "stringmatch.index",
+    "MutableMatchIndex": "stringmatch.mutable",
+    "ShardedMatchIndex": "stringmatch.sharded",
+    "Ratio": "stringmatch.ratio",
+    "BaseScorer": "stringmatch.scorer",
+    "JaroScorer": "stringmatch.scorer",
+    "JaroWinklerScorer": "stringmatch.scorer",
+    "LevenshteinScorer": "stringmatch.scorer",
+    "Strings": "stringmatch.strings",
+    "Normalizer": "stringmatch.strings",
+    "LRUCache": "stringmatch.cache",
+    "BKTree": "stringmatch.bktree",
+    "AsyncMatch": "stringmatch.asyncmatch",
+    "AsyncRatio": "stringmatch.asyncratio",
+    "Stats": "stringmatch.stats",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value: Any = getattr(import_module(_MODULES[name]), name)
+    # The next lookup finds it directly, without calling this again.
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def warmup() -> None:
+    """Imports everything the library needs ahead of time, which it otherwise does on first use.
+    Call this while your application starts up, so the first match does not have to wait for it.
+
+    Examples
+    --------
+    >>> import stringmatch
+    >>> stringmatch.warmup()
+    """
+    for name in _MODULES:
+        __getattr__(name)
+
+    # Only used for saving and loading an index.
+    import_module("stringmatch.indexfile")
+
+    # Latinising a string imports unidecode, and loads the table of the characters in it.
+    import_module("stringmatch.strings").Strings().latinise("à")
@@ -0,0 +1,517 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from stringmatch.asyncratio import _ASYNC_CHUNK_SIZE, _iterate, _read_chunk
+from stringmatch.cache import LRUCache
+from stringmatch.match import Match, _BestMatches
+from stringmatch.ratio import Ratio
+from stringmatch.scorer import BaseScorer, LevenshteinScorer
+from stringmatch.stats import Stats
+
+R = TypeVar("R")
+
+
+class AsyncMatch:
+    """Contains coroutines for comparing and matching strings, without blocking the event loop."""
+
+    def __init__(
+        self,
+        *,
+        scorer: Type[BaseScorer] = LevenshteinScorer,
+        latinise: bool = False,
+        ignore_case: bool = True,
+        remove_punctuation: bool = False,
+        alphanumeric: bool = False,
+        include_partial: bool = False,
+        cache_size: int = 0,
+        stats: Optional[Stats] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = _ASYNC_CHUNK_SIZE,
+    ) -> None:
+        """Initialise the AsyncMatch class with the given parameters.
+        The scoring runs in an executor, one chunk of strings at a time,
+        so the event loop can do other work in between, and searches can be cancelled between chunks.
+
+        Parameters
+        ----------
+        scorer : Type[BaseScorer], optional
+            The scoring algorithm to use, by default LevenshteinScorer
+            Available scorers: LevenshteinScorer, JaroScorer, JaroWinklerScorer.
+        latinise : bool, optional
+            If special unicode characters should be removed from the strings, by default False.
+        ignore_case : bool, optional
+            If the strings should be compared ignoring case, by default True.
+        remove_punctuation : bool, optional
+            If punctuation should be removed from the strings, by default False.
+        alphanumeric : bool, optional
+            If the strings should only be compared by their latin letters, by default False.
+        include_partial : bool, optional
+            If partial substring matches should be included, by default False.
+        cache_size : int, optional
+            How many results of latinising strings to cache, by default 0 (no caching).
+            The cache is available as the `cache` attribute, with its hits, misses and evictions.
+        stats : Optional[Stats], optional
+            Counts what gets done and times every stage, by default None (nothing gets counted).
+        executor : Optional[Executor], optional
+            The executor to score the strings in, by default None (the default executor of the event loop).
+        chunk_size : int, optional
+            How many strings get scored at once, by default 1024.
+
+        Returns
+        -------
+        AsyncMatch
+            The AsyncMatch class.
+
+        Examples
+        --------
+        >>> AsyncMatch(latinise=True, executor=ThreadPoolExecutor(max_workers=2))
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size has to be at least 1.")
+
+        self._match: Match = Match(
+            scorer=scorer,
+            latinise=latinise,
+            ignore_case=ignore_case,
+            remove_punctuation=remove_punctuation,
+            alphanumeric=alphanumeric,
+            include_partial=include_partial,
+            cache_size=cache_size,
+            stats=stats,
+        )
+        self.executor: Optional[Executor] = executor
+        self.chunk_size: int = chunk_size
+
+    @property
+    def cache(self) -> Optional[LRUCache[str, str]]:
+        """The cache of latinised strings, or None if there is no cache.
+
+        Returns
+        -------
+        Optional[LRUCache[str, str]]
+            The cache.
+        """
+        return self._match.cache
+
+    @property
+    def stats(self) -> Optional[Stats]:
+        """The stats of what gets done, or None if nothing gets counted.
+
+        Returns
+        -------
+        Optional[Stats]
+            The stats.
+        """
+        return self._match.stats
+
+    @property
+    def pruned(self) -> int:
+        """How many strings were skipped while searching, because they could not reach the cutoff score.
+
+        Returns
+        -------
+        int
+            The number of skipped strings.
+        """
+        return self._match.pruned
+
+    async def _run(self, func: Callable[[], R]) -> R:
+        """Runs the function in the executor.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        func : Callable[[], R]
+            The function to run.
+
+        Returns
+        -------
+        R
+            The result of the function.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func)
+
+    def _searches(
+        self, strings: List[str], score: int, limit: Optional[int]
+    ) -> List[_BestMatches]:
+        """Prepares the strings to search for, runs in the executor.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to search for.
+        score : int
+            The cutoff for the score.
+        limit : Optional[int]
+            The number of matches to keep for every string, or None for every match.
+
+        Returns
+        -------
+        List[_BestMatches]
+            The best matches of every string, none found yet.
+        """
+        ratio: Ratio = self._match._get_ratio()
+
+        return [
+            _BestMatches(ratio, string, score=score, limit=limit) for string in strings
+        ]
+
+    def _score_chunk(
+        self, bests: List[_BestMatches], position: int, chunk: List[str]
+    ) -> None:
+        """Scores a chunk of strings for every search, and counts the strings that were skipped.
+        Runs in the executor, so the count is only updated once the whole chunk is done,
+        even if the search got cancelled in the meantime.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        bests : List[_BestMatches]
+            The best matches of every search.
+        position : int
+            The position of the first string of the chunk.
+        chunk : List[str]
+            The strings to score.
+        """
+        # With more than one search, the chunk only gets prepared once for all of them.
+        prepared_chunk: Optional[List[Optional[str]]] = (
+            self._match._get_ratio()._prepare_list(chunk) if len(bests) > 1 else None
+        )
+        positions: range = range(position, position + len(chunk))
+        pruned: int = 0
+
+        for best in bests:
+            before: int = best.pruned
+            best.add_chunk(positions, chunk, prepared_chunk)
+            pruned += best.pruned - before
+
+        self._match._count_pruned(pruned)
+
+    async def _search(
+        self,
+        strings: List[str],
+        string_list: Union[Iterable[str], AsyncIterable[str]],
+        score: int,
+        limit: Optional[int],
+    ) -> List[List[Tuple[str, int]]]:
+        """Matches every string to the strings, reading and scoring them one chunk at a time.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to search for.
+        string_list : Union[Iterable[str], AsyncIterable[str]]
+            The strings to compare to, can also be an asynchronous iterable.
+        score : int
+            The cutoff for the score.
+        limit : Optional[int]
+            The number of matches to return for every string, 0 (or less than 0) or None returns every match.
+
+        Returns
+        -------
+        List[List[Tuple[str, int]]]
+            The matches found and their score for every string, in order of the strings.
+        """
+        if not strings:
+            return []
+
+        if limit is not None and limit < 1:
+            limit = None
+
+        bests: List[_BestMatches] = await self._run(
+            partial(self._searches, strings, score, limit)
+        )
+        iterator: Union[Iterator[str], AsyncIterator[str]] = _iterate(string_list)
+        position: int = 0
+
+        # Every chunk gets scored as soon as it was read.
+        while chunk := await _read_chunk(iterator, self.chunk_size):
+            await self._run(partial(self._score_chunk, bests, position, chunk))
+            position += len(chunk)
+
+        return [best.result() for best in bests]
+
+    async def match(self, string1: str, string2: str, *, score: int = 70) -> bool:
+        """Matches two strings, returns True if they are similar enough.
+
+        Parameters
+        ----------
+        string1 : str
+            The first string to compare.
+        string2 : str
+            The second string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        bool
+            If the strings are similar enough.
+
+        Examples
+        --------
+        >>> await match("stringmatch", "strmatch")
+        True
+        """
+        return await self._run(lambda: self._match.match(string1, string2, score=score))
+
+    async def match_with_ratio(
+        self, string1: str, string2: str, *, score: int = 70
+    ) -> Tuple[bool, int]:
+        """Same as match, but returns the boolean in a tuple, together with the score.
+
+        Parameters
+        ----------
+        string1 : str
+            The first string to compare.
+        string2 : str
+            The second string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        Tuple[bool, int]
+            If the strings are similar and their score.
+
+        Examples
+        --------
+        >>> await match_with_ratio("stringmatch", "strmatch")
+        (True, 84)
+        """
+        return await self._run(
+            lambda: self._match.match_with_ratio(string1, string2, score=score)
+        )
+
+    async def get_best_match(
+        self,
+        string: str,
+        string_list: Union[Iterable[str], AsyncIterable[str]],
+        *,
+        score: int = 70,
+    ) -> Optional[str]:
+        """Returns the best match from a list of strings.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_list : Union[Iterable[str], AsyncIterable[str]]
+            The strings to compare to, can also be an asynchronous iterable.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        Optional[str]
+            The best string found, or None if no good match was found.
+
+        Examples
+        --------
+        >>> await get_best_match("stringmatch", ["strmatch", "test", "something else"])
+        'strmatch'
+        """
+        match: Optional[Tuple[str, int]] = await self.get_best_match_with_ratio(
+            string, string_list, score=score
+        )
+
+        return match[0] if match else None
+
+    async def get_best_match_with_ratio(
+        self,
+        string: str,
+        string_list: Union[Iterable[str], AsyncIterable[str]],
+        *,
+        score: int = 70,
+    ) -> Optional[Tuple[str, int]]:
+        """Same as get_best_match, but returns a tuple with the best match and its score.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_list : Union[Iterable[str], AsyncIterable[str]]
+            The strings to compare to, can also be an asynchronous iterable.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        Optional[Tuple[str, int]]
+            The best string and its score found, or None if no good match was found.
+
+        Examples
+        --------
+        >>> await get_best_match_with_ratio("stringmatch", ["strmatch", "test", "something else"])
+        ('strmatch', 84)
+        """
+        matches: List[Tuple[str, int]] = await self.get_best_matches_with_ratio(
+            string, string_list, score=score, limit=1
+        )
+
+        return matches[0] if matches else None
+
+    async def get_best_matches(
+        self,
+        string: str,
+        string_list: Union[Iterable[str], AsyncIterable[str]],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+    ) -> List[str]:
+        """Matches a string to a list of strings, returns the strings found that are similar.
+        If there are more than `limit` matches,
+        only the `limit` best matches are returned, sorted by score.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_list : Union[Iterable[str], AsyncIterable[str]]
+            The strings to compare to, can also be an asynchronous iterable.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[str]
+            All of the matches found.
+
+        Examples
+        --------
+        >>> await get_best_matches("stringmatch", ["strmatch", "stringmatch", "test", "something else"])
+        ['stringmatch', 'strmatch']
+        """
+        return [
+            m[0]
+            for m in await self.get_best_matches_with_ratio(
+                string, string_list, score=score, limit=limit
+            )
+        ]
+
+    async def get_best_matches_with_ratio(
+        self,
+        string: str,
+        string_list: Union[Iterable[str], AsyncIterable[str]],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+    ) -> List[Tuple[str, int]]:
+        """Same as get_best_matches, but returns a list of tuples with the best matches and their score.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_list : Union[Iterable[str], AsyncIterable[str]]
+            The strings to compare to, can also be an asynchronous iterable.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            All of the matches found.
+
+        Examples
+        --------
+        >>> await get_best_matches_with_ratio("stringmatch", ["strmatch", "stringmatch", "test", "something else"])
+        [('stringmatch', 100), ('strmatch', 84)]
+        """
+        return (await self._search([string], string_list, score, limit))[0]
+
+    async def get_best_matches_many(
+        self,
+        strings: List[str],
+        string_list: Union[Iterable[str], AsyncIterable[str]],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+    ) -> List[List[str]]:
+        """Same as get_best_matches, but for many strings at once.
+        The list of strings only gets prepared once.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        string_list : Union[Iterable[str], AsyncIterable[str]]
+            The strings to compare to, can also be an asynchronous iterable.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[List[str]]
+            The matches found for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> await get_best_matches_many(["stringmatch", "tset"], ["strmatch", "test", "something else"])
+        [['strmatch'], ['test']]
+        """
+        return [
+            [m[0] for m in matches]
+            for matches in await self.get_best_matches_many_with_ratio(
+                strings, string_list, score=score, limit=limit
+            )
+        ]
+
+    async def get_best_matches_many_with_ratio(
+        self,
+        strings: List[str],
+        string_list: Union[Iterable[str], AsyncIterable[str]],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+    ) -> List[List[Tuple[str, int]]]:
+        """Same as get_best_matches_many, but returns lists of tuples with the best matches and their score.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        string_list : Union[Iterable[str], AsyncIterable[str]]
+            The strings to compare to, can also be an asynchronous iterable.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[List[Tuple[str, int]]]
+            The matches found and their score for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> await get_best_matches_many_with_ratio(["stringmatch", "tset"], ["strmatch", "test", "something else"])
+        [[('strmatch', 84)], [('test', 75)]]
+        """
+        return await self._search(strings, string_list, score, limit)
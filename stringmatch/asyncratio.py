@@ -0,0 +1,389 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from stringmatch.cache import LRUCache
+from stringmatch.ratio import Ratio
+from stringmatch.scorer import BaseScorer, LevenshteinScorer
+from stringmatch.stats import Stats
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# How many strings get scored in the executor at once, before the event loop gets control back.
+_ASYNC_CHUNK_SIZE: int = 1024
+
+
+def _iterate(
+    choices: Union[Iterable[T], AsyncIterable[T]],
+) -> Union[Iterator[T], AsyncIterator[T]]:
+    """Returns an iterator over a normal or an asynchronous iterable.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    choices : Union[Iterable[T], AsyncIterable[T]]
+        The iterable to iterate over.
+
+    Returns
+    -------
+    Union[Iterator[T], AsyncIterator[T]]
+        The iterator of the iterable.
+    """
+    if isinstance(choices, AsyncIterable):
+        return choices.__aiter__()
+
+    return iter(choices)
+
+
+async def _read_chunk(
+    iterator: Union[Iterator[T], AsyncIterator[T]], size: int
+) -> List[T]:
+    """Reads up to `size` items from a normal or an asynchronous iterator.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    iterator : Union[Iterator[T], AsyncIterator[T]]
+        The iterator to read from.
+    size : int
+        The maximum number of items to read.
+
+    Returns
+    -------
+    List[T]
+        The items read, empty once the iterator is exhausted.
+    """
+    chunk: List[T] = []
+
+    # Breaking out of the loop does not close the iterator, the next chunk continues where this one stopped.
+    if isinstance(iterator, AsyncIterator):
+        async for item in iterator:
+            chunk.append(item)
+            if len(chunk) >= size:
+                break
+    else:
+        for item in iterator:
+            chunk.append(item)
+            if len(chunk) >= size:
+                break
+
+    return chunk
+
+
+class AsyncRatio:
+    """Contains coroutines for calculating the ratio of similarity between two strings,
+    without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        scorer: Type[BaseScorer] = LevenshteinScorer,
+        latinise: bool = False,
+        ignore_case: bool = True,
+        remove_punctuation: bool = False,
+        alphanumeric: bool = False,
+        include_partial: bool = False,
+        cache_size: int = 0,
+        stats: Optional[Stats] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = _ASYNC_CHUNK_SIZE,
+    ) -> None:
+        """Initialise the AsyncRatio class with the correct parameters.
+        The scoring runs in an executor, one chunk of strings at a time,
+        so the event loop can do other work in between, and searches can be cancelled between chunks.
+
+        Parameters
+        ----------
+        scorer : Type[BaseScorer], optional
+            The scoring algorithm to use, by default LevenshteinScorer
+            Available scorers: LevenshteinScorer, JaroScorer, JaroWinklerScorer.
+        latinise : bool, optional
+            If special unicode characters should be removed from the strings, by default False.
+        ignore_case : bool, optional
+            If the strings should be compared ignoring case, by default True.
+        remove_punctuation : bool, optional
+            If punctuation should be removed from the strings, by default False.
+        alphanumeric : bool, optional
+            If the strings should only be compared by their latin letters, by default False.
+        include_partial : bool, optional
+            If partial substring matches should be included, by default False.
+        cache_size : int, optional
+            How many results of latinising strings to cache, by default 0 (no caching).
+            The cache is available as the `cache` attribute, with its hits, misses and evictions.
+        stats : Optional[Stats], optional
+            Counts what gets done and times every stage, by default None (nothing gets counted).
+        executor : Optional[Executor], optional
+            The executor to score the strings in, by default None (the default executor of the event loop).
+        chunk_size : int, optional
+            How many strings get scored at once, by default 1024.
+
+        Returns
+        -------
+        AsyncRatio
+            The AsyncRatio class.
+
+        Examples
+        --------
+        >>> AsyncRatio(latinise=True, executor=ThreadPoolExecutor(max_workers=2))
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size has to be at least 1.")
+
+        self._ratio: Ratio = Ratio(
+            scorer=scorer,
+            latinise=latinise,
+            ignore_case=ignore_case,
+            remove_punctuation=remove_punctuation,
+            alphanumeric=alphanumeric,
+            include_partial=include_partial,
+            cache_size=cache_size,
+            stats=stats,
+        )
+        self.executor: Optional[Executor] = executor
+        self.chunk_size: int = chunk_size
+
+    @property
+    def cache(self) -> Optional[LRUCache[str, str]]:
+        """The cache of latinised strings, or None if there is no cache.
+
+        Returns
+        -------
+        Optional[LRUCache[str, str]]
+            The cache.
+        """
+        return self._ratio.cache
+
+    @property
+    def stats(self) -> Optional[Stats]:
+        """The stats of what gets done, or None if nothing gets counted.
+
+        Returns
+        -------
+        Optional[Stats]
+            The stats.
+        """
+        return self._ratio.stats
+
+    async def _run(self, func: Callable[[], R]) -> R:
+        """Runs the function in the executor.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        func : Callable[[], R]
+            The function to run.
+
+        Returns
+        -------
+        R
+            The result of the function.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func)
+
+    def _prepare_chunk(self, chunk: List[str]) -> List[Optional[str]]:
+        """Prepares a chunk of strings, with None for non-strings.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        chunk : List[str]
+            The strings to prepare.
+
+        Returns
+        -------
+        List[Optional[str]]
+            The prepared strings.
+        """
+        return self._ratio._prepare_list(chunk)
+
+    def _prepared_ratio_chunk(
+        self, prepared_string: Optional[str], chunk: List[str]
+    ) -> List[int]:
+        """Prepares a chunk of strings and scores them against the prepared string.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        prepared_string : Optional[str]
+            The prepared string, or None if the string is not a string.
+        chunk : List[str]
+            The strings to score.
+
+        Returns
+        -------
+        List[int]
+            The scores between 0 and 100.
+        """
+        if prepared_string is None:
+            return [0] * len(chunk)
+
+        return self._ratio._prepared_ratio_list(
+            prepared_string, self._prepare_chunk(chunk)
+        )
+
+    async def ratio(self, string1: str, string2: str, *, score_cutoff: int = 0) -> int:
+        """Returns the similarity score between two strings.
+
+        Parameters
+        ----------
+        string1 : str
+            The first string to compare.
+        string2 : str
+            The second string to compare.
+        score_cutoff : int, optional
+            Scores below this cutoff may be returned as 0 instead, by default 0.
+
+        Returns
+        -------
+        int
+            The score between 0 and 100.
+
+        Examples
+        --------
+        >>> await ratio("stringmatch", "strmatch")
+        84
+        """
+        return await self._run(
+            lambda: self._ratio.ratio(string1, string2, score_cutoff=score_cutoff)
+        )
+
+    async def ratio_list(
+        self, string: str, string_list: Union[Iterable[str], AsyncIterable[str]]
+    ) -> List[int]:
+        """Returns the similarity score between a string and a list of strings.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_list : Union[Iterable[str], AsyncIterable[str]]
+            The strings to compare to, can also be an asynchronous iterable.
+
+        Returns
+        -------
+        List[int]
+            The scores between 0 and 100, in order of the strings.
+
+        Examples
+        --------
+        >>> await ratio_list("stringmatch", ["strmatch", "something completely different"])
+        [84, 34]
+        """
+        prepared_string: Optional[str] = (
+            await self._run(lambda: self._ratio._prepare_string(string))
+            if isinstance(string, str)
+            else None
+        )
+
+        scores: List[int] = []
+        iterator: Union[Iterator[str], AsyncIterator[str]] = _iterate(string_list)
+
+        while chunk := await _read_chunk(iterator, self.chunk_size):
+            scores.extend(
+                await self._run(
+                    partial(self._prepared_ratio_chunk, prepared_string, chunk)
+                )
+            )
+
+        return scores
+
+    async def ratio_matrix(
+        self, strings: List[str], string_list: Union[Iterable[str], AsyncIterable[str]]
+    ) -> List[List[int]]:
+        """Returns the similarity score between every string and every string in a list.
+        The list of strings only gets prepared once.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        string_list : Union[Iterable[str], AsyncIterable[str]]
+            The strings to compare to, can also be an asynchronous iterable.
+
+        Returns
+        -------
+        List[List[int]]
+            The scores between 0 and 100, one list for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> await ratio_matrix(["stringmatch", "something"], ["strmatch", "something completely different"])
+        [[84, 34], [47, 46]]
+        """
+        prepared_list: List[Optional[str]] = []
+        iterator: Union[Iterator[str], AsyncIterator[str]] = _iterate(string_list)
+
+        while chunk := await _read_chunk(iterator, self.chunk_size):
+            prepared_list.extend(await self._run(partial(self._prepare_chunk, chunk)))
+
+        matrix: List[List[int]] = []
+
+        for string in strings:
+            if not isinstance(string, str):
+                matrix.append([0] * len(prepared_list))
+                continue
+
+            prepared_string: str = await self._run(
+                partial(self._ratio._prepare_string, string)
+            )
+            row: List[int] = []
+
+            for start in range(0, len(prepared_list), self.chunk_size):
+                row.extend(
+                    await self._run(
+                        partial(
+                            self._ratio._prepared_ratio_list,
+                            prepared_string,
+                            prepared_list[start : start + self.chunk_size],
+                        )
+                    )
+                )
+
+            matrix.append(row)
+
+        return matrix
+
+    async def partial_ratio(
+        self, string1: str, string2: str, *, score_cutoff: int = 0
+    ) -> int:
+        """Returns the similarity score between two strings,
+        taking partial matches into account.
+
+        Parameters
+        ----------
+        string1 : str
+            The first string to compare.
+        string2 : str
+            The second string to compare.
+        score_cutoff : int, optional
+            Scores below this cutoff may be returned as 0 instead, by default 0.
+
+        Returns
+        -------
+        int
+            The score between 0 and 100.
+
+        Examples
+        --------
+        >>> await partial_ratio("test", "This is a test!")
+        75
+        """
+        return await self._run(
+            lambda: self._ratio.partial_ratio(
+                string1, string2, score_cutoff=score_cutoff
+            )
+        )
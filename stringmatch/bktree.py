@@ -0,0 +1,200 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from rapidfuzz.distance.Levenshtein import distance
+
+
+class BKTree:
+    """Contains a BK-tree of strings, for finding the strings within a levenshtein distance quickly."""
+
+    def __init__(self, string_list: Optional[List[str]] = None) -> None:
+        """Initialise the BKTree class, adding every string in the list.
+
+        Parameters
+        ----------
+        string_list : Optional[List[str]], optional
+            The strings to add, by default None.
+            Empty strings and non-strings are skipped, since they have no distance.
+
+        Returns
+        -------
+        BKTree
+            The BKTree class.
+
+        Examples
+        --------
+        >>> BKTree(["stringmatch", "strmatch", "something different"])
+        """
+        # Every node is stored by its position in these lists,
+        # the children map the distance to their parent to the position of the child.
+        self._strings: List[str] = []
+        self._children: List[Dict[int, int]] = []
+
+        if string_list is not None:
+            self.add_list(string_list)
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, string: object) -> bool:
+        if not isinstance(string, str) or not string:
+            return False
+
+        return any(s == string for s, _ in self.within(string, 0))
+
+    def add(self, string: str) -> bool:
+        """Adds a string to the tree.
+
+        Parameters
+        ----------
+        string : str
+            The string to add.
+
+        Returns
+        -------
+        bool
+            If the string was added. Empty strings, non-strings and strings
+            that are already in the tree are not added.
+
+        Examples
+        --------
+        >>> add("stringmatch")
+        True
+        >>> add("stringmatch")
+        False
+        """
+        if not isinstance(string, str) or not string:
+            return False
+
+        if not self._strings:
+            self._strings.append(string)
+            self._children.append({})
+            return True
+
+        node: int = 0
+
+        while True:
+            d: int = distance(string, self._strings[node])
+
+            if d == 0:
+                return False
+
+            child: Optional[int] = self._children[node].get(d)
+
+            if child is None:
+                self._children[node][d] = len(self._strings)
+                self._strings.append(string)
+                self._children.append({})
+                return True
+
+            node = child
+
+    def add_list(self, string_list: List[str]) -> int:
+        """Adds every string in a list to the tree.
+
+        Parameters
+        ----------
+        string_list : List[str]
+            The strings to add.
+
+        Returns
+        -------
+        int
+            The number of strings that were added.
+
+        Examples
+        --------
+        >>> add_list(["stringmatch", "strmatch", "stringmatch"])
+        2
+        """
+        return sum(self.add(s) for s in string_list)
+
+    def within(self, string: str, max_distance: int) -> List[Tuple[str, int]]:
+        """Returns every string in the tree within a levenshtein distance of the string.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        max_distance : int
+            The maximum levenshtein distance, inclusive.
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            The strings found and their distance, sorted by distance,
+            then by the order they were added in.
+            Empty if the string is empty or not a string.
+
+        Examples
+        --------
+        >>> within("stringmatch", 3)
+        [('stringmatch', 0), ('strmatch', 3)]
+        """
+        if not isinstance(string, str) or not string or not self._strings:
+            return []
+
+        found: List[Tuple[int, int]] = []
+        nodes: List[int] = [0]
+
+        while nodes:
+            node: int = nodes.pop()
+            d: int = distance(string, self._strings[node])
+
+            if d <= max_distance:
+                found.append((d, node))
+
+            # By the triangle inequality, only children at these distances can be close enough.
+            for child_distance, child in self._children[node].items():
+                if d - max_distance <= child_distance <= d + max_distance:
+                    nodes.append(child)
+
+        return [(self._strings[node], d) for d, node in sorted(found)]
+
+    def nearest(self, string: str, n: int = 1) -> List[Tuple[str, int]]:
+        """Returns the `n` strings in the tree with the lowest levenshtein distance to the string.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        n : int, optional
+            The number of strings to return, by default 1.
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            The strings found and their distance, sorted by distance,
+            then by the order they were added in.
+            Empty if the string is empty or not a string.
+
+        Examples
+        --------
+        >>> nearest("stringmatch", 2)
+        [('stringmatch', 0), ('strmatch', 3)]
+        """
+        if not isinstance(string, str) or not string or not self._strings or n < 1:
+            return []
+
+        # A heap of the best strings so far, the worst one on top.
+        best: List[Tuple[int, int]] = []
+        nodes: List[int] = [0]
+
+        while nodes:
+            node: int = nodes.pop()
+            d: int = distance(string, self._strings[node])
+
+            if len(best) < n:
+                heapq.heappush(best, (-d, -node))
+            elif (-d, -node) > best[0]:
+                heapq.heapreplace(best, (-d, -node))
+
+            # Once we have enough strings, only strings closer than the worst one matter.
+            full: bool = len(best) == n
+            radius: int = -best[0][0]
+
+            for child_distance, child in self._children[node].items():
+                if not full or d - radius <= child_distance <= d + radius:
+                    nodes.append(child)
+
+        return [(self._strings[-node], -d) for d, node in sorted(best, reverse=True)]
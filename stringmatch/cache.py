@@ -0,0 +1,126 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Dict, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """A size-bounded cache, which evicts the least recently used entry when full.
+    Entries can also expire after some time.
+    Keeps count of its hits, misses, evictions and expirations, so you can size it.
+    Safe to use from multiple threads.
+    """
+
+    def __init__(self, maxsize: int, *, ttl: Optional[float] = None) -> None:
+        """Initialise the LRUCache class with the maximum number of entries.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of entries to keep.
+        ttl : Optional[float], optional
+            How many seconds an entry is kept after it was cached, by default None (until it gets evicted).
+
+        Returns
+        -------
+        LRUCache
+            The LRUCache class.
+
+        Examples
+        --------
+        >>> LRUCache(10000)
+        """
+        if maxsize < 1:
+            raise ValueError("The maximum size of the cache has to be at least 1.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("The time to live of the cache has to be more than 0.")
+
+        self.maxsize: int = maxsize
+        self.ttl: Optional[float] = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+        # When every entry expires, only used with a time to live.
+        self._expires: Dict[K, float] = {}
+        self._lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups that were hits, between 0 and 1.
+
+        Returns
+        -------
+        float
+            The hit rate, 0 if there were no lookups yet.
+        """
+        lookups: int = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: K) -> Optional[V]:
+        """Returns the cached value for the key, and marks it as recently used.
+
+        Parameters
+        ----------
+        key : K
+            The key to look up.
+
+        Returns
+        -------
+        Optional[V]
+            The cached value, or None if the key is not cached or its entry expired.
+        """
+        with self._lock:
+            value: Optional[V] = self._entries.get(key)
+
+            if value is not None and self.ttl is not None:
+                if self._expires[key] <= monotonic():
+                    del self._entries[key]
+                    del self._expires[key]
+                    self.expirations += 1
+                    value = None
+
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Caches the value for the key, evicting the least recently used entry if full.
+
+        Parameters
+        ----------
+        key : K
+            The key to cache the value for.
+        value : V
+            The value to cache.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            if self.ttl is not None:
+                self._expires[key] = monotonic() + self.ttl
+
+            if len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._expires.pop(evicted, None)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Removes every entry from the cache. The counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._expires.clear()
@@ -1,12 +1,18 @@
-from typing import List, Optional
+from importlib import import_module
+from typing import Any, List, Optional
 
+from rapidfuzz import process
 from rapidfuzz.distance.Levenshtein import distance
 
+from stringmatch.bktree import BKTree
+
 
 class Distance:
     """Contains functions for calculating the levenshtein distance between strings."""
 
-    def distance(self, string1: str, string2: str) -> Optional[int]:
+    def distance(
+        self, string1: str, string2: str, *, max_distance: Optional[int] = None
+    ) -> Optional[int]:
         """Returns the levenshtein distance between two strings.
 
         Parameters
@@ -15,11 +21,15 @@ class Distance:
             The first string to compare.
         string2 : str
             The second string to compare.
+        max_distance : Optional[int], optional
+            The highest distance to calculate, by default None (no maximum).
+            Lets the calculation stop early, higher distances are returned as `max_distance + 1`.
 
         Returns
         -------
         Optional[int]
             The levenshtein distance between the two strings.
+            None if either string is empty.
 
         Examples
         --------
@@ -27,11 +37,23 @@ class Distance:
         3
         >>> distance("stringmatch", "something different")
         14
+        >>> distance("stringmatch", "something different", max_distance=5)
+        6
         """
-        return distance(string1, string2) if string1 and string2 else None
+        if not string1 or not string2:
+            return None
+
+        return distance(string1, string2, score_cutoff=max_distance)
 
-    def distance_list(self, string: str, string_list: List[str]) -> List[Optional[int]]:
+    def distance_list(
+        self,
+        string: str,
+        string_list: List[str],
+        *,
+        max_distance: Optional[int] = None,
+    ) -> List[Optional[int]]:
         """Returns the levenshtein distance for a string and a list of strings.
+        Every distance is calculated in a single rapidfuzz call.
 
         Parameters
         ----------
@@ -39,15 +61,105 @@ class Distance:
             The string to compare.
         string_list : List[str]
             The List of strings to compare to.
+        max_distance : Optional[int], optional
+            The highest distance to calculate, by default None (no maximum).
+            Lets the calculation stop early, higher distances are returned as `max_distance + 1`.
 
         Returns
         -------
         List[Optional[int]]
-            The levenshtein distances between the two strings.
+            The levenshtein distances between the two strings, in order of the list.
+            None for empty strings.
 
         Examples
         --------
         >>> distance_list("stringmatch", ["strmatch", "something different"])
         [3, 14]
+        >>> distance_list("stringmatch", ["strmatch", "something different", ""], max_distance=5)
+        [3, 6, None]
+        """
+        if not string:
+            return [None] * len(string_list)
+
+        # Strings further away than the maximum are not returned by rapidfuzz.
+        beyond: Optional[int] = max_distance + 1 if max_distance is not None else None
+        distances: List[Optional[int]] = [beyond if s else None for s in string_list]
+
+        for _, d, i in process.extract_iter(
+            string, string_list, scorer=distance, score_cutoff=max_distance
+        ):
+            # Empty strings get a distance from rapidfuzz, but we return None for them.
+            if string_list[i]:
+                distances[i] = d
+
+        return distances
+
+    def distance_array(
+        self,
+        string: str,
+        string_list: List[str],
+        *,
+        max_distance: Optional[int] = None,
+    ) -> Any:
+        """Same as distance_list, but returns the distances in a NumPy array,
+        which takes a lot less memory for large lists.
+        Requires NumPy to be installed.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_list : List[str]
+            The List of strings to compare to.
+        max_distance : Optional[int], optional
+            The highest distance to calculate, by default None (no maximum).
+            Lets the calculation stop early, higher distances are returned as `max_distance + 1`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The levenshtein distances, with the dtype int32.
+            -1 for empty strings, instead of None.
+
+        Examples
+        --------
+        >>> distance_array("stringmatch", ["strmatch", "something different", ""], max_distance=5)
+        array([ 3,  6, -1], dtype=int32)
+        """
+        numpy: Any = import_module("numpy")
+
+        if not string:
+            return numpy.full(len(string_list), -1, dtype=numpy.int32)
+
+        distances: Any = process.cdist(
+            [string],
+            [s if s else "" for s in string_list],
+            scorer=distance,
+            score_cutoff=max_distance,
+            dtype=numpy.int32,
+        )[0]
+        distances[[not s for s in string_list]] = -1
+
+        return distances
+
+    def bktree(self, string_list: List[str]) -> BKTree:
+        """Builds a BK-tree of a list of strings, for finding the strings
+        within a levenshtein distance of a string without comparing it to every string.
+
+        Parameters
+        ----------
+        string_list : List[str]
+            The List of strings to add to the tree.
+
+        Returns
+        -------
+        BKTree
+            The BK-tree of the strings.
+
+        Examples
+        --------
+        >>> tree = bktree(["strmatch", "something different"])
+        >>> tree.within("stringmatch", 3)
+        [('strmatch', 3)]
         """
-        return [self.distance(string, s) for s in string_list]
+        return BKTree(string_list)
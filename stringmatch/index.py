@@ -0,0 +1,1160 @@
+import math
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from stringmatch.ratio import _CHUNK_SIZE, Ratio, _chunks, _map_workers, _thread_pool
+from stringmatch.scorer import LevenshteinScorer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import ThreadPoolExecutor
+
+    from stringmatch.match import Match
+
+
+# Counting the shared n-grams of a string in Python is slower than scoring it,
+# so if there are more n-grams to count than this many times the strings, we just score them.
+_NGRAM_SCAN_RATIO: int = 3
+
+# Every index gets its own token, which keeps their results apart in the result cache.
+_TOKENS: "count[int]" = count()
+
+
+def _ngrams(string: str, n: int) -> Dict[str, int]:
+    """Counts the n-grams of a string.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    string : str
+        The string to get the n-grams of.
+    n : int
+        The length of the n-grams.
+
+    Returns
+    -------
+    Dict[str, int]
+        How often every n-gram appears in the string.
+    """
+    ngrams: Dict[str, int] = {}
+
+    for i in range(len(string) - n + 1):
+        ngram: str = string[i : i + n]
+        ngrams[ngram] = ngrams.get(ngram, 0) + 1
+
+    return ngrams
+
+
+def _length_buckets(lengths: List[int]) -> Dict[int, List[int]]:
+    """Groups the positions of the strings by their prepared length.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    lengths : List[int]
+        The prepared length of every string, 0 for non-strings.
+
+    Returns
+    -------
+    Dict[int, List[int]]
+        The positions of the strings of every length, in order.
+    """
+    buckets: Dict[int, List[int]] = {}
+
+    for i, length in enumerate(lengths):
+        buckets.setdefault(length, []).append(i)
+
+    return buckets
+
+
+def _build_postings(
+    prepared_list: Sequence[Optional[str]], n: int
+) -> Tuple[Dict[int, Dict[str, Tuple[int, int]]], Sequence[int], Sequence[int]]:
+    """Builds the n-gram postings of the prepared strings.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    prepared_list : Sequence[Optional[str]]
+        The prepared strings, with None for non-strings.
+    n : int
+        The length of the n-grams.
+
+    Returns
+    -------
+    Tuple[Dict[int, Dict[str, Tuple[int, int]]], Sequence[int], Sequence[int]]
+        For every length of string, every n-gram mapped to the start and end of its postings,
+        then the positions of the strings the n-grams appear in, and how often they appear in them.
+    """
+    grouped: Dict[int, Dict[str, Tuple[List[int], List[int]]]] = {}
+
+    for i, prepared in enumerate(prepared_list):
+        # Strings shorter than the n-grams do not have any.
+        if not prepared or len(prepared) < n:
+            continue
+
+        length_postings: Dict[str, Tuple[List[int], List[int]]] = grouped.setdefault(
+            len(prepared), {}
+        )
+
+        for ngram, count in _ngrams(prepared, n).items():
+            ngram_positions, ngram_counts = length_postings.setdefault(ngram, ([], []))
+            ngram_positions.append(i)
+            ngram_counts.append(count)
+
+    # The postings of every n-gram are stored one after another in flat arrays,
+    # so they take up less memory and can be saved and loaded as they are.
+    postings: Dict[int, Dict[str, Tuple[int, int]]] = {}
+    positions: "array[int]" = array("I")
+    counts: "array[int]" = array("I")
+
+    for length, length_postings in grouped.items():
+        postings[length] = {}
+
+        for ngram, (ngram_positions, ngram_counts) in length_postings.items():
+            postings[length][ngram] = (
+                len(positions),
+                len(positions) + len(ngram_positions),
+            )
+            positions.extend(ngram_positions)
+            counts.extend(ngram_counts)
+
+    return postings, positions, counts
+
+
+def _clusters(count: int, pairs: List[Tuple[int, int, int]]) -> List[List[int]]:
+    """Groups positions into clusters, where every pair connects two positions, with union-find.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    count : int
+        The number of positions.
+    pairs : List[Tuple[int, int, int]]
+        The pairs of positions, and their score.
+
+    Returns
+    -------
+    List[List[int]]
+        The clusters with more than one position, each in order of the positions,
+        in order of their first position.
+    """
+    parents: List[int] = list(range(count))
+
+    def find(i: int) -> int:
+        while parents[i] != i:
+            # Points every other position on the way to its grandparent, which keeps the trees flat.
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    for a, b, _ in pairs:
+        root_a: int = find(a)
+        root_b: int = find(b)
+
+        if root_a != root_b:
+            parents[max(root_a, root_b)] = min(root_a, root_b)
+
+    clusters: Dict[int, List[int]] = {}
+
+    for i in range(count):
+        clusters.setdefault(find(i), []).append(i)
+
+    return [cluster for cluster in clusters.values() if len(cluster) > 1]
+
+
+class MatchIndex:
+    """Contains a prepared list of strings, which can be searched many times."""
+
+    def __init__(
+        self,
+        match: "Match",
+        string_list: List[str],
+        *,
+        ngram_size: int = 0,
+        prepared_list: Optional[List[Optional[str]]] = None,
+    ) -> None:
+        """Initialise the MatchIndex class, preparing every string in the list once.
+        Usually constructed with `Match.index()`.
+
+        With an `ngram_size`, an inverted index of the n-grams of the prepared strings is built.
+        Searches with the LevenshteinScorer (and without partial matches) then only score
+        the strings that share enough n-grams with the string to possibly reach the cutoff score,
+        which returns exactly the same results as scoring every string.
+        Other scorers still score every string.
+
+        Parameters
+        ----------
+        match : Match
+            The Match class whose settings are used for preparing and searching.
+            Changing the settings of the Match class afterwards does not affect the index.
+        string_list : List[str]
+            The List of strings to prepare.
+        ngram_size : int, optional
+            The length of the n-grams to build an inverted index of, by default 0 (no n-gram index).
+            Longer n-grams filter better on long strings, but worse on short strings. 2 or 3 works well in most cases.
+        prepared_list : Optional[List[Optional[str]]], optional
+            The already prepared strings of the list, with None for non-strings,
+            by default None (the strings get prepared here).
+
+        Returns
+        -------
+        MatchIndex
+            The MatchIndex class.
+
+        Examples
+        --------
+        >>> MatchIndex(Match(latinise=True), ["strmatch", "test", "something else"])
+        """
+        self.match: "Match" = match
+        self.ratio: Ratio = match._get_ratio()
+        self._token: int = next(_TOKENS)
+        strings: List[str] = list(string_list)
+        # A loaded index reads its strings from the file only when they are needed.
+        self.string_list: Sequence[str] = strings
+
+        # Non-strings are kept as None, they always get a score of 0.
+        self.prepared_list: Sequence[Optional[str]] = (
+            self.ratio._prepare_list(strings)
+            if prepared_list is None
+            else prepared_list
+        )
+        self.lengths: List[int] = [len(s) if s else 0 for s in self.prepared_list]
+
+        # The position of every string, grouped by their prepared length.
+        self._length_buckets: Dict[int, List[int]] = _length_buckets(self.lengths)
+
+        # How many strings were skipped while searching, because they could not reach the cutoff score.
+        self.pruned: int = 0
+        self._lock: Lock = Lock()
+
+        # For every length of string, every n-gram maps to the positions
+        # of the strings it appears in, and how often it appears in them.
+        self.ngram_size: int = ngram_size
+        self._postings: Mapping[int, Mapping[str, Tuple[int, int]]] = {}
+        self._positions: Sequence[int] = array("I")
+        self._counts: Sequence[int] = array("I")
+
+        if ngram_size > 0:
+            self._postings, self._positions, self._counts = _build_postings(
+                self.prepared_list, ngram_size
+            )
+
+        # The positions of the strings removed with `MutableMatchIndex`, they are kept as None,
+        # so the positions of the other strings stay the same. The other positions, if any were removed.
+        self._removed: Set[int] = set()
+        self._live: Optional[List[int]] = None
+        # How many entries of the postings arrays belong to n-grams that were changed since.
+        self._garbage: int = 0
+
+    def __len__(self) -> int:
+        return len(self.string_list) - len(self._removed)
+
+    def save(self, path: str) -> None:
+        """Saves the prepared strings and the n-gram index to a file,
+        so it can be loaded again with `Match.load_index()` without preparing every string again.
+        The file also records the settings of the index, it can only be loaded with the same settings.
+        Non-strings in the list, and strings removed from a `MutableMatchIndex`, are saved as None.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file to write.
+
+        Examples
+        --------
+        >>> index = Match().index(["strmatch", "test", "something else"], ngram_size=3)
+        >>> index.save("strings.idx")
+        """
+        # The file format is only imported when it is needed, since it imports json.
+        from stringmatch.indexfile import _write_index
+
+        _write_index(
+            path,
+            self.ratio,
+            self.string_list,
+            self.prepared_list,
+            self.ngram_size,
+            self._postings,
+            self._positions,
+            self._counts,
+        )
+
+    def _updated(self, changes: Dict[int, Any]) -> "MatchIndex":
+        """Returns a copy of the index with some strings changed, the index itself stays the same.
+        Only the changed strings get prepared, and only their length buckets and n-grams get updated.
+        Only meant for internal usage.
+
+        The postings of every changed n-gram are written again at the end of a copy of the postings arrays,
+        and once more than half of the arrays are left behind this way, the postings are built again.
+
+        Parameters
+        ----------
+        changes : Dict[int, Any]
+            The new string for every position, or None to remove the string.
+            A position right after the last one adds a string.
+
+        Returns
+        -------
+        MatchIndex
+            The changed index, with the same settings and the same number of skipped strings.
+        """
+        index: MatchIndex = MatchIndex(self.match, [], ngram_size=self.ngram_size)
+        index.ratio = self.ratio
+        index.pruned = self.pruned
+
+        string_list: List[Any] = list(self.string_list)
+        prepared_list: List[Optional[str]] = list(self.prepared_list)
+        index.string_list = string_list
+        index.prepared_list = prepared_list
+        index.lengths = list(self.lengths)
+        index._removed = set(self._removed)
+
+        added: List[int] = sorted(p for p, s in changes.items() if s is not None)
+        prepared: Dict[int, Optional[str]] = dict(
+            zip(added, self.ratio._prepare_list([changes[p] for p in added]))
+        )
+
+        # The buckets and the postings that change are copied, the rest is shared with this index.
+        buckets: Dict[int, List[int]] = dict(self._length_buckets)
+        copied: Set[int] = set()
+        # The positions to remove from and add to the postings of every n-gram, by the length of the strings.
+        removals: Dict[Tuple[int, str], Set[int]] = {}
+        additions: Dict[Tuple[int, str], List[Tuple[int, int]]] = {}
+        n: int = self.ngram_size
+
+        def bucket(length: int) -> List[int]:
+            if length not in copied:
+                buckets[length] = list(buckets.get(length, []))
+                copied.add(length)
+            return buckets[length]
+
+        for position in sorted(changes):
+            if position < len(string_list):
+                if position not in index._removed:
+                    old: Optional[str] = prepared_list[position]
+                    bucket(index.lengths[position]).remove(position)
+
+                    if n > 0 and old and len(old) >= n:
+                        for ngram in _ngrams(old, n):
+                            removals.setdefault((len(old), ngram), set()).add(position)
+            else:
+                string_list.append(None)
+                prepared_list.append(None)
+                index.lengths.append(0)
+
+            if changes[position] is None:
+                string_list[position] = None
+                prepared_list[position] = None
+                index.lengths[position] = 0
+                index._removed.add(position)
+                continue
+
+            new: Optional[str] = prepared[position]
+            string_list[position] = changes[position]
+            prepared_list[position] = new
+            index.lengths[position] = len(new) if new else 0
+            index._removed.discard(position)
+            insort(bucket(index.lengths[position]), position)
+
+            if n > 0 and new and len(new) >= n:
+                for ngram, count in _ngrams(new, n).items():
+                    additions.setdefault((len(new), ngram), []).append(
+                        (position, count)
+                    )
+
+        index._length_buckets = {k: v for k, v in buckets.items() if v}
+
+        if index._removed:
+            live: List[int] = (
+                list(self._live)
+                if self._live is not None
+                else list(range(len(self.string_list)))
+            )
+
+            for position in sorted(changes):
+                live_position: int = bisect_left(live, position)
+                is_live: bool = (
+                    live_position < len(live) and live[live_position] == position
+                )
+
+                if position in index._removed and is_live:
+                    del live[live_position]
+                elif position not in index._removed and not is_live:
+                    live.insert(live_position, position)
+
+            index._live = live
+
+        if n > 0:
+            index._update_postings(self, removals, additions)
+
+        return index
+
+    def _update_postings(
+        self,
+        previous: "MatchIndex",
+        removals: Dict[Tuple[int, str], Set[int]],
+        additions: Dict[Tuple[int, str], List[Tuple[int, int]]],
+    ) -> None:
+        """Updates the n-gram postings of a copy of an index, see `_updated`.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        previous : MatchIndex
+            The index this one is a copy of.
+        removals : Dict[Tuple[int, str], Set[int]]
+            The positions to remove from the postings, for every length of string and n-gram.
+        additions : Dict[Tuple[int, str], List[Tuple[int, int]]]
+            The positions to add to the postings and how often the n-gram appears in them,
+            for every length of string and n-gram.
+        """
+        # The arrays of a loaded index are read-only, so they always get copied.
+        positions: "array[int]" = array("I", previous._positions)
+        counts: "array[int]" = array("I", previous._counts)
+        # Only the postings of the lengths that change are copied, the rest is shared with the previous index.
+        changed: Dict[int, Dict[str, Tuple[int, int]]] = {}
+        garbage: int = previous._garbage
+
+        for key in set(removals) | set(additions):
+            length, ngram = key
+            if length not in changed:
+                changed[length] = dict(previous._postings.get(length, {}))
+
+            start, end = changed[length].pop(ngram, (0, 0))
+            removed: Set[int] = removals.get(key, set())
+            kept: List[Tuple[int, int]] = [
+                (p, c)
+                for p, c in zip(positions[start:end], counts[start:end])
+                if p not in removed
+            ] + additions.get(key, [])
+            garbage += end - start
+
+            if kept:
+                changed[length][ngram] = (len(positions), len(positions) + len(kept))
+                positions.extend(p for p, _ in kept)
+                counts.extend(c for _, c in kept)
+
+        postings: Dict[int, Mapping[str, Tuple[int, int]]] = dict(previous._postings)
+        postings.update(changed)
+
+        self._postings = {k: v for k, v in postings.items() if v}
+        self._positions = positions
+        self._counts = counts
+        self._garbage = garbage
+
+        if garbage > len(positions) // 2:
+            self._postings, self._positions, self._counts = _build_postings(
+                self.prepared_list, self.ngram_size
+            )
+            self._garbage = 0
+
+    def _count_pruned(self, pruned: int) -> None:
+        """Adds to the number of strings that were skipped while searching.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        pruned : int
+            The number of strings that were skipped.
+        """
+        with self._lock:
+            self.pruned += pruned
+
+        if self.ratio.stats is not None:
+            self.ratio.stats._record("pruned", pruned)
+
+    def _candidates(
+        self, prepared_string: str, score: int
+    ) -> Tuple[Optional[List[List[int]]], int]:
+        """Returns the positions of the strings that can possibly reach the cutoff score.
+        Only meant for internal usage.
+
+        Every scorer has an upper bound for the score of two strings with given lengths,
+        so whole lengths of strings that cannot reach the cutoff score are skipped.
+        The other lengths are returned with the highest upper bound first,
+        so that good matches are found early and the cutoff score rises quickly.
+
+        With the n-gram index, the strings are also filtered by their n-grams.
+        The LevenshteinScorer counts a substitution as a deletion and an insertion,
+        so the cutoff score gives us the maximum number of deletions and insertions
+        to get from the string to another string of a given length.
+        Every deletion changes at most n of the n-grams of the string, and every insertion at most n - 1,
+        the rest of the n-grams have to be shared by both strings.
+
+        Parameters
+        ----------
+        prepared_string : str
+            The prepared string to search for.
+        score : int
+            The cutoff for the score.
+
+        Returns
+        -------
+        Tuple[Optional[List[List[int]]], int]
+            The positions of the candidates, one list for every length of string in the order to score them,
+            or None if every string has to be scored, and the number of strings that were skipped.
+        """
+        if score <= 0 or not prepared_string:
+            return None, 0
+
+        n: int = self.ngram_size
+        use_ngrams: bool = (
+            n > 0
+            and not self.ratio.include_partial
+            and type(self.ratio._get_scorer()) is LevenshteinScorer
+        )
+
+        query_length: int = len(prepared_string)
+        # The lowest normalized similarity that can still round up to the cutoff score.
+        similarity: float = self.ratio._scorer_cutoff(score) / 100
+
+        query_ngrams: Dict[str, int] = _ngrams(prepared_string, n) if use_ngrams else {}
+        # The upper bound of the score and the candidates, for every length of string.
+        buckets: List[Tuple[float, int, List[int]]] = []
+        pruned: int = 0
+
+        for length, positions in self._length_buckets.items():
+            # Empty strings and non-strings always get a score of 0.
+            if not length:
+                continue
+
+            if not self.ratio._can_reach(query_length, length, score):
+                pruned += len(positions)
+                continue
+
+            bound: float = self.ratio._upper_bound(query_length, length)
+
+            if not use_ngrams:
+                buckets.append((bound, length, positions))
+                continue
+
+            difference: int = length - query_length
+            # The LevenshteinScorer is normalized by the sum of both lengths.
+            # We need at least as many insertions or deletions as the difference in length.
+            max_distance: int = max(
+                math.floor((1 - similarity) * (query_length + length) + 1e-9),
+                abs(difference),
+            )
+
+            # The number of insertions and deletions has the same parity as the difference in length.
+            if (max_distance - difference) % 2:
+                max_distance -= 1
+
+            insertions: int = (max_distance + difference) // 2
+            deletions: int = (max_distance - difference) // 2
+
+            # The minimum number of shared n-grams.
+            required: int = max(
+                query_length - n + 1 - deletions * n - insertions * (n - 1),
+                length - n + 1 - insertions * n - deletions * (n - 1),
+            )
+
+            postings: Mapping[str, Tuple[int, int]] = self._postings.get(length, {})
+            # The postings of the n-grams of the string, and how often they appear in the string.
+            matching: List[Tuple[int, int, int]] = [
+                (*postings[ngram], count)
+                for ngram, count in query_ngrams.items()
+                if ngram in postings
+            ]
+
+            # If these strings might not share any n-grams at all, or counting them
+            # would take longer than just scoring them, we score all of them.
+            if required <= 0 or sum(
+                end - start for start, end, _ in matching
+            ) > _NGRAM_SCAN_RATIO * len(positions):
+                buckets.append((bound, length, positions))
+                continue
+
+            shared: Dict[int, int] = {}
+
+            for start, end, count in matching:
+                for i, c in zip(self._positions[start:end], self._counts[start:end]):
+                    shared[i] = shared.get(i, 0) + min(count, c)
+
+            kept: List[int] = sorted(i for i, c in shared.items() if c >= required)
+            pruned += len(positions) - len(kept)
+            buckets.append((bound, length, kept))
+
+        buckets.sort(key=lambda b: (-b[0], b[1]))
+
+        # Lengths that were not filtered by their n-grams are the lists of the index, not copies.
+        return [positions for _, _, positions in buckets], pruned
+
+    def get_best_match(self, string: str, *, score: int = 70) -> Optional[str]:
+        """Returns the best match from the prepared strings.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        Optional[str]
+            The best string found, or None if no good match was found.
+
+        Examples
+        --------
+        >>> get_best_match("stringmatch")
+        'strmatch'
+        """
+        match: Optional[Tuple[str, int]] = self.get_best_match_with_ratio(
+            string, score=score
+        )
+
+        return match[0] if match else None
+
+    def get_best_match_with_ratio(
+        self, string: str, *, score: int = 70
+    ) -> Optional[Tuple[str, int]]:
+        """Same as get_best_match, but returns a tuple with the best match and its score.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        Optional[Tuple[str, int]]
+            The best string and its score found, or None if no good match was found.
+
+        Examples
+        --------
+        >>> get_best_match_with_ratio("stringmatch")
+        ('strmatch', 84)
+        """
+        matches: List[Tuple[str, int]] = self.get_best_matches_with_ratio(
+            string, score=score, limit=1
+        )
+
+        return matches[0] if matches else None
+
+    def get_best_matches(
+        self, string: str, *, score: int = 70, limit: Optional[int] = 5
+    ) -> List[str]:
+        """Returns the prepared strings that are similar to the string.
+        If there are more than `limit` matches,
+        only the `limit` best matches are returned, sorted by score.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[str]
+            All of the matches found.
+
+        Examples
+        --------
+        >>> get_best_matches("stringmatch")
+        ['strmatch']
+        """
+        return [
+            m[0]
+            for m in self.get_best_matches_with_ratio(string, score=score, limit=limit)
+        ]
+
+    def get_best_matches_with_ratio(
+        self, string: str, *, score: int = 70, limit: Optional[int] = 5
+    ) -> List[Tuple[str, int]]:
+        """Same as get_best_matches, but returns a list of tuples with the best matches and their score.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            All of the matches found.
+
+        Examples
+        --------
+        >>> get_best_matches_with_ratio("stringmatch")
+        [('strmatch', 84)]
+        """
+        if limit is not None and limit < 1:
+            limit = None
+
+        def search() -> List[Tuple[str, int]]:
+            matches, pruned = self._search(string, score=score, limit=limit)
+            self._count_pruned(pruned)
+
+            return [(s, r) for _, s, r in matches]
+
+        key: Optional[Tuple[Any, ...]] = None
+
+        # An index never changes, a changed MutableMatchIndex is a new index with a new token.
+        if isinstance(string, str):
+            key = (self._token, string, score, limit)
+
+        return self.match._cached_search(key, search)
+
+    def get_best_match_with_index(
+        self, string: str, *, score: int = 70
+    ) -> Optional[Tuple[int, int]]:
+        """Same as get_best_match_with_ratio, but returns the position of the best match in the index instead of the string.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        Optional[Tuple[int, int]]
+            The position of the best match and its score, or None if no good match was found.
+
+        Examples
+        --------
+        >>> get_best_match_with_index("stringmatch")
+        (0, 84)
+        """
+        matches: List[Tuple[int, int]] = self.get_best_matches_with_index(
+            string, score=score, limit=1
+        )
+
+        return matches[0] if matches else None
+
+    def get_best_matches_with_index(
+        self, string: str, *, score: int = 70, limit: Optional[int] = 5
+    ) -> List[Tuple[int, int]]:
+        """Same as get_best_matches_with_ratio, but returns the positions of the matches in the index instead of the strings.
+        The positions are the same as in the list the index was built from,
+        so an index of the names of records can be used to find the records.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            The positions of the matches found and their score, the best match comes first.
+
+        Examples
+        --------
+        >>> get_best_matches_with_index("stringmatch")
+        [(0, 84)]
+        """
+        if limit is not None and limit < 1:
+            limit = None
+
+        matches, pruned = self._search(string, score=score, limit=limit)
+        self._count_pruned(pruned)
+
+        return [(p, r) for p, _, r in matches]
+
+    def _search(
+        self, string: Optional[str], *, score: int, limit: Optional[int]
+    ) -> Tuple[List[Tuple[int, str, int]], int]:
+        """Finds the best matches of a string, with their positions in the index.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        string : Optional[str]
+            The string to compare, None for non-strings, which get a score of 0.
+        score : int
+            The cutoff for the score.
+        limit : Optional[int]
+            The number of matches to return, or None for every match.
+
+        Returns
+        -------
+        Tuple[List[Tuple[int, str, int]], int]
+            The positions of the best matches, the matches and their score,
+            and the number of strings that were skipped without scoring them.
+        """
+        prepared_string: Optional[str] = None
+        indices: Optional[List[List[int]]] = None
+        skipped: int = 0
+
+        if isinstance(string, str):
+            prepared_string = self.ratio._prepare_string(string)
+            indices, skipped = self._candidates(prepared_string, score)
+
+        # The candidates never contain removed strings, but every string would.
+        pruned_cutoff: int = score if indices is not None else 0
+        if indices is None and self._live is not None:
+            indices = [self._live]
+
+        matches, pruned = self.match._best_matches(
+            self.ratio,
+            string,
+            self.string_list,
+            self.prepared_list,
+            score=score,
+            limit=limit,
+            indices=indices,
+            prepared_string=prepared_string,
+            pruned_cutoff=pruned_cutoff,
+        )
+
+        return matches, skipped + pruned
+
+    def get_best_matches_many(
+        self,
+        strings: List[str],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+        workers: int = 1,
+    ) -> List[List[str]]:
+        """Same as get_best_matches, but for many strings at once.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+        workers : int, optional
+            The number of threads to spread the strings across, by default 1.
+            Set this to -1 to use one thread per CPU core.
+
+        Returns
+        -------
+        List[List[str]]
+            The matches found for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> get_best_matches_many(["stringmatch", "tset"])
+        [['strmatch'], ['test']]
+        """
+        return [
+            [m[0] for m in matches]
+            for matches in self.get_best_matches_many_with_ratio(
+                strings, score=score, limit=limit, workers=workers
+            )
+        ]
+
+    def get_best_matches_many_with_ratio(
+        self,
+        strings: List[str],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+        workers: int = 1,
+    ) -> List[List[Tuple[str, int]]]:
+        """Same as get_best_matches_with_ratio, but for many strings at once.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+        workers : int, optional
+            The number of threads to spread the strings across, by default 1.
+            Set this to -1 to use one thread per CPU core.
+
+        Returns
+        -------
+        List[List[Tuple[str, int]]]
+            The matches found and their score for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> get_best_matches_many_with_ratio(["stringmatch", "tset"])
+        [[('strmatch', 84)], [('test', 75)]]
+        """
+        return _map_workers(
+            lambda string: self.get_best_matches_with_ratio(
+                string, score=score, limit=limit
+            ),
+            strings,
+            workers,
+        )
+
+    def _search_many(
+        self, strings: List[str], score: int, limit: Optional[int], workers: int
+    ) -> List[List[Tuple[str, int]]]:
+        """Same as get_best_matches_many_with_ratio, but never uses the result cache.
+        Only meant for internal usage.
+
+        Used for indexes that only live for a single call, their results could never be looked up again.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        score : int
+            The cutoff for the score.
+        limit : Optional[int]
+            The number of matches to return for every string, 0 (or less than 0) or None returns every match.
+        workers : int
+            The number of threads to use, -1 uses one thread per CPU core.
+
+        Returns
+        -------
+        List[List[Tuple[str, int]]]
+            The matches found and their score for every string, in order of the strings.
+        """
+        if limit is not None and limit < 1:
+            limit = None
+
+        def search(string: str) -> List[Tuple[str, int]]:
+            matches, pruned = self._search(string, score=score, limit=limit)
+            self._count_pruned(pruned)
+
+            return [(s, r) for _, s, r in matches]
+
+        return _map_workers(search, strings, workers)
+
+    def _duplicates(self, score: int, workers: int) -> List[Tuple[int, int, int]]:
+        """Compares the strings of the index with each other, and returns the pairs that reach the cutoff score.
+        Only meant for internal usage.
+
+        The strings are sorted by their prepared length, and every string is only compared to the band of
+        longer strings after it whose length can still reach the cutoff score, in a single call to the scorer.
+        Every pair is compared once, with the shorter string first, and the pairs skipped this way are counted as pruned.
+
+        Parameters
+        ----------
+        score : int
+            The cutoff for the score.
+        workers : int
+            The number of threads to use, -1 uses one thread per CPU core.
+
+        Returns
+        -------
+        List[Tuple[int, int, int]]
+            The positions of both strings of every pair, the earlier one first, and their score.
+            The best pair comes first, pairs with the same score are in order of their positions.
+        """
+        # Empty strings and non-strings are never duplicates.
+        order: List[int] = sorted(
+            (i for i, length in enumerate(self.lengths) if length),
+            key=lambda i: self.lengths[i],
+        )
+        prepared: List[str] = [self.prepared_list[i] or "" for i in order]
+        lengths: List[int] = [self.lengths[i] for i in order]
+
+        # The end of the band of strings that can reach the cutoff score, for every length.
+        ends: Dict[int, int] = {}
+        distinct: List[int] = sorted(set(lengths))
+
+        for a, length in enumerate(distinct):
+            longest: int = length
+            for other in reversed(distinct[a:]):
+                if self.ratio._can_reach(length, other, score):
+                    longest = other
+                    break
+            ends[length] = bisect_right(lengths, longest)
+
+        def later_pairs(k: int) -> List[Tuple[int, int, int]]:
+            band: List[str] = prepared[k + 1 : ends[lengths[k]]]
+
+            return [
+                (min(order[k], order[k + 1 + j]), max(order[k], order[k + 1 + j]), r)
+                for j, r in self.ratio._prepared_matches(prepared[k], band, score)
+            ]
+
+        pairs: List[Tuple[int, int, int]] = [
+            pair
+            for string_pairs in _map_workers(
+                later_pairs, list(range(len(order))), workers
+            )
+            for pair in string_pairs
+        ]
+
+        compared: int = sum(ends[length] - k - 1 for k, length in enumerate(lengths))
+        self._count_pruned(len(order) * (len(order) - 1) // 2 - compared)
+
+        pairs.sort(key=lambda p: (-p[2], p[0], p[1]))
+
+        return pairs
+
+    def find_duplicates(self, *, score: int = 70, workers: int = 1) -> List[List[str]]:
+        """Finds the groups of similar strings in the index.
+        Two strings are in the same group if they reach the cutoff score, or if they are connected by a chain of such strings.
+        Empty strings and non-strings are never part of a group.
+
+        Every string is only compared to the strings whose length can possibly reach the cutoff score,
+        and rapidfuzz stops comparing two strings once they cannot reach it anymore.
+
+        Parameters
+        ----------
+        score : int, optional
+            The cutoff for the score, by default 70.
+        workers : int, optional
+            The number of threads to use, by default 1.
+            -1 uses one thread per CPU core.
+
+        Returns
+        -------
+        List[List[str]]
+            The groups of at least two strings, in order of the list.
+
+        Examples
+        --------
+        >>> Match().index(["stringmatch", "test", "strmatch", "tset"]).find_duplicates()
+        [['stringmatch', 'strmatch'], ['test', 'tset']]
+        """
+        return [
+            [self.string_list[i] for i in cluster]
+            for cluster in _clusters(
+                len(self.string_list), self._duplicates(score, workers)
+            )
+        ]
+
+    def find_duplicates_with_ratio(
+        self, *, score: int = 70, workers: int = 1
+    ) -> List[Tuple[str, str, int]]:
+        """Same as find_duplicates, but returns every pair of similar strings and their score instead of the groups.
+        The best pair comes first, the first string of every pair comes first in the list.
+
+        Parameters
+        ----------
+        score : int, optional
+            The cutoff for the score, by default 70.
+        workers : int, optional
+            The number of threads to use, by default 1.
+            -1 uses one thread per CPU core.
+
+        Returns
+        -------
+        List[Tuple[str, str, int]]
+            The pairs of similar strings and their score.
+
+        Examples
+        --------
+        >>> Match().index(["stringmatch", "test", "strmatch", "tset"]).find_duplicates_with_ratio()
+        [('stringmatch', 'strmatch', 84), ('test', 'tset', 75)]
+        """
+        return [
+            (self.string_list[a], self.string_list[b], r)
+            for a, b, r in self._duplicates(score, workers)
+        ]
+
+    def join(
+        self,
+        left: Iterable[str],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 1,
+        workers: int = 1,
+    ) -> Tuple["array[int]", "array[int]", "array[int]"]:
+        """Matches every string of another list to the prepared strings, and returns the best matches of every string.
+        The other list is read lazily in chunks, so only one chunk of it is in memory at a time,
+        and the matches are returned as compact arrays instead of lists of tuples.
+
+        Parameters
+        ----------
+        left : Iterable[str]
+            The strings to match to the prepared strings, for example a list, a generator or an open file.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 1.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+        workers : int, optional
+            The number of threads to use, by default 1.
+            -1 uses one thread per CPU core.
+
+        Returns
+        -------
+        Tuple[array[int], array[int], array[int]]
+            The positions of the strings in the other list, the positions of their matches in the index,
+            and their score, as arrays of 64 bit, 32 bit and 8 bit unsigned integers.
+            The matches are in order of the other list, the best match of every string comes first.
+            Strings without any match do not appear at all.
+
+        Examples
+        --------
+        >>> index = Match().index(["strmatch", "test", "something else"])
+        >>> index.join(["stringmatch", "nothing", "tset"])
+        (array('Q', [0, 2]), array('I', [0, 1]), array('B', [84, 75]))
+        """
+        if limit is not None and limit < 1:
+            limit = None
+
+        left_positions: "array[int]" = array("Q")
+        right_positions: "array[int]" = array("I")
+        scores: "array[int]" = array("B")
+        position: int = 0
+        pruned: int = 0
+
+        def search(string: Optional[str]) -> Tuple[List[Tuple[int, str, int]], int]:
+            return self._search(string, score=score, limit=limit)
+
+        # The same threads search every chunk.
+        pool: Optional["ThreadPoolExecutor"] = _thread_pool(workers)
+
+        try:
+            for chunk in _chunks(left, _CHUNK_SIZE):
+                # Lists often contain the same string many times, every string is only searched once.
+                # Non-strings all get the same matches.
+                keys: List[Optional[str]] = [
+                    s if isinstance(s, str) else None for s in chunk
+                ]
+                unique: List[Optional[str]] = list(dict.fromkeys(keys))
+                found: Dict[Optional[str], Tuple[List[Tuple[int, str, int]], int]] = (
+                    dict(zip(unique, _map_workers(search, unique, workers, pool)))
+                )
+
+                for i, key in enumerate(keys):
+                    matches, string_pruned = found[key]
+                    pruned += string_pruned
+
+                    for p, _, r in matches:
+                        left_positions.append(position + i)
+                        right_positions.append(p)
+                        scores.append(r)
+
+                position += len(chunk)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self._count_pruned(pruned)
+
+        return left_positions, right_positions, scores
@@ -0,0 +1,537 @@
+import json
+import mmap
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from stringmatch.ratio import Ratio
+
+# The first bytes of every index file, the last byte is the version of the format.
+_MAGIC: bytes = b"STRMIDX\x02"
+
+# Every section of the file starts at a multiple of this, so the arrays can be read in place.
+_ALIGNMENT: int = 8
+
+# Python strings can contain lone surrogates, which UTF-8 cannot encode without this.
+_ERRORS: str = "surrogatepass"
+
+
+def _settings(ratio: Ratio) -> Dict[str, Any]:
+    """Returns the settings that change how strings are prepared and scored.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    ratio : Ratio
+        The Ratio class to get the settings of.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The settings, the scorer by its full name.
+    """
+    # mypyc does not allow reading these attributes off a class object directly.
+    module: str = getattr(ratio.scorer, "__module__")
+    qualname: str = getattr(ratio.scorer, "__qualname__")
+
+    return {
+        "scorer": f"{module}.{qualname}",
+        "latinise": ratio.latinise,
+        "ignore_case": ratio.ignore_case,
+        "remove_punctuation": ratio.remove_punctuation,
+        "alphanumeric": ratio.alphanumeric,
+        "include_partial": ratio.include_partial,
+    }
+
+
+def _encode(strings: List[str]) -> Tuple[bytes, bytes]:
+    """Encodes the strings one after another, and returns them with their offsets.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    strings : List[str]
+        The strings.
+
+    Returns
+    -------
+    Tuple[bytes, bytes]
+        The encoded strings, and the start of every string in them followed by the end of the last string,
+        as an array of 64 bit integers.
+    """
+    encoded: List[bytes] = [s.encode("utf-8", _ERRORS) for s in strings]
+
+    return (
+        b"".join(encoded),
+        array("Q", accumulate((len(b) for b in encoded), initial=0)).tobytes(),
+    )
+
+
+def _string_sections(
+    string_list: Sequence[Any], prepared_list: Sequence[Optional[str]]
+) -> Dict[str, bytes]:
+    """Returns the sections with the strings and the prepared strings,
+    each concatenated with an array of their offsets, which of them are strings,
+    and the lengths of the prepared strings.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    string_list : Sequence[Any]
+        The strings, non-strings are written as None.
+    prepared_list : Sequence[Optional[str]]
+        The prepared strings.
+
+    Returns
+    -------
+    Dict[str, bytes]
+        The sections by their name.
+    """
+    strings: List[str] = [s if isinstance(s, str) else "" for s in string_list]
+    prepared: List[str] = [s or "" for s in prepared_list]
+    string_text, string_offsets = _encode(strings)
+    prepared_text, prepared_offsets = _encode(prepared)
+
+    return {
+        "string_text": string_text,
+        "string_offsets": string_offsets,
+        "string_types": bytes(isinstance(s, str) for s in string_list),
+        "prepared_text": prepared_text,
+        "prepared_offsets": prepared_offsets,
+        "prepared_lengths": array("Q", [len(s) for s in prepared]).tobytes(),
+    }
+
+
+class _Strings(Sequence[Optional[str]]):
+    """The strings of an index file, every string is only decoded the first time it is read.
+    Only meant for internal usage."""
+
+    def __init__(
+        self, text: memoryview, offsets: memoryview, types: memoryview
+    ) -> None:
+        """Initialise the _Strings class.
+
+        Parameters
+        ----------
+        text : memoryview
+            The encoded strings, one after another.
+        offsets : memoryview
+            The start of every string in the text, followed by the end of the last string.
+        types : memoryview
+            Which of the strings are strings, the others are read as None.
+        """
+        self._text: memoryview = text
+        self._offsets: memoryview = offsets
+        self._types: memoryview = types
+        # The strings decoded so far, every search reads the same strings again.
+        self._decoded: List[Optional[str]] = [None] * len(types)
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    @overload
+    def __getitem__(self, i: int) -> Optional[str]: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> List[Optional[str]]: ...
+
+    def __getitem__(
+        self, i: Union[int, slice]
+    ) -> Union[Optional[str], List[Optional[str]]]:
+        if isinstance(i, slice):
+            return [self._get(j) for j in range(*i.indices(len(self)))]
+
+        if i < 0:
+            i += len(self)
+
+        if not 0 <= i < len(self):
+            raise IndexError("string index out of range")
+
+        return self._get(i)
+
+    def _get(self, i: int) -> Optional[str]:
+        """Decodes a string, or returns it if it was decoded before.
+
+        Parameters
+        ----------
+        i : int
+            The position of the string, in range.
+
+        Returns
+        -------
+        Optional[str]
+            The string, or None if it is not a string.
+        """
+        s: Optional[str] = self._decoded[i]
+
+        if s is None and self._types[i]:
+            s = str(
+                self._text[self._offsets[i] : self._offsets[i + 1]], "utf-8", _ERRORS
+            )
+            self._decoded[i] = s
+
+        return s
+
+
+def _read_strings(
+    section: Callable[[str], memoryview],
+) -> Tuple[Sequence[Any], Sequence[Optional[str]]]:
+    """Reads the strings and the prepared strings from the sections written by `_string_sections`.
+    The strings are read in place, they are only decoded when they are needed.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    section : Callable[[str], memoryview]
+        Returns a section by its name.
+
+    Returns
+    -------
+    Tuple[Sequence[Any], Sequence[Optional[str]]]
+        The strings and the prepared strings, both with None for non-strings.
+    """
+    types: memoryview = section("string_types")
+
+    return (
+        _Strings(section("string_text"), section("string_offsets").cast("Q"), types),
+        _Strings(
+            section("prepared_text"), section("prepared_offsets").cast("Q"), types
+        ),
+    )
+
+
+class _LengthPostings(Mapping[str, Tuple[int, int]]):
+    """The n-gram postings of the strings of one length in an index file.
+    Only meant for internal usage."""
+
+    def __init__(self, postings: "_Postings", start: int, end: int) -> None:
+        """Initialise the _LengthPostings class.
+
+        Parameters
+        ----------
+        postings : _Postings
+            The postings of the index file.
+        start : int
+            The first entry of the directory with this length.
+        end : int
+            The entry of the directory after the last one with this length.
+        """
+        self._postings: _Postings = postings
+        self._start: int = start
+        self._end: int = end
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._start, self._end):
+            yield self._postings._key(i)
+
+    def __contains__(self, ngram: object) -> bool:
+        return isinstance(ngram, str) and self._find(ngram) >= 0
+
+    def __getitem__(self, ngram: str) -> Tuple[int, int]:
+        i: int = self._find(ngram)
+
+        if i < 0:
+            raise KeyError(ngram)
+
+        return self._postings._bounds(i)
+
+    def _find(self, ngram: str) -> int:
+        """Looks up an n-gram with a binary search, the n-grams of every length are sorted.
+
+        Parameters
+        ----------
+        ngram : str
+            The n-gram to look up.
+
+        Returns
+        -------
+        int
+            The entry of the directory with the n-gram, or -1 if there is none.
+        """
+        low: int = self._start
+        high: int = self._end
+
+        while low < high:
+            middle: int = (low + high) // 2
+
+            if self._postings._key(middle) < ngram:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < self._end and self._postings._key(low) == ngram:
+            return low
+
+        return -1
+
+
+class _Postings(Mapping[int, Mapping[str, Tuple[int, int]]]):
+    """The n-gram postings of an index file, looked up in the directory of the file when they are needed.
+    Only meant for internal usage."""
+
+    def __init__(
+        self,
+        lengths: memoryview,
+        keys: memoryview,
+        key_offsets: memoryview,
+        bounds: memoryview,
+    ) -> None:
+        """Initialise the _Postings class.
+
+        Parameters
+        ----------
+        lengths : memoryview
+            The length of the strings of every entry of the directory, sorted.
+        keys : memoryview
+            The encoded n-grams of the entries, sorted for every length.
+        key_offsets : memoryview
+            The start of every n-gram in the keys, followed by the end of the last n-gram.
+        bounds : memoryview
+            The start and end of the postings of every entry.
+        """
+        self._lengths: memoryview = lengths
+        self._keys: memoryview = keys
+        self._key_offsets: memoryview = key_offsets
+        self._ranges: memoryview = bounds
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __iter__(self) -> Iterator[int]:
+        i: int = 0
+
+        while i < len(self._lengths):
+            length: int = self._lengths[i]
+            yield length
+            i = bisect_right(self._lengths, length, i)
+
+    def __getitem__(self, length: int) -> _LengthPostings:
+        start: int = bisect_left(self._lengths, length)
+        end: int = bisect_right(self._lengths, length, start)
+
+        if start == end:
+            raise KeyError(length)
+
+        return _LengthPostings(self, start, end)
+
+    def _key(self, i: int) -> str:
+        """Decodes the n-gram of an entry of the directory.
+
+        Parameters
+        ----------
+        i : int
+            The entry.
+
+        Returns
+        -------
+        str
+            The n-gram.
+        """
+        return str(
+            self._keys[self._key_offsets[i] : self._key_offsets[i + 1]],
+            "utf-8",
+            _ERRORS,
+        )
+
+    def _bounds(self, i: int) -> Tuple[int, int]:
+        """Returns the start and end of the postings of an entry of the directory.
+
+        Parameters
+        ----------
+        i : int
+            The entry.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The start and end of the postings.
+        """
+        return self._ranges[2 * i], self._ranges[2 * i + 1]
+
+
+def _write_index(
+    path: str,
+    ratio: Ratio,
+    string_list: Sequence[str],
+    prepared_list: Sequence[Optional[str]],
+    ngram_size: int,
+    postings: Mapping[int, Mapping[str, Tuple[int, int]]],
+    positions: Sequence[int],
+    counts: Sequence[int],
+) -> None:
+    """Writes a prepared index to a file.
+    Only meant for internal usage.
+
+    The file starts with the magic bytes, the length of the header and the header itself,
+    which is JSON with the settings and where every section starts.
+    The sections contain the strings and the prepared strings, each concatenated with an array of their offsets,
+    and the n-gram postings as arrays of 32 bit positions and counts. The directory of the postings
+    is sorted by the length of the strings and the n-gram, so they can be looked up with a binary search.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file to write.
+    ratio : Ratio
+        The Ratio class the index was prepared with.
+    string_list : Sequence[str]
+        The strings of the index, non-strings are written as None.
+    prepared_list : Sequence[Optional[str]]
+        The prepared strings of the index.
+    ngram_size : int
+        The length of the n-grams of the postings.
+    postings : Mapping[int, Mapping[str, Tuple[int, int]]]
+        The start and end of the postings of every n-gram, for every length of string.
+    positions : Sequence[int]
+        The positions of the strings of the postings.
+    counts : Sequence[int]
+        How often the n-grams appear in the strings of the postings.
+    """
+    entries: List[Tuple[int, str, Tuple[int, int]]] = sorted(
+        (length, ngram, bounds)
+        for length, length_postings in postings.items()
+        for ngram, bounds in length_postings.items()
+    )
+    keys, key_offsets = _encode([ngram for _, ngram, _ in entries])
+    bounds: "array[int]" = array("Q")
+
+    for _, _, (start, end) in entries:
+        bounds.extend([start, end])
+
+    sections: Dict[str, bytes] = {
+        **_string_sections(string_list, prepared_list),
+        "postings_lengths": array("Q", [length for length, _, _ in entries]).tobytes(),
+        "postings_keys": keys,
+        "postings_key_offsets": key_offsets,
+        "postings_bounds": bounds.tobytes(),
+        "postings_positions": array("I", positions).tobytes(),
+        "postings_counts": array("I", counts).tobytes(),
+    }
+
+    layout: Dict[str, List[int]] = {}
+    offset: int = 0
+
+    for name, data in sections.items():
+        layout[name] = [offset, len(data)]
+        offset += -(-len(data) // _ALIGNMENT) * _ALIGNMENT
+
+    header: bytes = json.dumps(
+        {
+            "settings": _settings(ratio),
+            "count": len(string_list),
+            "ngram_size": ngram_size,
+            "byteorder": sys.byteorder,
+            "sections": layout,
+        }
+    ).encode("utf-8")
+    header += b" " * (-(len(_MAGIC) + 8 + len(header)) % _ALIGNMENT)
+
+    with open(path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+
+        for data in sections.values():
+            f.write(data)
+            f.write(b"\0" * (-len(data) % _ALIGNMENT))
+
+
+def _read_index(path: str, ratio: Ratio) -> Tuple[
+    Sequence[Any],
+    Sequence[Optional[str]],
+    List[int],
+    int,
+    _Postings,
+    Sequence[int],
+    Sequence[int],
+]:
+    """Reads a prepared index from a file, written by `_write_index`.
+    Only meant for internal usage.
+
+    The file is memory-mapped, and everything but the lengths of the prepared strings is used in place.
+    The strings are only decoded when they are needed, and the postings of an n-gram are looked up
+    in the directory when a search needs them, so only what is searched is read from the disk,
+    and processes that read the same file share the memory.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file to read.
+    ratio : Ratio
+        The Ratio class the index is going to be used with.
+
+    Returns
+    -------
+    Tuple[Sequence[Any], Sequence[Optional[str]], List[int], int, _Postings, Sequence[int], Sequence[int]]
+        The strings and the prepared strings, both with None for non-strings,
+        the lengths of the prepared strings, the length of the n-grams,
+        the start and end of the postings of every n-gram, and the positions and counts of the postings.
+
+    Raises
+    ------
+    ValueError
+        If the file is not an index file, or it was built with different settings.
+    """
+    with open(path, "rb") as f:
+        buffer: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view: memoryview = memoryview(buffer)
+
+    if bytes(view[: len(_MAGIC)]) != _MAGIC:
+        raise ValueError(
+            "The file is not a stringmatch index, or it was written by a different version."
+        )
+
+    header_length: int = int.from_bytes(view[len(_MAGIC) : len(_MAGIC) + 8], "little")
+    start: int = len(_MAGIC) + 8 + header_length
+    header: Dict[str, Any] = json.loads(
+        bytes(view[len(_MAGIC) + 8 : start]).decode("utf-8")
+    )
+
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError(
+            "The index was written on a machine with a different byte order."
+        )
+
+    if header["settings"] != _settings(ratio):
+        raise ValueError(
+            f"The index was built with different settings: {header['settings']}"
+        )
+
+    def section(name: str) -> memoryview:
+        offset, size = header["sections"][name]
+        return view[start + offset : start + offset + size]
+
+    string_list, prepared_list = _read_strings(section)
+
+    return (
+        string_list,
+        prepared_list,
+        section("prepared_lengths").cast("Q").tolist(),
+        header["ngram_size"],
+        _Postings(
+            section("postings_lengths").cast("Q"),
+            section("postings_keys"),
+            section("postings_key_offsets").cast("Q"),
+            section("postings_bounds").cast("Q"),
+        ),
+        section("postings_positions").cast("I"),
+        section("postings_counts").cast("I"),
+    )
@@ -1,7 +1,311 @@
-from typing import List, Optional, Tuple, Type
+import heapq
+from array import array
+from itertools import chain
+from threading import Lock
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
 
-from stringmatch.ratio import Ratio
+from stringmatch.cache import LRUCache
+from stringmatch.index import MatchIndex, _length_buckets
+from stringmatch.mutable import MutableMatchIndex
+from stringmatch.ratio import _CHUNK_SIZE, Ratio, _chunks
 from stringmatch.scorer import BaseScorer, LevenshteinScorer
+from stringmatch.stats import Stats
+
+if TYPE_CHECKING:  # pragma: no cover
+    from stringmatch.sharded import ShardedMatchIndex
+
+
+def _take(items: Sequence[Any], positions: Sequence[int]) -> List[Any]:
+    """Returns the items at the positions of a chunk.
+    Only meant for internal usage.
+
+    Lists are read directly, the strings of a loaded index are read through the Sequence interface.
+
+    Parameters
+    ----------
+    items : Sequence[Any]
+        The items.
+    positions : Sequence[int]
+        The positions of the items to read, a range reads a slice of the items.
+
+    Returns
+    -------
+    List[Any]
+        The items of the chunk.
+    """
+    if isinstance(positions, range):
+        if isinstance(items, list):
+            return items[positions.start : positions.stop]
+        return list(items[positions.start : positions.stop])
+
+    # mypyc only reads lists without boxing the positions once it knows they are lists.
+    if isinstance(items, list):
+        return [items[p] for p in positions]
+    return [items[p] for p in positions]
+
+
+class _BestMatches:
+    """Keeps the best matches while a list of strings gets scored in chunks.
+    Only meant for internal usage.
+
+    The matches are sorted by their score, then by the character difference to the string,
+    then by their length, and lastly by the order they appear in the list.
+    If there is a limit, only that many matches are kept on a heap while scoring,
+    and the cutoff rises to the worst kept score once the heap is full.
+    Strings that cannot reach the cutoff because of their length are skipped without scoring them.
+    """
+
+    def __init__(
+        self,
+        ratio: Ratio,
+        string: Optional[str],
+        *,
+        score: int,
+        limit: Optional[int],
+        prepared_string: Optional[str] = None,
+        pruned_cutoff: int = 0,
+    ) -> None:
+        """Initialise the _BestMatches class.
+
+        Parameters
+        ----------
+        ratio : Ratio
+            The Ratio class used for preparing and scoring.
+        string : Optional[str]
+            The string to compare, None for non-strings, which get a score of 0.
+        score : int
+            The cutoff for the score.
+        limit : Optional[int]
+            The number of matches to keep, or None for every match.
+        prepared_string : Optional[str], optional
+            The already prepared string, by default None (gets prepared here).
+        pruned_cutoff : int, optional
+            The cutoff the strings were already skipped by their length with, by default 0.
+            Strings only get skipped here once the cutoff rises above it.
+        """
+        self.ratio: Ratio = ratio
+        self.limit: Optional[int] = limit
+        self.cutoff: int = score
+        self.pruned_cutoff: int = pruned_cutoff
+
+        self.length: Optional[int] = None
+
+        # Non-strings get a score of 0, and go to the back of the list.
+        if isinstance(string, str):
+            if prepared_string is None:
+                prepared_string = ratio._prepare_string(string)
+            self.length = len(string)
+        else:
+            prepared_string = ""
+
+        self.prepared_string: str = prepared_string
+
+        # The sort key of every match is: (score, -character difference, length, -position).
+        self.matches: List[Tuple[int, float, float, int]] = []
+        # The strings of the matches, by their position.
+        self.strings: Dict[int, str] = {}
+
+        # If strings of a prepared length can reach the current cutoff, and how many strings were skipped.
+        self.bounds: Dict[int, bool] = {}
+        self.pruned: int = 0
+
+    def score_chunk(
+        self,
+        chunk: List[str],
+        prepared_chunk: Optional[List[Optional[str]]] = None,
+    ) -> List[int]:
+        """Scores a chunk of strings with the current cutoff, without keeping any of them.
+
+        Parameters
+        ----------
+        chunk : List[str]
+            The strings to score.
+        prepared_chunk : Optional[List[Optional[str]]], optional
+            The already prepared strings, with None for non-strings.
+            By default None (the strings get prepared here).
+
+        Returns
+        -------
+        List[int]
+            The scores between 0 and 100, scores below the cutoff may be 0 instead.
+        """
+        ratio: Ratio = self.ratio
+
+        if prepared_chunk is None:
+            prepared_chunk = ratio._prepare_list(chunk)
+
+        # Strings whose length alone keeps them from reaching the cutoff are not scored.
+        if self.prepared_string and self.cutoff > self.pruned_cutoff:
+            bounds: Dict[int, bool] = self.bounds
+            lengths: List[int] = [len(p) if p else 0 for p in prepared_chunk]
+            distinct: Set[int] = set(lengths)
+
+            for l in distinct:
+                if l not in bounds:
+                    # Empty strings and non-strings are skipped later on anyways.
+                    bounds[l] = not l or ratio._can_reach(
+                        len(self.prepared_string), l, self.cutoff
+                    )
+
+            if not all(bounds[l] for l in distinct):
+                self.pruned += sum(1 for l in lengths if not bounds[l])
+                prepared_chunk = [
+                    p if bounds[l] else None for p, l in zip(prepared_chunk, lengths)
+                ]
+
+        return ratio._prepared_ratio_list(
+            self.prepared_string, prepared_chunk, self.cutoff
+        )
+
+    def add_chunk(
+        self,
+        positions: Sequence[int],
+        chunk: List[str],
+        prepared_chunk: Optional[List[Optional[str]]] = None,
+    ) -> None:
+        """Scores a chunk of strings, and keeps the ones good enough.
+
+        Parameters
+        ----------
+        positions : Sequence[int]
+            The positions of the strings in the whole list.
+        chunk : List[str]
+            The strings to score.
+        prepared_chunk : Optional[List[Optional[str]]], optional
+            The already prepared strings, with None for non-strings.
+            By default None (the strings get prepared here).
+        """
+        scores: List[int] = self.score_chunk(chunk, prepared_chunk)
+
+        stats: Optional[Stats] = self.ratio.stats
+        start: float = perf_counter() if stats is not None else 0.0
+        kept: int = 0
+
+        for i, r in enumerate(scores):
+            if r >= self.cutoff and self._keep(positions[i], chunk[i], r):
+                kept += 1
+
+        if stats is not None:
+            stats._record("sort", kept, perf_counter() - start)
+
+        self._raise_cutoff()
+
+    def merge(self, matches: Iterable[Tuple[int, str, int]]) -> None:
+        """Keeps the matches that were already scored somewhere else, if they are good enough.
+
+        Parameters
+        ----------
+        matches : Iterable[Tuple[int, str, int]]
+            The positions of the matches in the whole list, the matches and their score.
+        """
+        for position, s, r in matches:
+            if r >= self.cutoff:
+                self._keep(position, s, r)
+
+        self._raise_cutoff()
+
+    def _keep(self, position: int, s: str, r: int) -> bool:
+        """Keeps a match, if it is one of the best `limit` matches so far.
+
+        Parameters
+        ----------
+        position : int
+            The position of the match in the whole list.
+        s : str
+            The match.
+        r : int
+            The score of the match, at least the cutoff.
+
+        Returns
+        -------
+        bool
+            If the match was kept.
+        """
+        limit: Optional[int] = self.limit
+        matches: List[Tuple[int, float, float, int]] = self.matches
+
+        key: Tuple[int, float, float, int] = (
+            r,
+            (
+                -abs(self.length - len(s))
+                if self.length is not None and isinstance(s, str)
+                else float("-inf")
+            ),
+            len(s) if isinstance(s, str) else float("-inf"),
+            -position,
+        )
+
+        if limit is None or len(matches) < limit:
+            if limit is None:
+                matches.append(key)
+            else:
+                heapq.heappush(matches, key)
+        elif key > matches[0]:
+            del self.strings[-heapq.heapreplace(matches, key)[3]]
+        else:
+            return False
+
+        self.strings[position] = s
+
+        return True
+
+    def _raise_cutoff(self) -> None:
+        """Raises the cutoff to the worst kept score, once there are `limit` matches."""
+        # Once we have enough matches, only strings at least as good as the worst one can get in.
+        matches: List[Tuple[int, float, float, int]] = self.matches
+
+        if (
+            self.limit is not None
+            and len(matches) == self.limit
+            and matches[0][0] > self.cutoff
+        ):
+            self.cutoff = matches[0][0]
+            self.bounds.clear()
+
+    def result(self) -> List[Tuple[str, int]]:
+        """Returns the matches kept so far, the best match comes first.
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            The best matches and their score.
+        """
+        return [(s, r) for _, s, r in self.result_with_positions()]
+
+    def result_with_positions(self) -> List[Tuple[int, str, int]]:
+        """Same as result, but also returns the positions of the matches.
+
+        Returns
+        -------
+        List[Tuple[int, str, int]]
+            The positions of the best matches, the matches and their score.
+        """
+        stats: Optional[Stats] = self.ratio.stats
+        start: float = perf_counter() if stats is not None else 0.0
+
+        result: List[Tuple[int, str, int]] = [
+            (-m[3], self.strings[-m[3]], m[0])
+            for m in sorted(self.matches, reverse=True)
+        ]
+
+        if stats is not None:
+            stats._record("sort", 0, perf_counter() - start)
+
+        return result
 
 
 class Match:
@@ -16,6 +320,10 @@ class Match:
         remove_punctuation: bool = False,
         alphanumeric: bool = False,
         include_partial: bool = False,
+        cache_size: int = 0,
+        stats: Optional[Stats] = None,
+        result_cache_size: int = 0,
+        result_cache_ttl: Optional[float] = None,
     ) -> None:
         """Initialise the Match class with the given parameters.
 
@@ -34,6 +342,19 @@ class Match:
             If the strings should only be compared by their latin letters, by default False.
         include_partial : bool, optional
             If partial substring matches should be included, by default False.
+        cache_size : int, optional
+            How many results of latinising strings to cache, by default 0 (no caching).
+            The cache is available as the `cache` attribute, with its hits, misses and evictions.
+        stats : Optional[Stats], optional
+            Counts what gets done and times every stage, by default None (nothing gets counted).
+            See the Stats class for the stages.
+        result_cache_size : int, optional
+            How many results of searches of a MatchIndex or MutableMatchIndex to cache, by default 0 (no caching).
+            A search of the same index with the same string, cutoff score and limit returns the cached result.
+            Searches of plain lists are never cached, a list can change at any time without the cache noticing.
+            The cache is available as the `result_cache` attribute, with its hits, misses and evictions.
+        result_cache_ttl : Optional[float], optional
+            How many seconds a result is cached for, by default None (until it gets evicted).
 
         Returns
         -------
@@ -50,6 +371,324 @@ class Match:
         self.remove_punctuation: bool = remove_punctuation
         self.alphanumeric: bool = alphanumeric
         self.include_partial: bool = include_partial
+        self.cache: Optional[LRUCache[str, str]] = (
+            LRUCache(cache_size) if cache_size > 0 else None
+        )
+        self.stats: Optional[Stats] = stats
+        self.result_cache: Optional[
+            LRUCache[Tuple[Any, ...], List[Tuple[str, int]]]
+        ] = (
+            LRUCache(result_cache_size, ttl=result_cache_ttl)
+            if result_cache_size > 0
+            else None
+        )
+
+        # How many strings were skipped while searching, because they could not reach the cutoff score.
+        self.pruned: int = 0
+        self._lock: Lock = Lock()
+
+    def _get_ratio(self) -> Ratio:
+        """Constructs the Ratio class with the current settings of this class.
+        Only meant for internal usage.
+
+        Returns
+        -------
+        Ratio
+            The Ratio class with the same settings.
+        """
+        ratio: Ratio = Ratio(
+            scorer=self.scorer,
+            latinise=self.latinise,
+            ignore_case=self.ignore_case,
+            remove_punctuation=self.remove_punctuation,
+            alphanumeric=self.alphanumeric,
+            include_partial=self.include_partial,
+        )
+        # The cache and the stats are shared with every Ratio class we construct.
+        ratio.cache = self.cache
+        ratio.stats = self.stats
+
+        return ratio
+
+    def _count_pruned(self, pruned: int) -> None:
+        """Adds to the number of strings that were skipped while searching.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        pruned : int
+            The number of strings that were skipped.
+        """
+        with self._lock:
+            self.pruned += pruned
+
+        if self.stats is not None:
+            self.stats._record("pruned", pruned)
+
+    def _cached_search(
+        self,
+        key: Optional[Tuple[Any, ...]],
+        search: Callable[[], List[Tuple[str, int]]],
+    ) -> List[Tuple[str, int]]:
+        """Returns the result of a search from the result cache, or searches and caches the result.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        key : Optional[Tuple[Any, ...]]
+            The key of the search in the result cache, or None if it cannot be cached.
+        search : Callable[[], List[Tuple[str, int]]]
+            Searches for the matches.
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            The matches found, a new list every time.
+        """
+        cache: Optional[LRUCache[Tuple[Any, ...], List[Tuple[str, int]]]] = (
+            self.result_cache
+        )
+
+        if cache is None or key is None:
+            return search()
+
+        matches: Optional[List[Tuple[str, int]]] = cache.get(key)
+
+        if self.stats is not None:
+            self.stats._record(
+                "result_cache_misses" if matches is None else "result_cache_hits", 1
+            )
+
+        if matches is None:
+            matches = search()
+            cache.put(key, matches)
+
+        # The cached list must not change if the caller changes the list we return.
+        return list(matches)
+
+    def _best_matches(
+        self,
+        ratio: Ratio,
+        string: Optional[str],
+        string_list: Sequence[Any],
+        prepared_list: Optional[Sequence[Optional[str]]],
+        *,
+        score: int,
+        limit: Optional[int],
+        indices: Optional[List[List[int]]] = None,
+        prepared_string: Optional[str] = None,
+        pruned_cutoff: int = 0,
+        key: Optional[Callable[[Any], str]] = None,
+    ) -> Tuple[List[Tuple[int, str, int]], int]:
+        """Scores the strings in chunks and returns the best matches, the best match comes first.
+        See `_BestMatches` for how the matches are kept and sorted.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        ratio : Ratio
+            The Ratio class used for preparing and scoring.
+        string : Optional[str]
+            The string to compare, None for non-strings, which get a score of 0.
+        string_list : Sequence[Any]
+            The List of strings to compare to, or of records if there is a key.
+        prepared_list : Optional[Sequence[Optional[str]]]
+            The already prepared strings of the list, with None for non-strings.
+            If None, the strings get prepared while scoring.
+        score : int
+            The cutoff for the score.
+        limit : Optional[int]
+            The number of matches to return, or None for every match.
+        indices : Optional[List[List[int]]], optional
+            The positions of the strings in the list to score, in any number of lists
+            that are scored one after another, by default None (every string).
+        prepared_string : Optional[str], optional
+            The already prepared string, by default None (gets prepared here).
+        pruned_cutoff : int, optional
+            The cutoff the strings were already skipped by their length with, by default 0.
+            Strings only get skipped here once the cutoff rises above it.
+        key : Optional[Callable[[Any], str]], optional
+            Returns the string of a record, by default None (the list contains the strings).
+            Only called for the records of one chunk at a time.
+
+        Returns
+        -------
+        Tuple[List[Tuple[int, str, int]], int]
+            The positions of the best matches in the list, the matches and their score,
+            and the number of strings that were skipped without scoring them.
+        """
+        best: _BestMatches = _BestMatches(
+            ratio,
+            string,
+            score=score,
+            limit=limit,
+            prepared_string=prepared_string,
+            pruned_cutoff=pruned_cutoff,
+        )
+
+        total: int = len(string_list)
+        position_chunks: Iterator[Sequence[int]]
+
+        if indices is None:
+            position_chunks = (
+                range(start, min(start + _CHUNK_SIZE, total))
+                for start in range(0, total, _CHUNK_SIZE)
+            )
+        else:
+            position_chunks = _chunks(chain.from_iterable(indices), _CHUNK_SIZE)
+
+        for positions in position_chunks:
+            records: List[Any] = _take(string_list, positions)
+            # The records are only typed as strings once the key returned them, mypyc checks the types.
+            chunk: List[str] = (
+                records if key is None else [key(item) for item in records]
+            )
+
+            prepared_chunk: Optional[List[Optional[str]]] = None
+
+            if prepared_list is not None:
+                prepared_chunk = _take(prepared_list, positions)
+
+            best.add_chunk(positions, chunk, prepared_chunk)
+
+        return best.result_with_positions(), best.pruned
+
+    def index(self, string_list: List[str], *, ngram_size: int = 0) -> MatchIndex:
+        """Prepares a list of strings once, so that it can be searched many times
+        without modifying every string again on every search.
+        The index uses the current settings of this class.
+
+        Parameters
+        ----------
+        string_list : List[str]
+            The List of strings to prepare.
+        ngram_size : int, optional
+            The length of the n-grams to build an inverted index of, by default 0 (no n-gram index).
+            See the MatchIndex class for more information.
+
+        Returns
+        -------
+        MatchIndex
+            The prepared index of the strings.
+
+        Examples
+        --------
+        >>> index = Match().index(["strmatch", "test", "something else"])
+        >>> index.get_best_match("stringmatch")
+        'strmatch'
+        """
+        return MatchIndex(self, string_list, ngram_size=ngram_size)
+
+    def mutable_index(
+        self, string_list: List[str], *, ngram_size: int = 0
+    ) -> MutableMatchIndex:
+        """Prepares a list of strings once, like `index()`, but strings can be added, removed and changed afterwards,
+        while the index is searched from many threads. The index uses the current settings of this class.
+
+        Parameters
+        ----------
+        string_list : List[str]
+            The List of strings to prepare.
+        ngram_size : int, optional
+            The length of the n-grams to build an inverted index of, by default 0 (no n-gram index).
+            See the MatchIndex class for more information.
+
+        Returns
+        -------
+        MutableMatchIndex
+            The prepared index of the strings.
+
+        Examples
+        --------
+        >>> index = Match().mutable_index(["strmatch", "test"])
+        >>> index.add("something else")
+        2
+        >>> index.remove(0)
+        >>> index.get_best_match("stringmatch")
+        """
+        return MutableMatchIndex(self, string_list, ngram_size=ngram_size)
+
+    def sharded_index(
+        self, string_list: List[str], *, shards: int = -1, ngram_size: int = 0
+    ) -> "ShardedMatchIndex":
+        """Splits a list of strings into shards, which are searched in parallel by worker processes.
+        The prepared strings are handed to the worker processes through shared memory.
+        The index uses the current settings of this class.
+
+        Parameters
+        ----------
+        string_list : List[str]
+            The List of strings to split into shards.
+        shards : int, optional
+            The number of shards and worker processes, by default -1 (one per CPU core).
+        ngram_size : int, optional
+            The length of the n-grams to build an inverted index of in every shard, by default 0 (no n-gram index).
+            See the MatchIndex class for more information.
+
+        Returns
+        -------
+        ShardedMatchIndex
+            The sharded index of the strings, call `close()` on it once you are done.
+
+        Examples
+        --------
+        >>> with Match().sharded_index(["strmatch", "test", "something else"], shards=2) as index:
+        ...     index.get_best_match("stringmatch")
+        'strmatch'
+        """
+        # Only imported when it is needed, since it imports multiprocessing.
+        from stringmatch.sharded import ShardedMatchIndex
+
+        return ShardedMatchIndex(
+            self, string_list, shards=shards, ngram_size=ngram_size
+        )
+
+    def load_index(self, path: str) -> MatchIndex:
+        """Loads an index saved with `MatchIndex.save()`.
+        The file is memory-mapped, so loading is fast: the strings are only read from the disk and decoded
+        when they are needed, and so are the n-grams a search looks up. Processes that load the same file share its memory.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file to load.
+
+        Returns
+        -------
+        MatchIndex
+            The loaded index, which uses the current settings of this class.
+
+        Raises
+        ------
+        ValueError
+            If the file is not an index, or the index was saved with different settings than this class.
+
+        Examples
+        --------
+        >>> Match().index(["strmatch", "test", "something else"], ngram_size=3).save("strings.idx")
+        >>> index = Match().load_index("strings.idx")
+        >>> index.get_best_match("stringmatch")
+        'strmatch'
+        """
+        # The file format is only imported when it is needed, since it imports json.
+        from stringmatch.indexfile import _read_index
+
+        string_list, prepared_list, lengths, ngram_size, postings, positions, counts = (
+            _read_index(path, self._get_ratio())
+        )
+
+        # The strings and the n-gram index are read from the file when they are needed, instead of preparing them again.
+        index: MatchIndex = MatchIndex(self, [])
+        index.string_list = string_list
+        index.prepared_list = prepared_list
+        index.lengths = lengths
+        index._length_buckets = _length_buckets(lengths)
+        index.ngram_size = ngram_size
+        index._postings = postings
+        index._positions = positions
+        index._counts = counts
+
+        return index
 
     def match(self, string1: str, string2: str, *, score: int = 70) -> bool:
         """Matches two strings, returns True if they are similar enough.
@@ -75,7 +714,9 @@ class Match:
         >>> match("stringmatch", "something different")
         False
         """
-        return self.match_with_ratio(string1, string2, score=score)[0]
+        r: int = self._get_ratio().ratio(string1, string2, score_cutoff=score)
+
+        return r >= score
 
     def match_with_ratio(
         self, string1: str, string2: str, *, score: int = 70
@@ -103,14 +744,7 @@ class Match:
         >>> match_with_ratio("stringmatch", "something different")
         (False, 40)
         """
-        r: int = Ratio(
-            scorer=self.scorer,
-            latinise=self.latinise,
-            ignore_case=self.ignore_case,
-            remove_punctuation=self.remove_punctuation,
-            alphanumeric=self.alphanumeric,
-            include_partial=self.include_partial,
-        ).ratio(string1, string2)
+        r: int = self._get_ratio().ratio(string1, string2)
 
         return (r >= score, r)
 
@@ -168,32 +802,8 @@ class Match:
         >>> get_best_match_with_ratio("stringmatch", ["strmatch", "test", "something else"])
         ('strmatch', 84)
         """
-        ratio: Ratio = Ratio(
-            scorer=self.scorer,
-            latinise=self.latinise,
-            remove_punctuation=self.remove_punctuation,
-            ignore_case=self.ignore_case,
-            alphanumeric=self.alphanumeric,
-            include_partial=self.include_partial,
-        )
-
-        matches: List[Tuple[str, int]] = sorted(
-            # We only add the entry to the list if the ratio is above the cutoff score.
-            [(s, r) for s in string_list if (r := ratio.ratio(string, s)) >= score],
-            key=lambda x: (
-                # We first sort the list by the score.
-                x[1],
-                # Then we sort the list by the character difference.
-                -abs(
-                    len(string) - len(x[0])
-                    if all(isinstance(c, str) for c in [x[0], string])
-                    else float("-inf")
-                ),
-                # And lastly we sort it by the length of the string.
-                len(x[0]) if isinstance(x[0], str) else float("-inf"),
-                # If all of these are tied, the list is sorted by order of how they appear in the original list.
-            ),
-            reverse=True,
+        matches: List[Tuple[str, int]] = self.get_best_matches_with_ratio(
+            string, string_list, score=score, limit=1
         )
 
         return (matches[0]) if matches else None
@@ -280,26 +890,415 @@ class Match:
         if limit is not None and limit < 1:
             limit = None
 
-        ratio: Ratio = Ratio(
-            scorer=self.scorer,
-            latinise=self.latinise,
-            remove_punctuation=self.remove_punctuation,
-            ignore_case=self.ignore_case,
-            alphanumeric=self.alphanumeric,
-            include_partial=self.include_partial,
+        matches, pruned = self._best_matches(
+            self._get_ratio(), string, string_list, None, score=score, limit=limit
         )
+        self._count_pruned(pruned)
 
-        # This is the same sorting as in the get_best_match_with_ratio function.
-        return sorted(
-            [(s, r) for s in string_list if (r := ratio.ratio(string, s)) >= score],
-            key=lambda x: (
-                x[1],
-                -abs(
-                    len(string) - len(x[0])
-                    if all(isinstance(c, str) for c in [x[0], string])
-                    else float("-inf")
-                ),
-                len(x[0]) if isinstance(x[0], str) else float("-inf"),
-            ),
-            reverse=True,
-        )[:limit]
+        return [(s, r) for _, s, r in matches]
+
+    def get_best_match_with_index(
+        self,
+        string: str,
+        string_list: List[Any],
+        *,
+        score: int = 70,
+        key: Optional[Callable[[Any], str]] = None,
+    ) -> Optional[Tuple[int, int]]:
+        """Same as get_best_match_with_ratio, but returns the position of the best match in the list instead of the string.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_list : List[Any]
+            The List of strings to compare to, or of records if there is a key.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        key : Optional[Callable[[Any], str]], optional
+            Returns the string to compare of every record, by default None (the list contains the strings).
+
+        Returns
+        -------
+        Optional[Tuple[int, int]]
+            The position of the best match and its score, or None if no good match was found.
+
+        Examples
+        --------
+        >>> get_best_match_with_index("stringmatch", [{"name": "test"}, {"name": "strmatch"}], key=lambda r: r["name"])
+        (1, 84)
+        """
+        matches: List[Tuple[int, int]] = self.get_best_matches_with_index(
+            string, string_list, score=score, limit=1, key=key
+        )
+
+        return matches[0] if matches else None
+
+    def get_best_matches_with_index(
+        self,
+        string: str,
+        string_list: List[Any],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+        key: Optional[Callable[[Any], str]] = None,
+    ) -> List[Tuple[int, int]]:
+        """Same as get_best_matches_with_ratio, but returns the positions of the matches in the list instead of the strings.
+        With a key, the list can contain any records, for example dicts or objects,
+        and the key returns the string to compare of every record.
+        The key is only called for one chunk of records at a time, so no list of strings gets built.
+        Records with the same string keep their own positions.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_list : List[Any]
+            The List of strings to compare to, or of records if there is a key.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+        key : Optional[Callable[[Any], str]], optional
+            Returns the string to compare of every record, by default None (the list contains the strings).
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            The positions of the matches found and their score, the best match comes first.
+
+        Examples
+        --------
+        >>> records = [{"name": "strmatch"}, {"name": "test"}, {"name": "stringmatch"}]
+        >>> get_best_matches_with_index("stringmatch", records, key=lambda r: r["name"])
+        [(2, 100), (0, 84)]
+        """
+        if limit is not None and limit < 1:
+            limit = None
+
+        matches, pruned = self._best_matches(
+            self._get_ratio(),
+            string,
+            string_list,
+            None,
+            score=score,
+            limit=limit,
+            key=key,
+        )
+        self._count_pruned(pruned)
+
+        return [(p, r) for p, _, r in matches]
+
+    def iter_matches(
+        self,
+        string: str,
+        string_iter: Iterable[Any],
+        *,
+        score: int = 70,
+        key: Optional[Callable[[Any], str]] = None,
+    ) -> Iterator[Tuple[int, str, int]]:
+        """Matches a string to the strings of any iterable, and yields every match as it is found.
+        The strings are read lazily in chunks, so only one chunk is kept in memory at a time,
+        no matter how many strings there are.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_iter : Iterable[Any]
+            The strings to compare to, for example a generator or an open file.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        key : Optional[Callable[[Any], str]], optional
+            Returns the string to compare of every item, by default None (the items are the strings).
+            Use it to match records, for example the rows of `csv.DictReader`.
+
+        Returns
+        -------
+        Iterator[Tuple[int, str, int]]
+            The position in the iterable, the string and the score of every match,
+            in the order of the iterable.
+
+        Examples
+        --------
+        >>> list(iter_matches("stringmatch", iter(["test", "strmatch", "stringmatch"])))
+        [(1, 'strmatch', 84), (2, 'stringmatch', 100)]
+        """
+        best: _BestMatches = _BestMatches(
+            self._get_ratio(), string, score=score, limit=None
+        )
+        position: int = 0
+
+        try:
+            for chunk in _chunks(string_iter, _CHUNK_SIZE):
+                if key is not None:
+                    chunk = [key(item) for item in chunk]
+
+                for i, r in enumerate(best.score_chunk(chunk)):
+                    if r >= score:
+                        yield position + i, chunk[i], r
+
+                position += len(chunk)
+        finally:
+            self._count_pruned(best.pruned)
+
+    def stream_best_matches(
+        self,
+        string: str,
+        string_iter: Iterable[Any],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+        key: Optional[Callable[[Any], str]] = None,
+    ) -> List[Tuple[int, str, int]]:
+        """Same as get_best_matches_with_ratio, but reads the strings lazily from any iterable.
+        The strings are read in chunks and only the best `limit` matches are kept on a heap,
+        so the memory used does not grow with the number of strings.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_iter : Iterable[Any]
+            The strings to compare to, for example a generator or an open file.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None,
+            then every match is kept in memory.
+        key : Optional[Callable[[Any], str]], optional
+            Returns the string to compare of every item, by default None (the items are the strings).
+
+        Returns
+        -------
+        List[Tuple[int, str, int]]
+            The position in the iterable, the string and the score of the best matches,
+            the best match comes first.
+
+        Examples
+        --------
+        >>> stream_best_matches("stringmatch", iter(["test", "strmatch", "stringmatch"]))
+        [(2, 'stringmatch', 100), (1, 'strmatch', 84)]
+        """
+        if limit is not None and limit < 1:
+            limit = None
+
+        best: _BestMatches = _BestMatches(
+            self._get_ratio(), string, score=score, limit=limit
+        )
+        position: int = 0
+
+        for chunk in _chunks(string_iter, _CHUNK_SIZE):
+            if key is not None:
+                chunk = [key(item) for item in chunk]
+
+            best.add_chunk(range(position, position + len(chunk)), chunk)
+            position += len(chunk)
+
+        self._count_pruned(best.pruned)
+
+        return best.result_with_positions()
+
+    def get_best_matches_many(
+        self,
+        strings: List[str],
+        string_list: List[str],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+        workers: int = 1,
+    ) -> List[List[str]]:
+        """Same as get_best_matches, but matches many strings to the same list of strings at once.
+        The list of strings only gets prepared once.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        string_list : List[str]
+            The List of strings to compare to.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+        workers : int, optional
+            The number of threads to spread the strings across, by default 1.
+            Set this to -1 to use one thread per CPU core.
+
+        Returns
+        -------
+        List[List[str]]
+            The matches found for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> get_best_matches_many(["stringmatch", "tset"], ["strmatch", "test", "something else"])
+        [['strmatch'], ['test']]
+        """
+        return [
+            [m[0] for m in matches]
+            for matches in self.get_best_matches_many_with_ratio(
+                strings, string_list, score=score, limit=limit, workers=workers
+            )
+        ]
+
+    def get_best_matches_many_with_ratio(
+        self,
+        strings: List[str],
+        string_list: List[str],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+        workers: int = 1,
+    ) -> List[List[Tuple[str, int]]]:
+        """Same as get_best_matches_many, but returns lists of tuples with the best matches and their score.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        string_list : List[str]
+            The List of strings to compare to.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+        workers : int, optional
+            The number of threads to spread the strings across, by default 1.
+            Set this to -1 to use one thread per CPU core.
+
+        Returns
+        -------
+        List[List[Tuple[str, int]]]
+            The matches found and their score for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> get_best_matches_many_with_ratio(["stringmatch", "tset"], ["strmatch", "test", "something else"])
+        [[('strmatch', 84)], [('test', 75)]]
+        """
+        # The index only lives for this call, caching its results would only fill the result cache.
+        return self.index(string_list)._search_many(strings, score, limit, workers)
+
+    def find_duplicates(
+        self,
+        string_list: List[str],
+        *,
+        score: int = 70,
+        workers: int = 1,
+    ) -> List[List[str]]:
+        """Finds the groups of similar strings in a list, for example to deduplicate it.
+        Two strings are in the same group if they reach the cutoff score, or if they are connected by a chain of such strings.
+        Empty strings and non-strings are never part of a group.
+
+        Instead of comparing every string to every other string, every string is only compared
+        to the strings whose length can possibly reach the cutoff score. See `MatchIndex.find_duplicates()`.
+
+        Parameters
+        ----------
+        string_list : List[str]
+            The List of strings to search for duplicates in.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        workers : int, optional
+            The number of threads to use, by default 1.
+            -1 uses one thread per CPU core.
+
+        Returns
+        -------
+        List[List[str]]
+            The groups of at least two strings, in order of the list.
+
+        Examples
+        --------
+        >>> find_duplicates(["stringmatch", "test", "strmatch", "tset", "something else"])
+        [['stringmatch', 'strmatch'], ['test', 'tset']]
+        """
+        return self.index(string_list).find_duplicates(score=score, workers=workers)
+
+    def find_duplicates_with_ratio(
+        self,
+        string_list: List[str],
+        *,
+        score: int = 70,
+        workers: int = 1,
+    ) -> List[Tuple[str, str, int]]:
+        """Same as find_duplicates, but returns every pair of similar strings and their score instead of the groups.
+        The best pair comes first, the first string of every pair comes first in the list.
+
+        Parameters
+        ----------
+        string_list : List[str]
+            The List of strings to search for duplicates in.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        workers : int, optional
+            The number of threads to use, by default 1.
+            -1 uses one thread per CPU core.
+
+        Returns
+        -------
+        List[Tuple[str, str, int]]
+            The pairs of similar strings and their score.
+
+        Examples
+        --------
+        >>> find_duplicates_with_ratio(["stringmatch", "test", "strmatch", "tset", "something else"])
+        [('stringmatch', 'strmatch', 84), ('test', 'tset', 75)]
+        """
+        return self.index(string_list).find_duplicates_with_ratio(
+            score=score, workers=workers
+        )
+
+    def join(
+        self,
+        left: Iterable[str],
+        right: List[str],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 1,
+        ngram_size: int = 0,
+        workers: int = 1,
+    ) -> Tuple["array[int]", "array[int]", "array[int]"]:
+        """Matches every string of one list to the strings of another list, and returns the best matches of every string.
+        The right list is prepared only once, the left list is read lazily in chunks,
+        and the matches are returned as compact arrays. See `MatchIndex.join()`.
+
+        Parameters
+        ----------
+        left : Iterable[str]
+            The strings to match, for example a list, a generator or an open file.
+        right : List[str]
+            The List of strings to match them to.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 1.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+        ngram_size : int, optional
+            The length of the n-grams to build an inverted index of the right list with, by default 0 (no n-gram index).
+            See the MatchIndex class for more information.
+        workers : int, optional
+            The number of threads to use, by default 1.
+            -1 uses one thread per CPU core.
+
+        Returns
+        -------
+        Tuple[array[int], array[int], array[int]]
+            The positions of the strings in the left list, the positions of their matches in the right list,
+            and their score, as arrays of 64 bit, 32 bit and 8 bit unsigned integers.
+            The matches are in order of the left list, the best match of every string comes first.
+            Strings without any match do not appear at all.
+
+        Examples
+        --------
+        >>> join(["stringmatch", "nothing", "tset"], ["strmatch", "test", "something else"])
+        (array('Q', [0, 2]), array('I', [0, 1]), array('B', [84, 75]))
+        """
+        return self.index(right, ngram_size=ngram_size).join(
+            left, score=score, limit=limit, workers=workers
+        )
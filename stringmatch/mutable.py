@@ -0,0 +1,464 @@
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from stringmatch.index import MatchIndex
+
+if TYPE_CHECKING:  # pragma: no cover
+    from stringmatch.match import Match
+
+
+class MutableMatchIndex:
+    """Contains a prepared list of strings that can change, while it is searched from many threads."""
+
+    def __init__(
+        self, match: "Match", string_list: List[str], *, ngram_size: int = 0
+    ) -> None:
+        """Initialise the MutableMatchIndex class, preparing every string in the list once.
+        Usually constructed with `Match.mutable_index()`.
+
+        Strings can be added, removed and changed afterwards, which only prepares the new strings again.
+        Every change builds a new snapshot of the index, which shares everything that did not change
+        with the previous snapshot, and replaces it at once.
+        Searches use the snapshot from when they started, so they never wait for changes,
+        and never see half of a change. Changes wait for each other.
+
+        Every string keeps its position, removed strings leave a gap and added strings go to the end.
+
+        Parameters
+        ----------
+        match : Match
+            The Match class whose settings are used for preparing and searching.
+            Changing the settings of the Match class afterwards does not affect the index.
+        string_list : List[str]
+            The List of strings to prepare.
+        ngram_size : int, optional
+            The length of the n-grams to build an inverted index of, by default 0 (no n-gram index).
+            The n-gram index is kept up to date with every change, see the MatchIndex class for more information.
+
+        Returns
+        -------
+        MutableMatchIndex
+            The MutableMatchIndex class.
+
+        Examples
+        --------
+        >>> MutableMatchIndex(Match(latinise=True), ["strmatch", "test", "something else"])
+        """
+        self._index: MatchIndex = MatchIndex(match, string_list, ngram_size=ngram_size)
+        self._lock: Lock = Lock()
+
+        # Goes up by one with every change.
+        self.version: int = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def pruned(self) -> int:
+        """How many strings were skipped while searching, because they could not reach the cutoff score."""
+        return self._index.pruned
+
+    def snapshot(self) -> MatchIndex:
+        """Returns the current snapshot of the index, which never changes.
+        Use it to search many times without any changes in between,
+        or to use the other methods of the MatchIndex class. Removed strings are None in it.
+
+        Returns
+        -------
+        MatchIndex
+            The current snapshot.
+
+        Examples
+        --------
+        >>> index = Match().mutable_index(["strmatch", "test"])
+        >>> snapshot = index.snapshot()
+        >>> index.add("tset")
+        2
+        >>> len(snapshot)
+        2
+        """
+        return self._index
+
+    def _check(self, position: int) -> None:
+        """Checks that there is a string at a position.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        position : int
+            The position of the string.
+
+        Raises
+        ------
+        IndexError
+            If there is no string at the position, or it was removed.
+        """
+        index: MatchIndex = self._index
+
+        if not 0 <= position < len(index.string_list) or position in index._removed:
+            raise IndexError(f"There is no string at position {position}.")
+
+    def _check_strings(self, strings: List[str]) -> None:
+        """Checks that only strings get added to the index, None would remove the string at a position.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to add.
+
+        Raises
+        ------
+        TypeError
+            If one of the strings is not a string.
+        """
+        for string in strings:
+            if not isinstance(string, str):
+                raise TypeError(
+                    f"Only strings can be added to the index, not {type(string).__name__}."
+                )
+
+    def _change(self, changes: Dict[int, Any]) -> None:
+        """Applies changes to a new snapshot, and replaces the current snapshot with it.
+        Only meant for internal usage, call it while holding the lock.
+
+        Parameters
+        ----------
+        changes : Dict[int, Any]
+            The new string for every position, or None to remove the string.
+        """
+        self._index = self._index._updated(changes)
+        self.version += 1
+
+    def add(self, string: str) -> int:
+        """Adds a string to the end of the index.
+
+        Parameters
+        ----------
+        string : str
+            The string to add.
+
+        Returns
+        -------
+        int
+            The position of the string.
+
+        Raises
+        ------
+        TypeError
+            If the string is not a string.
+
+        Examples
+        --------
+        >>> add("stringmatch")
+        3
+        """
+        return self.add_many([string])[0]
+
+    def add_many(self, strings: List[str]) -> List[int]:
+        """Adds many strings to the end of the index, in a single change.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to add.
+
+        Returns
+        -------
+        List[int]
+            The positions of the strings.
+
+        Raises
+        ------
+        TypeError
+            If one of the strings is not a string.
+
+        Examples
+        --------
+        >>> add_many(["stringmatch", "tset"])
+        [3, 4]
+        """
+        self._check_strings(strings)
+
+        with self._lock:
+            start: int = len(self._index.string_list)
+            positions: List[int] = list(range(start, start + len(strings)))
+            self._change({p: s for p, s in zip(positions, strings)})
+
+        return positions
+
+    def remove(self, position: int) -> None:
+        """Removes the string at a position. The positions of the other strings stay the same.
+
+        Parameters
+        ----------
+        position : int
+            The position of the string.
+
+        Raises
+        ------
+        IndexError
+            If there is no string at the position, or it was already removed.
+
+        Examples
+        --------
+        >>> remove(1)
+        """
+        with self._lock:
+            self._check(position)
+            self._change({position: None})
+
+    def update(self, position: int, string: str) -> None:
+        """Replaces the string at a position.
+
+        Parameters
+        ----------
+        position : int
+            The position of the string.
+        string : str
+            The new string.
+
+        Raises
+        ------
+        IndexError
+            If there is no string at the position, or it was removed.
+        TypeError
+            If the string is not a string.
+
+        Examples
+        --------
+        >>> update(1, "tset")
+        """
+        self._check_strings([string])
+
+        with self._lock:
+            self._check(position)
+            self._change({position: string})
+
+    def get_best_match(self, string: str, *, score: int = 70) -> Optional[str]:
+        """Returns the best match from the current snapshot.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        Optional[str]
+            The best string found, or None if no good match was found.
+
+        Examples
+        --------
+        >>> get_best_match("stringmatch")
+        'strmatch'
+        """
+        return self._index.get_best_match(string, score=score)
+
+    def get_best_match_with_ratio(
+        self, string: str, *, score: int = 70
+    ) -> Optional[Tuple[str, int]]:
+        """Same as get_best_match, but returns a tuple with the best match and its score.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        Optional[Tuple[str, int]]
+            The best string and its score found, or None if no good match was found.
+
+        Examples
+        --------
+        >>> get_best_match_with_ratio("stringmatch")
+        ('strmatch', 84)
+        """
+        return self._index.get_best_match_with_ratio(string, score=score)
+
+    def get_best_matches(
+        self, string: str, *, score: int = 70, limit: Optional[int] = 5
+    ) -> List[str]:
+        """Returns the strings of the current snapshot that are similar to the string.
+        If there are more than `limit` matches,
+        only the `limit` best matches are returned, sorted by score.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[str]
+            All of the matches found.
+
+        Examples
+        --------
+        >>> get_best_matches("stringmatch")
+        ['strmatch']
+        """
+        return self._index.get_best_matches(string, score=score, limit=limit)
+
+    def get_best_matches_with_ratio(
+        self, string: str, *, score: int = 70, limit: Optional[int] = 5
+    ) -> List[Tuple[str, int]]:
+        """Same as get_best_matches, but returns a list of tuples with the best matches and their score.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            All of the matches found.
+
+        Examples
+        --------
+        >>> get_best_matches_with_ratio("stringmatch")
+        [('strmatch', 84)]
+        """
+        return self._index.get_best_matches_with_ratio(string, score=score, limit=limit)
+
+    def get_best_match_with_index(
+        self, string: str, *, score: int = 70
+    ) -> Optional[Tuple[int, int]]:
+        """Same as get_best_match_with_ratio, but returns the position of the best match instead of the string.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        Optional[Tuple[int, int]]
+            The position of the best match and its score, or None if no good match was found.
+
+        Examples
+        --------
+        >>> get_best_match_with_index("stringmatch")
+        (0, 84)
+        """
+        return self._index.get_best_match_with_index(string, score=score)
+
+    def get_best_matches_with_index(
+        self, string: str, *, score: int = 70, limit: Optional[int] = 5
+    ) -> List[Tuple[int, int]]:
+        """Same as get_best_matches_with_ratio, but returns the positions of the matches instead of the strings.
+        The positions are the ones returned by `add()` and `add_many()`, they never change.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            The positions of the matches found and their score, the best match comes first.
+
+        Examples
+        --------
+        >>> get_best_matches_with_index("stringmatch")
+        [(0, 84)]
+        """
+        return self._index.get_best_matches_with_index(string, score=score, limit=limit)
+
+    def get_best_matches_many(
+        self,
+        strings: List[str],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+        workers: int = 1,
+    ) -> List[List[str]]:
+        """Same as get_best_matches, but for many strings at once, all of them in the same snapshot.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+        workers : int, optional
+            The number of threads to use, by default 1.
+            -1 uses one thread per CPU core.
+
+        Returns
+        -------
+        List[List[str]]
+            The matches found for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> get_best_matches_many(["stringmatch", "tset"])
+        [['strmatch'], ['test']]
+        """
+        return self._index.get_best_matches_many(
+            strings, score=score, limit=limit, workers=workers
+        )
+
+    def get_best_matches_many_with_ratio(
+        self,
+        strings: List[str],
+        *,
+        score: int = 70,
+        limit: Optional[int] = 5,
+        workers: int = 1,
+    ) -> List[List[Tuple[str, int]]]:
+        """Same as get_best_matches_with_ratio, but for many strings at once, all of them in the same snapshot.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+        workers : int, optional
+            The number of threads to use, by default 1.
+            -1 uses one thread per CPU core.
+
+        Returns
+        -------
+        List[List[Tuple[str, int]]]
+            The matches found and their score for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> get_best_matches_many_with_ratio(["stringmatch", "tset"])
+        [[('strmatch', 84)], [('test', 75)]]
+        """
+        return self._index.get_best_matches_many_with_ratio(
+            strings, score=score, limit=limit, workers=workers
+        )
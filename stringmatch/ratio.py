@@ -1,9 +1,156 @@
-from typing import List, Tuple, Type
+import os
+from importlib import import_module
+from itertools import islice
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from rapidfuzz.distance import Levenshtein, MatchingBlock
 
+from stringmatch.cache import LRUCache
 from stringmatch.scorer import BaseScorer, LevenshteinScorer
-from stringmatch.strings import Strings
+from stringmatch.stats import Stats
+from stringmatch.strings import Normalizer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import ThreadPoolExecutor
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# How many strings get prepared and scored at once, while searching through a list.
+_CHUNK_SIZE: int = 1024
+
+
+def _chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Reads an iterable lazily in chunks, so only one chunk is in memory at a time.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    items : Iterable[T]
+        The items to read.
+    size : int
+        The maximum number of items in a chunk.
+
+    Returns
+    -------
+    Iterator[List[T]]
+        The chunks of items, in order.
+    """
+    iterator: Iterator[T] = iter(items)
+
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _thread_pool(workers: int) -> Optional["ThreadPoolExecutor"]:
+    """Returns a pool with a number of threads, which can be used for many calls of `_map_workers`.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    workers : int
+        The number of threads to use. -1 uses one thread per CPU core,
+        1 (or anything less than -1, or 0) does not start any threads.
+
+    Returns
+    -------
+    Optional[ThreadPoolExecutor]
+        The pool of threads, which has to be shut down afterwards, or None if the work runs in the current thread.
+    """
+    if workers == -1:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        return None
+
+    # Importing this takes a while, and most programs never use more than one worker.
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def _map_workers(
+    func: Callable[[T], R],
+    items: List[T],
+    workers: int,
+    pool: Optional["ThreadPoolExecutor"] = None,
+) -> List[R]:
+    """Calls the function for every item, spread across a number of threads.
+    The scoring in rapidfuzz releases the GIL, so the threads can run in parallel.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    func : Callable[[T], R]
+        The function to call.
+    items : List[T]
+        The items to call the function with.
+    workers : int
+        The number of threads to use. -1 uses one thread per CPU core,
+        1 (or anything less than -1, or 0) calls the function in the current thread.
+    pool : Optional[ThreadPoolExecutor], optional
+        The pool of threads from `_thread_pool` to use instead, by default None (starts one for this call).
+        Calling this for many small lists with the same pool saves starting the threads every time.
+
+    Returns
+    -------
+    List[R]
+        The results, in order of the items.
+    """
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    if pool is not None:
+        return list(pool.map(func, items))
+
+    own_pool: Optional["ThreadPoolExecutor"] = _thread_pool(workers)
+
+    if own_pool is None:
+        return [func(item) for item in items]
+
+    with own_pool:
+        return list(own_pool.map(func, items))
+
+
+def _partial_multiplier(diff: int) -> float:
+    """Returns the multiplier for the partial ratio of two strings.
+    The longer the strings are apart in length, the smaller the multiplier.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    diff : int
+        The difference in length of the strings.
+
+    Returns
+    -------
+    float
+        The multiplier, between 0.65 and 1.
+    """
+    if diff >= 20:
+        # Since the default cutoff score is 70, this would not show up on default settings.
+        return 0.65
+    if diff >= 10:
+        return 0.75
+    if diff >= 4:
+        return 0.85
+    if diff >= 1:
+        # We want to reserve a score of 100 for perfect matches.
+        return 0.95
+
+    return 1.00
 
 
 class Ratio:
@@ -18,6 +165,8 @@ class Ratio:
         remove_punctuation: bool = False,
         alphanumeric: bool = False,
         include_partial: bool = False,
+        cache_size: int = 0,
+        stats: Optional[Stats] = None,
     ) -> None:
         """Initialise the Ratio class with the correct parameters.
 
@@ -36,6 +185,11 @@ class Ratio:
             If the strings should only be compared by their latin letters, by default False.
         include_partial : bool, optional
             If partial substring matches should be included, by default False.
+        cache_size : int, optional
+            How many results of latinising strings to cache, by default 0 (no caching).
+            The cache is available as the `cache` attribute, with its hits, misses and evictions.
+        stats : Optional[Stats], optional
+            Counts what gets done and times every stage, by default None (nothing gets counted).
 
         Returns
         -------
@@ -52,6 +206,97 @@ class Ratio:
         self.remove_punctuation: bool = remove_punctuation
         self.alphanumeric: bool = alphanumeric
         self.include_partial: bool = include_partial
+        self.cache: Optional[LRUCache[str, str]] = (
+            LRUCache(cache_size) if cache_size > 0 else None
+        )
+        self.stats: Optional[Stats] = stats
+
+        self._scorer: Optional[BaseScorer] = None
+        self._normalizer: Optional[Normalizer] = None
+
+    def _get_scorer(self) -> BaseScorer:
+        """Returns an instance of the scorer class, which is only constructed once.
+        Only meant for internal usage.
+
+        Returns
+        -------
+        BaseScorer
+            The instance of the scorer class.
+        """
+        if self._scorer is None or type(self._scorer) is not self.scorer:
+            self._scorer = self.scorer()
+
+        return self._scorer
+
+    def _get_normalizer(self) -> Normalizer:
+        """Returns the Normalizer class for the current settings,
+        which is only constructed again if the settings change.
+        Only meant for internal usage.
+
+        Returns
+        -------
+        Normalizer
+            The Normalizer class with the same settings.
+        """
+        n: Optional[Normalizer] = self._normalizer
+
+        if (
+            n is None
+            or n.latinise != self.latinise
+            or n.ignore_case != self.ignore_case
+            or n.remove_punctuation != self.remove_punctuation
+            or n.alphanumeric != self.alphanumeric
+            or n.cache is not self.cache
+            or n.stats is not self.stats
+        ):
+            n = Normalizer(
+                latinise=self.latinise,
+                ignore_case=self.ignore_case,
+                remove_punctuation=self.remove_punctuation,
+                alphanumeric=self.alphanumeric,
+                cache=self.cache,
+                stats=self.stats,
+            )
+            self._normalizer = n
+
+        return n
+
+    def _prepare_string(self, string: str) -> str:
+        """Modifies a single string to be ready for comparison, according to the settings.
+        Only meant for internal usage, but feel free to use it for something else.
+
+        Parameters
+        ----------
+        string : str
+            The string to modify.
+
+        Returns
+        -------
+        str
+            The modified string.
+
+        Examples
+        --------
+        >>> _prepare_string("StrMatch")
+        'strmatch'
+        """
+        return self._get_normalizer().normalize(string)
+
+    def _prepare_list(self, string_list: List[Any]) -> List[Optional[str]]:
+        """Modifies every string in a list to be ready for comparison, according to the settings.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        string_list : List[Any]
+            The strings to modify.
+
+        Returns
+        -------
+        List[Optional[str]]
+            The modified strings, with None for non-strings.
+        """
+        return self._get_normalizer()._normalize_list(string_list)
 
     def _prepare_strings(self, string1: str, string2: str) -> Tuple[str, str]:
         """Modifies the strings to be ready for comparison, according to the settings.
@@ -74,27 +319,253 @@ class Ratio:
         >>> _prepare_strings("stringmatch", "StrMatch")
         ('stringmatch', 'strmatch')
         """
-        if self.latinise:
-            string1, string2 = Strings().latinise(string1), Strings().latinise(string2)
+        return (self._prepare_string(string1), self._prepare_string(string2))
 
-        if self.ignore_case:
-            string1, string2 = Strings().ignore_case(string1), Strings().ignore_case(
-                string2
-            )
+    def _scorer_cutoff(self, score_cutoff: int) -> float:
+        """Converts a cutoff for the rounded score into a cutoff for the scorer.
+        The scores get rounded, so a score just below the cutoff can still reach it.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        score_cutoff : int
+            The cutoff for the rounded score.
+
+        Returns
+        -------
+        float
+            The cutoff to pass to the scorer.
+        """
+        # rapidfuzz converts the cutoff of some scorers internally, which loses a bit of precision,
+        # so we leave a little room below the exact cutoff.
+        return max(score_cutoff - 0.5 - 1e-4, 0)
+
+    def _upper_bound(self, length1: int, length2: int) -> float:
+        """Returns the highest score two prepared strings with these lengths can get,
+        before rounding. Respects the `include_partial` setting.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        length1 : int
+            The length of the first prepared string, at least 1.
+        length2 : int
+            The length of the second prepared string, at least 1.
+
+        Returns
+        -------
+        float
+            The highest possible score between 0 and 100.
+        """
+        bound: float = self._get_scorer().upper_bound(length1, length2)
+
+        # A substring has the same length as the shorter string, so it can get a perfect score,
+        # which then gets multiplied.
+        if self.include_partial:
+            bound = max(bound, 100 * _partial_multiplier(abs(length1 - length2)))
 
-        if self.remove_punctuation:
-            string1, string2 = Strings().remove_punctuation(
-                string1
-            ), Strings().remove_punctuation(string2)
+        return bound
 
-        if self.alphanumeric:
-            string1, string2 = Strings().alphanumeric(string1), Strings().alphanumeric(
-                string2
+    def _can_reach(self, length1: int, length2: int, score_cutoff: int) -> bool:
+        """Returns if two prepared strings with these lengths can possibly reach the cutoff score.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        length1 : int
+            The length of the first prepared string, at least 1.
+        length2 : int
+            The length of the second prepared string, at least 1.
+        score_cutoff : int
+            The cutoff for the rounded score.
+
+        Returns
+        -------
+        bool
+            False if no two strings with these lengths can reach the cutoff score.
+        """
+        # A tiny bit of leeway, in case the scorer rounds differently than the bound.
+        return self._upper_bound(length1, length2) + 1e-9 >= self._scorer_cutoff(
+            score_cutoff
+        )
+
+    def _prepared_ratio(self, string1: str, string2: str, score_cutoff: int = 0) -> int:
+        """Returns the similarity score between two strings that were already modified
+        by `_prepare_string`. Respects the `include_partial` setting.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        string1 : str
+            The first prepared string to compare.
+        string2 : str
+            The second prepared string to compare.
+        score_cutoff : int, optional
+            Scores below this cutoff may be returned as 0 instead, by default 0.
+
+        Returns
+        -------
+        int
+            The score between 0 and 100.
+        """
+        # If either string is empty after modifying we also wanna return 0.
+        if not string1 or not string2:
+            return 0
+
+        if self.include_partial:
+            return self._prepared_partial_ratio(string1, string2, score_cutoff)
+
+        stats: Optional[Stats] = self.stats
+        start: float = perf_counter() if stats is not None else 0.0
+
+        score: int = round(
+            self._get_scorer().score_with_cutoff(
+                string1, string2, self._scorer_cutoff(score_cutoff)
             )
+        )
+
+        if stats is not None:
+            stats._record("score", 1, perf_counter() - start)
+
+        return score
+
+    def _prepared_ratio_list(
+        self, string: str, string_list: List[Optional[str]], score_cutoff: int = 0
+    ) -> List[int]:
+        """Returns the similarity score between a prepared string and a list of prepared strings.
+        Non-strings in the list should be passed in as None, they get a score of 0.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        string : str
+            The prepared string to compare.
+        string_list : List[Optional[str]]
+            The list of prepared strings to compare to.
+        score_cutoff : int, optional
+            Scores below this cutoff may be returned as 0 instead, by default 0.
+
+        Returns
+        -------
+        List[int]
+            The scores between 0 and 100, in order of the list.
+        """
+        scores: List[int] = [0] * len(string_list)
+
+        if not string:
+            return scores
+
+        # Empty strings and non-strings always get a score of 0, so we skip them.
+        valid: List[Tuple[int, str]] = [(i, s) for i, s in enumerate(string_list) if s]
+
+        stats: Optional[Stats] = self.stats
+        start: float = perf_counter() if stats is not None else 0.0
+
+        if self.include_partial:
+            windows: int = 0
+
+            for i, s in valid:
+                scores[i], w = self._partial_ratio(string, s, score_cutoff)
+                windows += w
+
+            if stats is not None:
+                stats._record("score", len(valid))
+                stats._record("partial", windows, perf_counter() - start)
+
+            return scores
+
+        results: List[float] = self._get_scorer().score_list(
+            string, [s for _, s in valid], self._scorer_cutoff(score_cutoff)
+        )
+
+        for (i, _), r in zip(valid, results):
+            scores[i] = round(r)
+
+        if stats is not None:
+            stats._record("score", len(valid), perf_counter() - start)
+
+        return scores
+
+    def _prepared_matches(
+        self, string: str, string_list: List[str], score_cutoff: int
+    ) -> List[Tuple[int, int]]:
+        """Scores a prepared string against a list of prepared strings, and returns only the ones that reach the cutoff score.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        string : str
+            The prepared string to compare, not empty.
+        string_list : List[str]
+            The list of prepared strings to compare to, none of them empty.
+        score_cutoff : int
+            The cutoff for the score.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            The positions of the strings in the list that reach the cutoff score, and their score.
+        """
+        stats: Optional[Stats] = self.stats
+        start: float = perf_counter() if stats is not None else 0.0
+
+        if self.include_partial:
+            matches: List[Tuple[int, int]] = []
+            windows: int = 0
+
+            for i, s in enumerate(string_list):
+                r, w = self._partial_ratio(string, s, score_cutoff)
+                windows += w
+                if r >= score_cutoff:
+                    matches.append((i, r))
+
+            if stats is not None:
+                stats._record("score", len(string_list))
+                stats._record("partial", windows, perf_counter() - start)
+
+            return matches
+
+        results: List[float] = self._get_scorer().score_list(
+            string, string_list, self._scorer_cutoff(score_cutoff)
+        )
+        # Scores below the cutoff are returned as 0, or might still not round up to it.
+        matches = [
+            (i, round(r)) for i, r in enumerate(results) if round(r) >= score_cutoff
+        ]
+
+        if stats is not None:
+            stats._record("score", len(string_list), perf_counter() - start)
+
+        return matches
+
+    def _ratio_list(
+        self, string: str, string_list: List[str], score_cutoff: int = 0
+    ) -> List[int]:
+        """Same as ratio_list, but scores below the cutoff may be returned as 0 instead.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_list : List[str]
+            The list of strings to compare to.
+        score_cutoff : int, optional
+            Scores below this cutoff may be returned as 0 instead, by default 0.
+
+        Returns
+        -------
+        List[int]
+            The scores between 0 and 100.
+        """
+        if not isinstance(string, str):
+            return [0] * len(string_list)
 
-        return (string1, string2)
+        return self._prepared_ratio_list(
+            self._prepare_string(string), self._prepare_list(string_list), score_cutoff
+        )
 
-    def ratio(self, string1: str, string2: str) -> int:
+    def ratio(self, string1: str, string2: str, *, score_cutoff: int = 0) -> int:
         """Returns the similarity score between two strings.
 
         Parameters
@@ -103,6 +574,9 @@ class Ratio:
             The first string to compare.
         string2 : str
             The second string to compare.
+        score_cutoff : int, optional
+            If the score is below this cutoff, 0 may be returned instead, by default 0.
+            Lets the scorer stop early if the cutoff cannot be reached.
 
         Returns
         -------
@@ -116,21 +590,14 @@ class Ratio:
         >>> ratio("stringmatch", "something completely different")
         34
         """
-        if self.include_partial:
-            return self.partial_ratio(string1, string2)
-
         # If you happen to pass in a non-string we will just return 0 instead of raising an error.
         # Could happen if you have an incredibly large list of strings and something sneaks in i guess.
         if not all(isinstance(s, str) for s in [string1, string2]):
             return 0
 
-        string1, string2 = self._prepare_strings(string1, string2)
-
-        # If either string is empty after modifying we also wanna return 0.
-        if not string1 or not string2:
-            return 0
-
-        return round(self.scorer().score(string1, string2))
+        return self._prepared_ratio(
+            *self._prepare_strings(string1, string2), score_cutoff
+        )
 
     def ratio_list(self, string: str, string_list: List[str]) -> List[int]:
         """Returns the similarity score between a string and a list of strings.
@@ -152,10 +619,99 @@ class Ratio:
         >>> ratio_list("stringmatch", ["strmatch", "something completely different"])
         [84, 34]
         """
+        return self._ratio_list(string, string_list)
+
+    def iter_ratio_list(self, string: str, string_iter: Iterable[str]) -> Iterator[int]:
+        """Same as ratio_list, but reads the strings lazily from any iterable
+        and yields the scores as they are calculated.
+        Only one chunk of strings is kept in memory at a time, so this works on huge files too.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_iter : Iterable[str]
+            The strings to compare to, for example a generator or an open file.
+
+        Returns
+        -------
+        Iterator[int]
+            The scores between 0 and 100, in order of the strings.
+
+        Examples
+        --------
+        >>> list(iter_ratio_list("stringmatch", iter(["strmatch", "something completely different"])))
+        [84, 34]
+        """
+        for chunk in _chunks(string_iter, _CHUNK_SIZE):
+            yield from self._ratio_list(string, chunk)
+
+    def ratio_matrix(
+        self, strings: List[str], string_list: List[str], *, workers: int = 1
+    ) -> List[List[int]]:
+        """Returns the similarity score between every string and every string in a list.
+        The list of strings only gets prepared once.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        string_list : List[str]
+            The list of strings to compare to.
+        workers : int, optional
+            The number of threads to spread the strings across, by default 1.
+            Set this to -1 to use one thread per CPU core.
+
+        Returns
+        -------
+        List[List[int]]
+            The scores between 0 and 100, one list for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> ratio_matrix(["stringmatch", "something"], ["strmatch", "something completely different"])
+        [[84, 34], [47, 46]]
+        """
+        prepared_list: List[Optional[str]] = self._prepare_list(string_list)
 
-        return [self.ratio(string, s) for s in string_list]
+        def ratio_row(string: str) -> List[int]:
+            if not isinstance(string, str):
+                return [0] * len(prepared_list)
 
-    def partial_ratio(self, string1: str, string2: str) -> int:
+            return self._prepared_ratio_list(
+                self._prepare_string(string), prepared_list
+            )
+
+        return _map_workers(ratio_row, strings, workers)
+
+    def ratio_array(self, string: str, string_list: List[str]) -> Any:
+        """Same as ratio_list, but returns the scores in a NumPy array.
+        Requires NumPy to be installed.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_list : List[str]
+            The list of strings to compare to.
+
+        Returns
+        -------
+        numpy.ndarray
+            The scores between 0 and 100, with the dtype uint8.
+
+        Examples
+        --------
+        >>> ratio_array("stringmatch", ["strmatch", "something completely different"])
+        array([84, 34], dtype=uint8)
+        """
+        numpy: Any = import_module("numpy")
+
+        return numpy.array(self.ratio_list(string, string_list), dtype=numpy.uint8)
+
+    def partial_ratio(
+        self, string1: str, string2: str, *, score_cutoff: int = 0
+    ) -> int:
         """Returns the similarity score between subsections of strings.
 
         Parameters
@@ -164,6 +720,9 @@ class Ratio:
             The first string to compare.
         string2 : str
             The second string to compare.
+        score_cutoff : int, optional
+            If the score is below this cutoff, 0 may be returned instead, by default 0.
+            Lets the scorer stop early if the cutoff cannot be reached.
 
         Returns
         -------
@@ -185,11 +744,88 @@ class Ratio:
         if not string1 or not string2:
             return 0
 
+        return self._prepared_partial_ratio(string1, string2, score_cutoff)
+
+    def _prepared_partial_ratio(
+        self, string1: str, string2: str, score_cutoff: int = 0
+    ) -> int:
+        """The partial_ratio for two non-empty strings that were already modified
+        by `_prepare_string`. Only meant for internal usage.
+
+        Parameters
+        ----------
+        string1 : str
+            The first prepared string to compare.
+        string2 : str
+            The second prepared string to compare.
+        score_cutoff : int, optional
+            Scores below this cutoff may be returned as 0 instead, by default 0.
+
+        Returns
+        -------
+        int
+            The score between 0 and 100.
+        """
+        stats: Optional[Stats] = self.stats
+
+        if stats is None:
+            return self._partial_ratio(string1, string2, score_cutoff)[0]
+
+        start: float = perf_counter()
+        score, windows = self._partial_ratio(string1, string2, score_cutoff)
+
+        stats._record("score", 1)
+        stats._record("partial", windows, perf_counter() - start)
+
+        return score
+
+    def _partial_ratio(
+        self, string1: str, string2: str, score_cutoff: int = 0
+    ) -> Tuple[int, int]:
+        """Same as `_prepared_partial_ratio`, but also returns how many substrings were scored.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        string1 : str
+            The first prepared string to compare.
+        string2 : str
+            The second prepared string to compare.
+        score_cutoff : int, optional
+            Scores below this cutoff may be returned as 0 instead, by default 0.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The score between 0 and 100, and the number of substrings scored.
+        """
         if len(string1) >= len(string2):
             longer_string, shorter_string = string1, string2
         else:
             longer_string, shorter_string = string2, string1
 
+        multiplier: float = _partial_multiplier(
+            len(longer_string) - len(shorter_string)
+        )
+
+        scorer: BaseScorer = self._get_scorer()
+
+        # First we get the "normal score" for both starting strings,
+        # the score of a substring has to be higher than this to matter.
+        best: int = round(
+            scorer.score_with_cutoff(
+                string1, string2, self._scorer_cutoff(score_cutoff)
+            )
+        )
+
+        # The highest score a substring can get, after the multiplier.
+        max_score: int = round(100 * multiplier)
+
+        # If no substring can beat the best score or reach the cutoff,
+        # we do not have to look for substrings at all.
+        if best >= max_score or score_cutoff > max_score:
+            return best, 0
+
         blocks: List[MatchingBlock] = [
             block
             for block in Levenshtein.editops(
@@ -200,41 +836,33 @@ class Ratio:
             if (block.size > 1 or (block.size == 1 and block.a == 0))
         ]
 
-        # Gets the correct multiplier for the partial ratio.
-        # The longer the strings are apart in length, the smaller the multiplier.
-        diff: int = len(longer_string) - len(shorter_string)
-
-        multiplier: float = 1.00
+        # Different blocks can start the same substring, we only score every substring once.
+        starts: List[int] = list(
+            dict.fromkeys(max((block.a - block.b), 0) for block in blocks)
+        )
 
-        if diff >= 20:
-            # Since the default cutoff score is 70, this would not show up on default settings.
-            multiplier = 0.65
-        elif diff >= 10:
-            multiplier = 0.75
-        elif diff >= 4:
-            multiplier = 0.85
-        elif diff >= 1:
-            # We want to reserve a score of 100 for perfect matches.
-            multiplier = 0.95
+        windows: int = 0
 
-        scores: List[int] = []
-
-        for block in blocks:
-            start: int = max((block.a - block.b), 0)
+        for start in starts:
             substring: str = longer_string[start : start + len(shorter_string)]
-
-            scores.append(
-                round(
-                    self.scorer().score(
-                        substring,
-                        shorter_string,
-                    )
-                    * multiplier
-                ),
+            windows += 1
+
+            r: int = round(
+                scorer.score_with_cutoff(
+                    substring,
+                    shorter_string,
+                    # The substring has to beat the best score so far, and the score gets multiplied,
+                    # so the scorer can stop early if it cannot reach that.
+                    self._scorer_cutoff(max(score_cutoff, best + 1)) / multiplier,
+                )
+                * multiplier
             )
 
-        # Also gets the "normal score" for both starting strings,
-        # and returns whichever one is higher.
-        scores.append(round(self.scorer().score(string1, string2)))
+            if r > best:
+                best = r
+
+                # Nothing can beat this anymore.
+                if best >= max_score:
+                    break
 
-        return max(scores, default=0)
+        return best, windows
@@ -1,5 +1,73 @@
+from typing import Any, Callable, Dict, List, Optional, Type
+
 from mypy_extensions import mypyc_attr
-from rapidfuzz import distance
+from rapidfuzz import distance, process
+
+
+def _extract_scores(
+    string: str,
+    string_list: List[str],
+    scorer: Callable[..., float],
+    score_cutoff: float,
+    scorer_kwargs: Optional[Dict[str, Any]] = None,
+) -> List[float]:
+    """Scores a string against a list of strings in a single rapidfuzz call.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    string : str
+        The string to compare.
+    string_list : List[str]
+        The list of strings to compare to.
+    scorer : Callable[..., float]
+        The normalized similarity function of rapidfuzz to use.
+    score_cutoff : float
+        Scores below this cutoff (between 0 and 100) are returned as 0.
+    scorer_kwargs : Optional[Dict[str, Any]], optional
+        Additional keyword arguments for the scorer, by default None.
+
+    Returns
+    -------
+    List[float]
+        The scores between 0 and 100, in order of the list.
+    """
+    scores: List[float] = [0.0] * len(string_list)
+
+    for _, s, i in process.extract_iter(
+        string,
+        string_list,
+        scorer=scorer,
+        scorer_kwargs=scorer_kwargs,
+        score_cutoff=min(score_cutoff, 100) / 100,
+    ):
+        scores[i] = s * 100
+
+    return scores
+
+
+def _jaro_upper_bound(length1: int, length2: int) -> float:
+    """Returns the highest Jaro similarity two strings with these lengths can get.
+    Only meant for internal usage.
+
+    At most every character of the shorter string can match,
+    and in the best case none of the matching characters are transposed.
+
+    Parameters
+    ----------
+    length1 : int
+        The length of the first string, at least 1.
+    length2 : int
+        The length of the second string, at least 1.
+
+    Returns
+    -------
+    float
+        The highest possible similarity between 0 and 1.
+    """
+    matches: int = min(length1, length2)
+
+    return (matches / length1 + matches / length2 + 1) / 3
 
 
 @mypyc_attr(allow_interpreted_subclasses=True)
@@ -9,7 +77,101 @@ class BaseScorer:
     def score(self, string1: str, string2: str) -> float:
         raise NotImplementedError
 
+    def score_with_cutoff(
+        self, string1: str, string2: str, score_cutoff: float = 0
+    ) -> float:
+        """Same as `score()`, but scores below the cutoff may be returned as 0 instead.
+        By default the cutoff is ignored and this just calls `score()`,
+        scorers can override this to stop early if the cutoff cannot be reached.
+
+        Parameters
+        ----------
+        string1 : str
+            The first string to compare.
+        string2 : str
+            The second string to compare.
+        score_cutoff : float, optional
+            Scores below this cutoff may be returned as 0 instead, by default 0.
+
+        Returns
+        -------
+        float
+            The score between 0 and 100.
+        """
+        return self.score(string1, string2)
+
+    def upper_bound(self, length1: int, length2: int) -> float:
+        """Returns the highest score that two strings with these lengths can possibly get.
+        Used for skipping strings that cannot reach the cutoff score, without scoring them.
+        By default this returns 100, so nothing gets skipped,
+        scorers can override this with a tighter bound.
+        The bound has to be admissible: no two strings with these lengths may score higher.
+
+        Parameters
+        ----------
+        length1 : int
+            The length of the first string, at least 1.
+        length2 : int
+            The length of the second string, at least 1.
 
+        Returns
+        -------
+        float
+            The highest possible score between 0 and 100.
+
+        Examples
+        --------
+        >>> LevenshteinScorer().upper_bound(4, 6)
+        80.0
+        """
+        return 100.0
+
+    def score_list(
+        self, string: str, string_list: List[str], score_cutoff: float = 0
+    ) -> List[float]:
+        """Returns the similarity score between a string and every string in a list.
+        By default this just calls `score_with_cutoff()` for every string, scorers can override this
+        with a faster batch implementation, or to precompute something for the string only once.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        string_list : List[str]
+            The list of strings to compare to.
+        score_cutoff : float, optional
+            Scores below this cutoff may be returned as 0 instead, by default 0.
+
+        Returns
+        -------
+        List[float]
+            The scores between 0 and 100, in order of the list.
+        """
+        return [self.score_with_cutoff(string, s, score_cutoff) for s in string_list]
+
+
+def _overrides_score(scorer: BaseScorer, scorer_class: Type[BaseScorer]) -> bool:
+    """Returns if the scorer is a subclass of an included scorer that overrides its `score()` method.
+    The rapidfuzz fast paths of the included scorers do not call `score()`,
+    so such subclasses use the implementations of the BaseScorer class instead.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    scorer : BaseScorer
+        The scorer to check.
+    scorer_class : Type[BaseScorer]
+        The included scorer class that has the fast paths.
+
+    Returns
+    -------
+    bool
+        If the scorer has its own `score()` method.
+    """
+    return getattr(type(scorer), "score") is not getattr(scorer_class, "score")
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class LevenshteinScorer(BaseScorer):
     """The Levenshtein scorer class, uses the Levenshtein Distance to calculate the similarity."""
 
@@ -21,16 +183,122 @@ class LevenshteinScorer(BaseScorer):
             * 100
         )
 
+    def score_with_cutoff(
+        self, string1: str, string2: str, score_cutoff: float = 0
+    ) -> float:
+        if _overrides_score(self, LevenshteinScorer):
+            return super().score_with_cutoff(string1, string2, score_cutoff)
 
+        return (
+            distance.Levenshtein.normalized_similarity(
+                string1,
+                string2,
+                weights=(1, 1, 2),
+                score_cutoff=min(score_cutoff, 100) / 100,
+            )
+            * 100
+        )
+
+    def upper_bound(self, length1: int, length2: int) -> float:
+        if _overrides_score(self, LevenshteinScorer):
+            return super().upper_bound(length1, length2)
+
+        # Every extra character needs at least one insertion or deletion,
+        # and the distance is normalized by the sum of both lengths.
+        return (1 - abs(length1 - length2) / (length1 + length2)) * 100
+
+    def score_list(
+        self, string: str, string_list: List[str], score_cutoff: float = 0
+    ) -> List[float]:
+        if _overrides_score(self, LevenshteinScorer):
+            return super().score_list(string, string_list, score_cutoff)
+
+        return _extract_scores(
+            string,
+            string_list,
+            distance.Levenshtein.normalized_similarity,
+            score_cutoff,
+            {"weights": (1, 1, 2)},
+        )
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class JaroScorer(BaseScorer):
     """The Jaro scorer class, uses the Jaro Similarity to calculate the similarity."""
 
     def score(self, string1: str, string2: str) -> float:
         return distance.Jaro.normalized_similarity(string1, string2) * 100
 
+    def score_with_cutoff(
+        self, string1: str, string2: str, score_cutoff: float = 0
+    ) -> float:
+        if _overrides_score(self, JaroScorer):
+            return super().score_with_cutoff(string1, string2, score_cutoff)
+
+        return (
+            distance.Jaro.normalized_similarity(
+                string1, string2, score_cutoff=min(score_cutoff, 100) / 100
+            )
+            * 100
+        )
+
+    def upper_bound(self, length1: int, length2: int) -> float:
+        if _overrides_score(self, JaroScorer):
+            return super().upper_bound(length1, length2)
+
+        return _jaro_upper_bound(length1, length2) * 100
+
+    def score_list(
+        self, string: str, string_list: List[str], score_cutoff: float = 0
+    ) -> List[float]:
+        if _overrides_score(self, JaroScorer):
+            return super().score_list(string, string_list, score_cutoff)
 
+        return _extract_scores(
+            string, string_list, distance.Jaro.normalized_similarity, score_cutoff
+        )
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class JaroWinklerScorer(BaseScorer):
     """The Jaro-Winkler scorer class, uses the Jaro-Winkler Similarity to calculate the similarity."""
 
     def score(self, string1: str, string2: str) -> float:
         return distance.JaroWinkler.normalized_similarity(string1, string2) * 100
+
+    def score_with_cutoff(
+        self, string1: str, string2: str, score_cutoff: float = 0
+    ) -> float:
+        if _overrides_score(self, JaroWinklerScorer):
+            return super().score_with_cutoff(string1, string2, score_cutoff)
+
+        return (
+            distance.JaroWinkler.normalized_similarity(
+                string1, string2, score_cutoff=min(score_cutoff, 100) / 100
+            )
+            * 100
+        )
+
+    def upper_bound(self, length1: int, length2: int) -> float:
+        if _overrides_score(self, JaroWinklerScorer):
+            return super().upper_bound(length1, length2)
+
+        jaro: float = _jaro_upper_bound(length1, length2)
+        # The common prefix of up to 4 characters boosts the Jaro similarity,
+        # the boost only gets larger with a higher Jaro similarity.
+        prefix: int = min(length1, length2, 4)
+
+        return (jaro + prefix * 0.1 * (1 - jaro)) * 100
+
+    def score_list(
+        self, string: str, string_list: List[str], score_cutoff: float = 0
+    ) -> List[float]:
+        if _overrides_score(self, JaroWinklerScorer):
+            return super().score_list(string, string_list, score_cutoff)
+
+        return _extract_scores(
+            string,
+            string_list,
+            distance.JaroWinkler.normalized_similarity,
+            score_cutoff,
+        )
@@ -0,0 +1,462 @@
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from stringmatch.index import MatchIndex
+from stringmatch.indexfile import _ALIGNMENT, _read_strings, _string_sections
+from stringmatch.match import Match, _BestMatches
+from stringmatch.ratio import Ratio
+
+# The shard of the worker process, set once the process starts:
+# the position of its first string in the whole list, and the index of its strings.
+_SHARD: Optional[Tuple[int, MatchIndex]] = None
+
+
+def _init_shard(
+    name: str,
+    layout: Dict[str, Tuple[int, int]],
+    start: int,
+    settings: Dict[str, Any],
+    ngram_size: int,
+) -> None:
+    """Copies the strings of a shard out of the shared memory and builds its index.
+    Runs once in every worker process, when it starts, the shared memory is freed once all of them did.
+    The index of the worker process holds the only copy of the strings of its shard.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared memory.
+    layout : Dict[str, Tuple[int, int]]
+        The offset and the size of every section of the shard in the shared memory.
+    start : int
+        The position of the first string of the shard in the whole list.
+    settings : Dict[str, Any]
+        The keyword arguments to construct the Match class with.
+    ngram_size : int
+        The length of the n-grams to build an inverted index of.
+    """
+    global _SHARD
+
+    # The worker processes share the resource tracker of the parent process, which unlinks the memory.
+    shm: SharedMemory = SharedMemory(name=name)
+
+    try:
+        strings, prepared = _read_strings(
+            lambda section: shm.buf[
+                layout[section][0] : layout[section][0] + layout[section][1]
+            ]
+        )
+        # The strings are copied out, the shared memory cannot be closed while they are read from it.
+        string_list: List[Any] = list(strings)
+        prepared_list: List[Optional[str]] = list(prepared)
+        del strings, prepared
+    finally:
+        shm.close()
+
+    _SHARD = (
+        start,
+        MatchIndex(
+            Match(**settings),
+            string_list,
+            ngram_size=ngram_size,
+            prepared_list=prepared_list,
+        ),
+    )
+
+
+def _shard_ready() -> bool:
+    """Returns once the worker process started and built the index of its shard.
+    Only meant for internal usage.
+
+    Returns
+    -------
+    bool
+        Always True.
+    """
+    return _SHARD is not None
+
+
+def _search_shard(
+    strings: List[str], score: int, limit: Optional[int]
+) -> List[Tuple[List[Tuple[int, str, int]], int]]:
+    """Finds the best matches of every string in the shard of the worker process.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    strings : List[str]
+        The strings to compare.
+    score : int
+        The cutoff for the score.
+    limit : Optional[int]
+        The number of matches to return for every string, or None for every match.
+
+    Returns
+    -------
+    List[Tuple[List[Tuple[int, str, int]], int]]
+        For every string, the positions of the best matches in the whole list, the matches and their score,
+        and the number of strings that were skipped without scoring them.
+    """
+    assert _SHARD is not None
+    start, index = _SHARD
+
+    results: List[Tuple[List[Tuple[int, str, int]], int]] = []
+
+    for string in strings:
+        matches, pruned = index._search(string, score=score, limit=limit)
+        results.append(([(start + p, s, r) for p, s, r in matches], pruned))
+
+    return results
+
+
+class ShardedMatchIndex:
+    """Contains a list of strings split into shards, which are searched in parallel by worker processes."""
+
+    def __init__(
+        self,
+        match: Match,
+        string_list: List[str],
+        *,
+        shards: int = -1,
+        ngram_size: int = 0,
+    ) -> None:
+        """Initialise the ShardedMatchIndex class, starting one worker process for every shard.
+        Usually constructed with `Match.sharded_index()`.
+
+        The strings are prepared once, and written to shared memory together with the prepared strings,
+        so they get to the worker processes without pickling them. Every worker process copies only its own shard
+        out of there and builds a MatchIndex of it, the shared memory is freed once all of them did.
+        The strings are only kept by the worker processes, not by the index itself,
+        the worker processes send back the strings of the best matches.
+        Every search runs in all shards at the same time, and the best matches of every shard are merged,
+        which returns exactly the same results in the same order as `Match.get_best_matches_with_ratio()`.
+
+        The worker processes are started with the default method of the multiprocessing module,
+        so the scorer has to be importable by them. The Stats of the Match class only count
+        the strings that were skipped, the work done inside the worker processes is not counted.
+        Call `close()` once you are done, or use the class as a context manager.
+
+        Parameters
+        ----------
+        match : Match
+            The Match class whose settings are used for preparing and searching.
+            Changing the settings of the Match class afterwards does not affect the index.
+        string_list : List[str]
+            The List of strings to split into shards.
+        shards : int, optional
+            The number of shards and worker processes, by default -1 (one per CPU core).
+            There are never more shards than strings.
+        ngram_size : int, optional
+            The length of the n-grams to build an inverted index of in every shard, by default 0 (no n-gram index).
+            See the MatchIndex class for more information.
+
+        Returns
+        -------
+        ShardedMatchIndex
+            The ShardedMatchIndex class.
+
+        Examples
+        --------
+        >>> with ShardedMatchIndex(Match(), ["strmatch", "test", "something else"], shards=2) as index:
+        ...     index.get_best_match("stringmatch")
+        'strmatch'
+        """
+        self.match: Match = match
+        self.ratio: Ratio = match._get_ratio()
+        self._length: int = len(string_list)
+
+        if shards == -1:
+            shards = os.cpu_count() or 1
+
+        shards = max(1, min(shards, self._length))
+        bounds: List[int] = [self._length * i // shards for i in range(shards + 1)]
+
+        # How many strings were skipped while searching, because they could not reach the cutoff score.
+        self.pruned: int = 0
+        self._lock: Lock = Lock()
+
+        prepared_list: List[Optional[str]] = self.ratio._prepare_list(string_list)
+
+        layouts: List[Dict[str, Tuple[int, int]]] = []
+        data: List[Tuple[int, bytes]] = []
+        offset: int = 0
+
+        for start, end in zip(bounds, bounds[1:]):
+            layout: Dict[str, Tuple[int, int]] = {}
+
+            for name, section in _string_sections(
+                string_list[start:end], prepared_list[start:end]
+            ).items():
+                layout[name] = (offset, len(section))
+                data.append((offset, section))
+                offset += -(-len(section) // _ALIGNMENT) * _ALIGNMENT
+
+            layouts.append(layout)
+
+        settings: Dict[str, Any] = {
+            "scorer": match.scorer,
+            "latinise": match.latinise,
+            "ignore_case": match.ignore_case,
+            "remove_punctuation": match.remove_punctuation,
+            "alphanumeric": match.alphanumeric,
+            "include_partial": match.include_partial,
+            "cache_size": match.cache.maxsize if match.cache is not None else 0,
+        }
+
+        shm: SharedMemory = SharedMemory(create=True, size=max(offset, 1))
+        self._executors: List[ProcessPoolExecutor] = []
+
+        try:
+            for position, section in data:
+                shm.buf[position : position + len(section)] = section
+            del data, prepared_list
+
+            for start, layout in zip(bounds, layouts):
+                self._executors.append(
+                    ProcessPoolExecutor(
+                        max_workers=1,
+                        initializer=_init_shard,
+                        initargs=(shm.name, layout, start, settings, ngram_size),
+                    )
+                )
+
+            # The processes only start with their first task,
+            # the shared memory is not needed anymore once all of them read their shard.
+            for future in [e.submit(_shard_ready) for e in self._executors]:
+                future.result()
+        except BaseException:
+            self.close()
+            raise
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __enter__(self) -> "ShardedMatchIndex":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def shards(self) -> int:
+        """The number of shards and worker processes."""
+        return len(self._executors)
+
+    def close(self) -> None:
+        """Stops the worker processes. The index cannot be searched anymore afterwards.
+
+        Examples
+        --------
+        >>> index = Match().sharded_index(["strmatch", "test", "something else"])
+        >>> index.close()
+        """
+        for executor in self._executors:
+            executor.shutdown()
+
+    def get_best_match(self, string: str, *, score: int = 70) -> Optional[str]:
+        """Returns the best match for the given string.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        Optional[str]
+            The best match, or None if none was found.
+
+        Examples
+        --------
+        >>> get_best_match("stringmatch")
+        'strmatch'
+        """
+        match: Optional[Tuple[str, int]] = self.get_best_match_with_ratio(
+            string, score=score
+        )
+
+        return match[0] if match else None
+
+    def get_best_match_with_ratio(
+        self, string: str, *, score: int = 70
+    ) -> Optional[Tuple[str, int]]:
+        """Same as get_best_match, but returns a tuple with the best match and its score.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+
+        Returns
+        -------
+        Optional[Tuple[str, int]]
+            The best match and its score, or None if none was found.
+
+        Examples
+        --------
+        >>> get_best_match_with_ratio("stringmatch")
+        ('strmatch', 84)
+        """
+        matches: List[Tuple[str, int]] = self.get_best_matches_with_ratio(
+            string, score=score, limit=1
+        )
+
+        return matches[0] if matches else None
+
+    def get_best_matches(
+        self, string: str, *, score: int = 70, limit: Optional[int] = 5
+    ) -> List[str]:
+        """Matches a string to the strings of every shard, and returns the best matches.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[str]
+            All of the matches found.
+
+        Examples
+        --------
+        >>> get_best_matches("stringmatch")
+        ['strmatch']
+        """
+        return [
+            m[0]
+            for m in self.get_best_matches_with_ratio(string, score=score, limit=limit)
+        ]
+
+    def get_best_matches_with_ratio(
+        self, string: str, *, score: int = 70, limit: Optional[int] = 5
+    ) -> List[Tuple[str, int]]:
+        """Same as get_best_matches, but returns a list of tuples with the best matches and their score.
+
+        Parameters
+        ----------
+        string : str
+            The string to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            All of the matches found.
+
+        Examples
+        --------
+        >>> get_best_matches_with_ratio("stringmatch")
+        [('strmatch', 84)]
+        """
+        return self.get_best_matches_many_with_ratio(
+            [string], score=score, limit=limit
+        )[0]
+
+    def get_best_matches_many(
+        self, strings: List[str], *, score: int = 70, limit: Optional[int] = 5
+    ) -> List[List[str]]:
+        """Same as get_best_matches, but for many strings at once.
+        Every shard gets all of the strings in one go, which saves a round trip to the worker processes for every string.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[List[str]]
+            The matches found for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> get_best_matches_many(["stringmatch", "tset"])
+        [['strmatch'], ['test']]
+        """
+        return [
+            [m[0] for m in matches]
+            for matches in self.get_best_matches_many_with_ratio(
+                strings, score=score, limit=limit
+            )
+        ]
+
+    def get_best_matches_many_with_ratio(
+        self, strings: List[str], *, score: int = 70, limit: Optional[int] = 5
+    ) -> List[List[Tuple[str, int]]]:
+        """Same as get_best_matches_with_ratio, but for many strings at once.
+
+        Parameters
+        ----------
+        strings : List[str]
+            The strings to compare.
+        score : int, optional
+            The cutoff for the score, by default 70.
+        limit : int, optional
+            The number of matches to return for every string, by default 5.
+            If you want to return every match, set this to 0 (or less than 0) or None.
+
+        Returns
+        -------
+        List[List[Tuple[str, int]]]
+            The matches found and their score for every string, in order of the strings.
+
+        Examples
+        --------
+        >>> get_best_matches_many_with_ratio(["stringmatch", "tset"])
+        [[('strmatch', 84)], [('test', 75)]]
+        """
+        if limit is not None and limit < 1:
+            limit = None
+
+        futures: List[Future] = [
+            executor.submit(_search_shard, strings, score, limit)
+            for executor in self._executors
+        ]
+
+        # The strings are already prepared and scored, the best matches only get merged here.
+        bests: List[_BestMatches] = [
+            _BestMatches(
+                self.ratio, string, score=score, limit=limit, prepared_string=""
+            )
+            for string in strings
+        ]
+        pruned: int = 0
+
+        for future in futures:
+            for best, (matches, shard_pruned) in zip(bests, future.result()):
+                best.merge(matches)
+                pruned += shard_pruned
+
+        with self._lock:
+            self.pruned += pruned
+
+        if self.ratio.stats is not None:
+            self.ratio.stats._record("pruned", pruned)
+
+        return [best.result() for best in bests]
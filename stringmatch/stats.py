@@ -0,0 +1,121 @@
+from threading import Lock
+from typing import Callable, Dict, Optional, Union
+
+# The stages that get counted, in the order they happen while searching.
+_STAGES = (
+    "result_cache_hits",
+    "result_cache_misses",
+    "latinise",
+    "normalize",
+    "cache_hits",
+    "cache_misses",
+    "pruned",
+    "score",
+    "partial",
+    "sort",
+)
+
+
+class Stats:
+    """Counts what the Match and Ratio classes do, and how long every stage takes.
+    Pass it in with the `stats` keyword argument, without it nothing gets counted or timed.
+    Safe to use from multiple threads.
+
+    The stages are:
+
+    | Stage | Count | Time |
+    | ---   | ---   | ---  |
+    | result_cache_hits | Searches found in the result cache | - |
+    | result_cache_misses | Searches not found in the result cache | - |
+    | latinise | Strings latinised | Spent in unidecode and the cache |
+    | normalize | Strings modified after latinising | Spent on case, punctuation and alphanumeric |
+    | cache_hits | Latinised strings found in the cache | - |
+    | cache_misses | Latinised strings not found in the cache | - |
+    | pruned | Strings skipped without scoring them | - |
+    | score | Strings scored | Spent scoring without partial matches |
+    | partial | Substrings scored for partial matches | Spent scoring with partial matches |
+    | sort | Matches kept and sorted | Spent sorting the matches |
+    """
+
+    def __init__(
+        self, callback: Optional[Callable[[str, int, float], None]] = None
+    ) -> None:
+        """Initialise the Stats class, with every count and time at 0.
+
+        Parameters
+        ----------
+        callback : Optional[Callable[[str, int, float], None]], optional
+            Called with the stage, the count and the time in seconds every time something is recorded,
+            by default None. Things are recorded once per call or chunk of strings, not for every string.
+            Use it to send the numbers to your metrics system.
+
+        Returns
+        -------
+        Stats
+            The Stats class.
+
+        Examples
+        --------
+        >>> Stats(callback=lambda stage, count, seconds: print(stage, count, seconds))
+        """
+        self.callback: Optional[Callable[[str, int, float], None]] = callback
+
+        self.counts: Dict[str, int] = dict.fromkeys(_STAGES, 0)
+        self.times: Dict[str, float] = dict.fromkeys(_STAGES, 0.0)
+
+        self._lock: Lock = Lock()
+
+    def _record(self, stage: str, count: int, seconds: float = 0.0) -> None:
+        """Adds to the count and time of a stage, and calls the callback.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        stage : str
+            The stage to add to.
+        count : int
+            How many things were done.
+        seconds : float, optional
+            How long it took, by default 0.0.
+        """
+        with self._lock:
+            self.counts[stage] += count
+            self.times[stage] += seconds
+
+        if self.callback is not None:
+            self.callback(stage, count, seconds)
+
+    def as_dict(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Returns the count and time of every stage.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Union[int, float]]]
+            The count and the time in seconds, by stage.
+
+        Examples
+        --------
+        >>> stats = Stats()
+        >>> Match(stats=stats).get_best_match("stringmatch", ["strmatch", "test"])
+        'strmatch'
+        >>> stats.as_dict()["score"]
+        {'count': 2, 'seconds': 1.2e-05}
+        """
+        with self._lock:
+            return {
+                stage: {"count": self.counts[stage], "seconds": self.times[stage]}
+                for stage in _STAGES
+            }
+
+    def reset(self) -> None:
+        """Sets every count and time back to 0.
+
+        Examples
+        --------
+        >>> stats.reset()
+        >>> stats.counts["score"]
+        0
+        """
+        with self._lock:
+            self.counts = dict.fromkeys(_STAGES, 0)
+            self.times = dict.fromkeys(_STAGES, 0.0)
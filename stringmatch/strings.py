@@ -1,4 +1,54 @@
-from unidecode import unidecode
+import re
+from importlib import import_module
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Pattern
+
+from stringmatch.cache import LRUCache
+from stringmatch.stats import Stats
+
+# The characters removed by remove_punctuation.
+_PUNCTUATION: str = "!\"#'()*+,-./:;<=>?[]^_`{|}~’„“»«"
+
+# The characters kept by alphanumeric.
+_ALPHANUMERIC: str = "1234567890abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ "
+
+_PUNCTUATION_TABLE: Dict[int, Optional[int]] = {ord(c): None for c in _PUNCTUATION}
+
+_NON_ALPHANUMERIC_PATTERN: Pattern[str] = re.compile("[^0-9a-zA-Z ]+")
+
+# For ascii strings, lower case and alphanumeric can be done in one pass.
+_ASCII_NON_ALPHANUMERIC_TABLE: Dict[int, Optional[int]] = {
+    i: None for i in range(128) if chr(i) not in _ALPHANUMERIC
+}
+_ASCII_LOWER_ALPHANUMERIC_TABLE: Dict[int, Optional[int]] = {
+    **_ASCII_NON_ALPHANUMERIC_TABLE,
+    **{ord(c): ord(c.lower()) for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+}
+
+# unidecode only gets imported once the first string is latinised, see `_unidecode`.
+_UNIDECODE: Optional[Callable[[str], str]] = None
+
+
+def _unidecode(string: str) -> str:
+    """Transliterates the string with unidecode, which is imported on the first call.
+    Only meant for internal usage.
+
+    Parameters
+    ----------
+    string : str
+        The string to transliterate special unicode characters into latin characters.
+
+    Returns
+    -------
+    str
+        The string with special unicode characters transliterated.
+    """
+    global _UNIDECODE
+
+    if _UNIDECODE is None:
+        _UNIDECODE = import_module("unidecode").unidecode
+
+    return _UNIDECODE(string)
 
 
 class Strings:
@@ -22,7 +72,8 @@ class Strings:
         >>> latinise("ピカチュウ")
         'pikachiyuu'
         """
-        return unidecode(string)
+        # Ascii strings stay the same anyways, so we can skip unidecode for them.
+        return string if string.isascii() else _unidecode(string)
 
     def remove_punctuation(self, string: str) -> str:
         """Removes punctuation from a string.
@@ -42,9 +93,7 @@ class Strings:
         >>> remove_punctuation("...Hello!!!")
         'Hello'
         """
-        return "".join(
-            c for c in string if c not in "!\"#'()*+,-./:;<=>?[]^_`{|}~’„“»«"
-        )
+        return string.translate(_PUNCTUATION_TABLE)
 
     def alphanumeric(self, string: str) -> str:
         """Removes all non-latin letters from the string.
@@ -66,11 +115,7 @@ class Strings:
         >>> alphanumeric("What? À special word!")
         'What  special word'
         """
-        return "".join(
-            c
-            for c in string
-            if c in "1234567890abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ "
-        )
+        return _NON_ALPHANUMERIC_PATTERN.sub("", string)
 
     def ignore_case(self, string: str, lower: bool = True) -> str:
         """Removes case from a string.
@@ -96,3 +141,194 @@ class Strings:
         'HELLO THERE!'
         """
         return string.lower() if lower else string.upper()
+
+
+class Normalizer:
+    """Modifies strings with a fixed set of steps, in as few passes as possible.
+    Gives the same result as calling the matching functions of the Strings class one after another.
+    """
+
+    def __init__(
+        self,
+        *,
+        latinise: bool = False,
+        ignore_case: bool = True,
+        remove_punctuation: bool = False,
+        alphanumeric: bool = False,
+        cache: Optional[LRUCache[str, str]] = None,
+        stats: Optional[Stats] = None,
+    ) -> None:
+        """Initialise the Normalizer class with the steps to apply.
+        The steps are applied in the order of the parameters.
+
+        Parameters
+        ----------
+        latinise : bool, optional
+            If special unicode characters should be removed from the strings, by default False.
+        ignore_case : bool, optional
+            If the strings should be converted to lower case, by default True.
+        remove_punctuation : bool, optional
+            If punctuation should be removed from the strings, by default False.
+        alphanumeric : bool, optional
+            If the strings should only keep their latin letters, numbers and spaces, by default False.
+        cache : Optional[LRUCache[str, str]], optional
+            The cache for the results of latinise, by default None (no caching).
+        stats : Optional[Stats], optional
+            Counts and times the steps, by default None (nothing gets counted).
+
+        Returns
+        -------
+        Normalizer
+            The Normalizer class.
+
+        Examples
+        --------
+        >>> Normalizer(latinise=True, alphanumeric=True)
+        """
+        self.latinise: bool = latinise
+        self.ignore_case: bool = ignore_case
+        self.remove_punctuation: bool = remove_punctuation
+        self.alphanumeric: bool = alphanumeric
+        self.cache: Optional[LRUCache[str, str]] = cache
+        self.stats: Optional[Stats] = stats
+
+    def _latinise(self, string: str) -> str:
+        """Removes special unicode characters from the string, using the cache if there is one.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        string : str
+            The string to transliterate special unicode characters into latin characters.
+
+        Returns
+        -------
+        str
+            The string with special unicode characters transliterated.
+        """
+        if string.isascii():
+            return string
+
+        if self.cache is None:
+            return _unidecode(string)
+
+        latinised: Optional[str] = self.cache.get(string)
+
+        if latinised is None:
+            latinised = _unidecode(string)
+            self.cache.put(string, latinised)
+
+        return latinised
+
+    def normalize(self, string: str) -> str:
+        """Modifies the string according to the steps of this class.
+
+        Parameters
+        ----------
+        string : str
+            The string to modify.
+
+        Returns
+        -------
+        str
+            The modified string.
+
+        Examples
+        --------
+        >>> Normalizer(latinise=True, alphanumeric=True).normalize("Héllö, world!")
+        'hello world'
+        """
+        if self.stats is not None:
+            return self._normalize_list([string])[0] or ""
+
+        if self.latinise:
+            string = self._latinise(string)
+
+        return self._modify(string)
+
+    def _modify(self, string: str) -> str:
+        """Applies every step after latinise to the string.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        string : str
+            The string to modify, already latinised if needed.
+
+        Returns
+        -------
+        str
+            The modified string.
+        """
+        # Every punctuation character is also removed by alphanumeric,
+        # so we only have to do one of them.
+        if self.alphanumeric:
+            # Lower case has to come first, since some non-ascii characters
+            # become ascii letters in lower case, like the Kelvin sign.
+            if string.isascii():
+                return string.translate(
+                    _ASCII_LOWER_ALPHANUMERIC_TABLE
+                    if self.ignore_case
+                    else _ASCII_NON_ALPHANUMERIC_TABLE
+                )
+
+            if self.ignore_case:
+                string = string.lower()
+
+            return _NON_ALPHANUMERIC_PATTERN.sub("", string)
+
+        if self.ignore_case:
+            string = string.lower()
+
+        if self.remove_punctuation:
+            string = string.translate(_PUNCTUATION_TABLE)
+
+        return string
+
+    def _normalize_list(self, string_list: List[Any]) -> List[Optional[str]]:
+        """Modifies every string in the list, with None for non-strings.
+        If there are stats, every step is done for the whole list at once and timed.
+        Only meant for internal usage.
+
+        Parameters
+        ----------
+        string_list : List[Any]
+            The strings to modify.
+
+        Returns
+        -------
+        List[Optional[str]]
+            The modified strings, in order of the list.
+        """
+        stats: Optional[Stats] = self.stats
+
+        if stats is None:
+            return [
+                self.normalize(s) if isinstance(s, str) else None for s in string_list
+            ]
+
+        strings: List[Optional[str]] = [
+            s if isinstance(s, str) else None for s in string_list
+        ]
+        count: int = sum(1 for s in strings if s is not None)
+
+        if self.latinise:
+            cache: Optional[LRUCache[str, str]] = self.cache
+            # Other threads using the same cache can change these in the meantime,
+            # so these counts are only exact if the cache is not shared between threads.
+            hits: int = cache.hits if cache is not None else 0
+            misses: int = cache.misses if cache is not None else 0
+
+            start: float = perf_counter()
+            strings = [self._latinise(s) if s is not None else None for s in strings]
+            stats._record("latinise", count, perf_counter() - start)
+
+            if cache is not None:
+                stats._record("cache_hits", cache.hits - hits)
+                stats._record("cache_misses", cache.misses - misses)
+
+        start = perf_counter()
+        strings = [self._modify(s) if s is not None else None for s in strings]
+        stats._record("normalize", count, perf_counter() - start)
+
+        return strings
@@ -0,0 +1,191 @@
+import asyncio
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stringmatch.asyncmatch import AsyncMatch
+from stringmatch.match import Match
+from stringmatch.scorer import JaroWinklerScorer
+
+searches = [
+    "stringmat",
+    "strinma",
+    "strings",
+    "mtch",
+    "whatever",
+    "s",
+    "",
+    "「 Tournament Official 」",
+    "Africa",
+    None,
+    5,
+]
+
+
+async def aiterate(items):
+    for item in items:
+        yield item
+
+
+def test_async_match():
+    async def run():
+        match = AsyncMatch()
+
+        assert await match.match("stringmatch", "strmatch") is True
+        assert await match.match("stringmatch", "something else") is False
+        assert await match.match_with_ratio("stringmatch", "strmatch") == (True, 84)
+        assert await match.match_with_ratio("test", "nope", score=20) == (True, 25)
+
+    asyncio.run(run())
+
+
+@pytest.mark.pure_python
+def test_async_get_best_matches():
+    async def run():
+        for settings in [
+            {},
+            {"include_partial": True, "alphanumeric": True},
+            {"scorer": JaroWinklerScorer, "latinise": True},
+        ]:
+            sync = Match(**settings)  # type: ignore
+
+            for chunk_size in [1, 3, 1024]:
+                match = AsyncMatch(chunk_size=chunk_size, **settings)  # type: ignore
+
+                for string in ["stringmatch", "official", "", None]:
+                    for limit in [1, 2, None]:
+                        expected = sync.get_best_matches_with_ratio(
+                            string, searches, score=40, limit=limit  # type: ignore
+                        )
+
+                        assert (
+                            await match.get_best_matches_with_ratio(
+                                string, searches, score=40, limit=limit  # type: ignore
+                            )
+                            == expected
+                        )
+                        assert (
+                            await match.get_best_matches_with_ratio(
+                                string, aiterate(searches), score=40, limit=limit  # type: ignore
+                            )
+                            == expected
+                        )
+
+                    assert await match.get_best_matches(
+                        string, searches, score=40, limit=0  # type: ignore
+                    ) == sync.get_best_matches(
+                        string, searches, score=40, limit=0
+                    )  # type: ignore
+                    assert await match.get_best_match(
+                        string, searches  # type: ignore
+                    ) == sync.get_best_match(
+                        string, searches
+                    )  # type: ignore
+                    assert await match.get_best_match_with_ratio(
+                        string, searches  # type: ignore
+                    ) == sync.get_best_match_with_ratio(
+                        string, searches
+                    )  # type: ignore
+
+    asyncio.run(run())
+
+
+@pytest.mark.pure_python
+def test_async_get_best_matches_many():
+    async def run():
+        strings = ["stringmatch", "tset", None, "", "official"]
+        match = AsyncMatch(chunk_size=2, cache_size=10)
+
+        assert await match.get_best_matches_many(
+            strings, aiterate(searches), score=40  # type: ignore
+        ) == Match().get_best_matches_many(
+            strings, searches, score=40
+        )  # type: ignore
+        assert await match.get_best_matches_many_with_ratio(
+            strings, searches, score=40, limit=0  # type: ignore
+        ) == Match().get_best_matches_many_with_ratio(
+            strings, searches, score=40, limit=0  # type: ignore
+        )
+        assert await match.get_best_matches_many([], searches) == []  # type: ignore
+
+        assert match.cache is not None
+        assert match.pruned > 0
+
+    asyncio.run(run())
+
+
+def test_async_get_best_matches_many_streaming():
+    submitted = []
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def submit(self, *args, **kwargs):
+            submitted.append(1)
+            return super().submit(*args, **kwargs)
+
+    executor = CountingExecutor(max_workers=1)
+    read = []
+
+    async def strings():
+        for string in ["strmatch", "test", "tset", "stringmatch"]:
+            read.append(len(submitted))
+            yield string
+
+    async def run():
+        match = AsyncMatch(chunk_size=2, executor=executor)
+        assert await match.get_best_matches_many(
+            ["stringmatch", "test"], strings()
+        ) == [["stringmatch", "strmatch"], ["test", "tset"]]
+
+    asyncio.run(run())
+    executor.shutdown()
+
+    # The strings get prepared in the executor, and every chunk gets scored before the next one is read.
+    assert read == [1, 1, 2, 2]
+    assert len(submitted) == 3
+
+
+def test_async_match_cancel():
+    random.seed(2468)
+
+    strings = [
+        "".join(random.choice("abcdef") for _ in range(random.randint(1, 20)))
+        for _ in range(20000)
+    ]
+    scored = []
+    started = threading.Event()
+
+    # Compiled classes cannot be subclassed, so the chunks are counted in the executor.
+    class CountingExecutor(ThreadPoolExecutor):
+        def submit(self, *args, **kwargs):
+            scored.append(1)
+            started.set()
+            return super().submit(*args, **kwargs)
+
+    executor = CountingExecutor(max_workers=1)
+
+    async def run():
+        match = AsyncMatch(chunk_size=10, executor=executor)
+        task = asyncio.create_task(
+            match.get_best_matches("abcdef", strings, score=0, limit=None)
+        )
+
+        # The event loop keeps running while the search is going on.
+        while not started.is_set():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    executor.shutdown()
+
+    # The search stopped long before every chunk was scored.
+    assert 0 < len(scored) < len(strings) / 10
+
+    with pytest.raises(ValueError):
+        AsyncMatch(chunk_size=0)
@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stringmatch.asyncratio import AsyncRatio, _read_chunk
+from stringmatch.ratio import Ratio
+from stringmatch.scorer import JaroScorer
+
+searches = ["stringmat", "strinma", "strings", "mtch", "whatever", "s", "", None, 5]
+
+
+async def aiterate(items):
+    for item in items:
+        yield item
+
+
+def test_async_ratio():
+    async def run():
+        ratio = AsyncRatio()
+
+        assert await ratio.ratio("stringmatch", "strmatch") == 84
+        assert await ratio.ratio("stringmatch", "strmatch", score_cutoff=90) == 0
+        assert await ratio.partial_ratio("testbot", "testbot test") == 85
+        assert await ratio.partial_ratio("", "test") == 0
+
+    asyncio.run(run())
+
+
+@pytest.mark.pure_python
+def test_async_ratio_list():
+    async def run():
+        for settings in [{}, {"scorer": JaroScorer, "include_partial": True}]:
+            expected = Ratio(**settings).ratio_list("stringmatch", searches)  # type: ignore
+
+            for chunk_size in [1, 4, 1024]:
+                ratio = AsyncRatio(chunk_size=chunk_size, **settings)  # type: ignore
+
+                assert await ratio.ratio_list("stringmatch", searches) == expected  # type: ignore
+                assert (
+                    await ratio.ratio_list("stringmatch", aiterate(searches))
+                    == expected
+                )
+                assert await ratio.ratio_list(None, searches) == [0] * len(searches)  # type: ignore
+                assert await ratio.ratio_list("stringmatch", []) == []
+
+    asyncio.run(run())
+
+
+@pytest.mark.pure_python
+def test_async_ratio_matrix():
+    async def run():
+        strings = ["stringmatch", "something", None, ""]
+        expected = Ratio().ratio_matrix(strings, searches)  # type: ignore
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ratio = AsyncRatio(executor=executor, chunk_size=3, cache_size=10)
+
+            assert await ratio.ratio_matrix(strings, searches) == expected  # type: ignore
+            assert await ratio.ratio_matrix(strings, aiterate(searches)) == expected  # type: ignore
+            assert await ratio.ratio_matrix([], searches) == []  # type: ignore
+
+        assert ratio.cache is not None
+        assert AsyncRatio().cache is None
+
+    asyncio.run(run())
+
+
+def test_async_ratio_chunks():
+    async def run():
+        iterator = iter(range(5))
+        assert await _read_chunk(iterator, 2) == [0, 1]
+        assert await _read_chunk(iterator, 4) == [2, 3, 4]
+        assert await _read_chunk(iterator, 4) == []
+
+        iterator = aiterate(range(5)).__aiter__()
+        assert await _read_chunk(iterator, 3) == [0, 1, 2]
+        assert await _read_chunk(iterator, 3) == [3, 4]
+        assert await _read_chunk(iterator, 3) == []
+
+    asyncio.run(run())
+
+    with pytest.raises(ValueError):
+        AsyncRatio(chunk_size=0)
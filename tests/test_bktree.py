@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from stringmatch.bktree import BKTree
+from stringmatch.distance import Distance
+
+
+@pytest.mark.pure_python
+def test_bktree_add():
+    tree = BKTree()
+    assert len(tree) == 0
+    assert tree.within("test", 5) == []
+    assert tree.nearest("test") == []
+
+    assert tree.add("test") is True
+    assert tree.add("test") is False
+    assert tree.add("") is False
+    assert tree.add(None) is False  # type: ignore
+    assert tree.add_list(["tset", "nope", "test", "testing"]) == 3
+    assert len(tree) == 4
+
+    assert "test" in tree
+    assert "tes" not in tree
+    assert "" not in tree
+    assert None not in tree
+
+
+@pytest.mark.pure_python
+def test_bktree_within():
+    tree = Distance().bktree(["stringmatch", "strmatch", "something different", ""])
+    assert len(tree) == 3
+    assert tree.within("stringmatch", 3) == [("stringmatch", 0), ("strmatch", 3)]
+    assert tree.within("stringmatch", 2) == [("stringmatch", 0)]
+    assert tree.within("", 100) == []
+    assert tree.within(None, 100) == []  # type: ignore
+
+
+def test_bktree_nearest():
+    tree = BKTree(["kitten", "sitting", "mitten", "bitten", "written"])
+    assert tree.nearest("kitten") == [("kitten", 0)]
+    assert tree.nearest("kitten", 3) == [("kitten", 0), ("mitten", 1), ("bitten", 1)]
+    assert tree.nearest("kitten", 0) == []
+    assert tree.nearest("", 3) == []
+    assert len(tree.nearest("kitten", 100)) == 5
+
+
+def test_bktree_same_as_distance():
+    random.seed(1213)
+
+    strings = [
+        "".join(random.choice("abcd") for _ in range(random.randint(1, 10)))
+        for _ in range(500)
+    ]
+    # Duplicates are only added once.
+    unique = list(dict.fromkeys(strings))
+    tree = BKTree(strings)
+
+    for string in strings[:50]:
+        distances = [
+            (d, i, s)
+            for i, (s, d) in enumerate(
+                zip(unique, Distance().distance_list(string, unique))
+            )
+        ]
+
+        for max_distance in [0, 1, 3]:
+            assert tree.within(string, max_distance) == [
+                (s, d) for d, _, s in sorted(distances) if d <= max_distance  # type: ignore
+            ]
+
+        for n in [1, 5, 20]:
+            assert tree.nearest(string, n) == [
+                (s, d) for d, _, s in sorted(distances)[:n]  # type: ignore
+            ]
@@ -0,0 +1,184 @@
+import pytest
+
+from stringmatch import cache as cache_module
+from stringmatch.cache import LRUCache
+from stringmatch.match import Match
+from stringmatch.ratio import Ratio
+from stringmatch.scorer import JaroScorer
+from stringmatch.stats import Stats
+
+
+def test_lru_cache():
+    cache: LRUCache[str, int] = LRUCache(2)
+    assert cache.hit_rate == 0
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    assert cache.get("c") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.5
+
+    # "b" is now the least recently used entry.
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 3
+
+    with pytest.raises(ValueError):
+        LRUCache(0)
+    with pytest.raises(ValueError):
+        LRUCache(1, ttl=0)
+
+
+def test_lru_cache_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module, "monotonic", lambda: now[0])
+
+    cache: LRUCache[str, int] = LRUCache(2, ttl=10)
+    cache.put("a", 1)
+    now[0] = 105.0
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    now[0] = 110.0
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.expirations == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert len(cache) == 1
+
+    # Caching it again starts the time again.
+    cache.put("b", 3)
+    now[0] = 119.0
+    assert cache.get("b") == 3
+
+    cache.put("c", 4)
+    cache.put("d", 5)
+    assert cache.evictions == 1
+    assert cache.get("b") is None
+    cache.clear()
+    assert cache._expires == {}
+
+
+def test_latinise_cache():
+    assert Ratio().cache is None
+    assert Match().cache is None
+
+    ratio = Ratio(latinise=True, cache_size=2)
+    assert ratio.ratio("séärçh", "search") == 100
+    assert ratio.ratio("séärçh", "search") == 100
+    assert ratio.cache is not None
+    # Ascii strings are never latinised, so they are not cached.
+    assert (ratio.cache.hits, ratio.cache.misses) == (1, 1)
+    assert ratio.ratio_list("ジャパニーズ", ["ziyapani-zu", "ジャパ"]) == [100, 71]
+    assert ratio.cache.evictions == 1
+
+    match = Match(latinise=True, cache_size=10)
+    assert match.get_best_match("öfficiäl", ["official", "öfficiäl"]) == "official"
+    assert match.match("öfficiäl", "official")
+    assert match.cache is not None
+    assert (match.cache.hits, match.cache.misses) == (2, 1)
+    assert match.index(["öfficiäl"]).get_best_match("öfficiäl") == "öfficiäl"
+    assert match.cache.hits == 4
+
+
+@pytest.mark.pure_python
+def test_result_cache():
+    stats = Stats()
+    match = Match(result_cache_size=10, stats=stats)
+    assert Match().result_cache is None
+
+    index = match.index(["strmatch", "stringmatch", "test"])
+    assert index.get_best_matches("stringmatch") == ["stringmatch", "strmatch"]
+    scored = stats.counts["score"]
+    matches = index.get_best_matches_with_ratio("stringmatch")
+    assert matches == [("stringmatch", 100), ("strmatch", 84)]
+    assert match.result_cache is not None
+    assert (match.result_cache.hits, match.result_cache.misses) == (1, 1)
+    assert stats.counts["result_cache_hits"] == 1
+    assert stats.counts["score"] == scored
+
+    # Changing the result does not change the cached result.
+    matches.clear()
+    assert index.get_best_matches_with_ratio("stringmatch") == [
+        ("stringmatch", 100),
+        ("strmatch", 84),
+    ]
+
+    # A different index, score or limit is a different search.
+    other = match.index(["strmatch", "stringmatch", "test"], ngram_size=2)
+    assert other.get_best_matches("stringmatch") == ["stringmatch", "strmatch"]
+    assert index.get_best_matches("stringmatch", score=90) == ["stringmatch"]
+    assert index.get_best_matches("stringmatch", limit=1) == ["stringmatch"]
+    assert Match(scorer=JaroScorer, result_cache_size=10).index(
+        ["strmatch"]
+    ).get_best_matches_with_ratio("stringmatch") == [("strmatch", 91)]
+    assert match.result_cache.misses == 4
+    assert match.result_cache.hits == 2
+
+    # Strings that are not strings are never cached.
+    assert index.get_best_matches(1) == []  # type: ignore
+    assert match.result_cache.misses == 4
+    assert len(match.result_cache) == 4
+
+
+def test_result_cache_list():
+    match = Match(result_cache_size=10)
+    string_list = ["strmatch", "test"]
+    assert match.get_best_matches("stringmatch", string_list) == ["strmatch"]
+
+    # Searches of plain lists are never cached, so changing a list in place is always noticed.
+    string_list[0] = "stringmatch"
+    assert match.get_best_matches("stringmatch", string_list) == ["stringmatch"]
+    assert match.result_cache is not None
+    assert len(match.result_cache) == 0
+    assert match.result_cache.misses == 0
+
+
+def test_result_cache_index():
+    match = Match(result_cache_size=10)
+    index = match.index(["strmatch", "stringmatch", "test"])
+    assert index.get_best_matches("stringmatch") == ["stringmatch", "strmatch"]
+    assert index.get_best_matches_many(["stringmatch", "tset"]) == [
+        ["stringmatch", "strmatch"],
+        ["test"],
+    ]
+    assert match.result_cache is not None
+    assert (match.result_cache.hits, match.result_cache.misses) == (1, 2)
+
+    # Every change of a mutable index is a new snapshot, so the cached results are never out of date.
+    mutable = match.mutable_index(["strmatch", "test"])
+    assert mutable.get_best_matches("stringmatch") == ["strmatch"]
+    mutable.add("stringmatch")
+    assert mutable.get_best_matches("stringmatch") == ["stringmatch", "strmatch"]
+    mutable.remove(2)
+    assert mutable.get_best_matches("stringmatch") == ["strmatch"]
+    assert mutable.get_best_matches("stringmatch") == ["strmatch"]
+    assert (match.result_cache.hits, match.result_cache.misses) == (2, 5)
+
+
+def test_result_cache_many():
+    match = Match(result_cache_size=3)
+    index = match.index(["strmatch", "stringmatch", "test"])
+    assert index.get_best_matches("stringmatch") == ["stringmatch", "strmatch"]
+
+    # The index built for a single call never fills the result cache.
+    assert match.get_best_matches_many(
+        ["stringmatch", "tset", "strmatch", "something else"],
+        ["strmatch", "stringmatch", "test"],
+        limit=0,
+    ) == [["stringmatch", "strmatch"], ["test"], ["strmatch", "stringmatch"], []]
+    assert match.result_cache is not None
+    assert len(match.result_cache) == 1
+    assert match.result_cache.evictions == 0
+
+    assert index.get_best_matches("stringmatch") == ["stringmatch", "strmatch"]
+    assert match.result_cache.hits == 1
@@ -1,3 +1,5 @@
+import pytest
+
 from stringmatch.distance import Distance
 
 
@@ -11,9 +13,62 @@ def test_distance():
     )
 
 
+@pytest.mark.pure_python
 def test_distance_list():
     assert Distance().distance_list("kitten", ["sitting", "kitten"]) == [3, 0]
     assert Distance().distance_list(
         "stringmatch", ["strmtc", "string", "match", "matchstring", ""]
     ) == [5, 5, 6, 10, None]
     assert Distance().distance("kitten", "") is None
+    assert Distance().distance_list("", ["kitten", ""]) == [None, None]
+    assert Distance().distance_list("kitten", [None, "kitten"]) == [  # type: ignore
+        None,
+        0,
+    ]
+
+
+def test_max_distance():
+    assert Distance().distance("kitten", "sitting", max_distance=3) == 3
+    assert Distance().distance("kitten", "sitting", max_distance=2) == 3
+    assert Distance().distance("kitten", "sitting", max_distance=1) == 2
+    assert Distance().distance("kitten", "", max_distance=1) is None
+
+    strings = ["strmtc", "string", "match", "matchstring", "", "stringmatch"]
+    assert Distance().distance_list("stringmatch", strings, max_distance=5) == [
+        5,
+        5,
+        6,
+        6,
+        None,
+        0,
+    ]
+    assert Distance().distance_list("stringmatch", strings, max_distance=0) == [
+        1,
+        1,
+        1,
+        1,
+        None,
+        0,
+    ]
+
+    # Without a maximum, the distances are the same as one at a time.
+    assert Distance().distance_list("stringmatch", strings) == [
+        Distance().distance("stringmatch", s) for s in strings
+    ]
+
+
+@pytest.mark.pure_python
+def test_distance_array():
+    numpy = pytest.importorskip("numpy")
+
+    strings = ["strmtc", "string", "match", "matchstring", "", None, "stringmatch"]
+    array = Distance().distance_array("stringmatch", strings)  # type: ignore
+    assert isinstance(array, numpy.ndarray)
+    assert array.dtype == numpy.int32
+    assert array.tolist() == [5, 5, 6, 10, -1, -1, 0]
+
+    assert Distance().distance_array(
+        "stringmatch", strings, max_distance=5  # type: ignore
+    ).tolist() == [5, 5, 6, 6, -1, -1, 0]
+    assert Distance().distance_array("", ["kitten"]).tolist() == [-1]
+    assert Distance().distance_array("kitten", []).tolist() == []
@@ -0,0 +1,343 @@
+import random
+import sys
+from array import array
+
+import pytest
+
+from stringmatch.index import MatchIndex
+from stringmatch.match import Match
+from stringmatch.scorer import JaroScorer, LevenshteinScorer
+
+searches = [
+    "stringmat",
+    "strinma",
+    "strings",
+    "mtch",
+    "whatever",
+    "s",
+    "",
+    "「 Tournament Official 」",
+    "Africa",
+    None,
+    5,
+]
+
+
+def test_index():
+    index = Match().index(["test", "nope", "tset"])
+    assert isinstance(index, MatchIndex)
+    assert len(index) == 3
+
+    # The index does not change together with the list.
+    string_list = ["test"]
+    index = Match().index(string_list)
+    string_list.append("tset")
+    assert len(index) == 1
+
+
+@pytest.mark.pure_python
+def test_index_get_best_match():
+    index = Match().index(["test", "nope", "tset"])
+    assert index.get_best_match("test") == "test"
+    assert index.get_best_match("whatever") is None
+    assert index.get_best_match_with_ratio("test") == ("test", 100)
+    assert index.get_best_match_with_ratio("whatever") is None
+    assert index.get_best_match(None) is None  # type: ignore
+
+    assert Match(include_partial=True, latinise=True).index(
+        ["Africa", "「 Tournament Official 」"]
+    ).get_best_match_with_ratio("öfficiäl", score=40) == (
+        "「 Tournament Official 」",
+        75,
+    )
+
+
+@pytest.mark.pure_python
+def test_index_get_best_matches():
+    index = Match().index(["test", "nope", "tset"])
+    assert index.get_best_matches("test") == ["test", "tset"]
+    assert index.get_best_matches("test", limit=1) == ["test"]
+    assert index.get_best_matches("test", limit=0) == ["test", "tset"]
+    assert index.get_best_matches_with_ratio("test", score=0, limit=None) == [
+        ("test", 100),
+        ("tset", 75),
+        ("nope", 25),
+    ]
+    assert index.get_best_matches_with_ratio(None, score=0) == [  # type: ignore
+        ("test", 0),
+        ("nope", 0),
+        ("tset", 0),
+    ]
+
+
+def test_index_get_best_matches_with_index():
+    index = Match().index(["test", "nope", "tset", "test"])
+    assert index.get_best_matches_with_index("test") == [(0, 100), (3, 100), (2, 75)]
+    assert index.get_best_matches_with_index("test", limit=0, score=80) == [
+        (0, 100),
+        (3, 100),
+    ]
+    assert index.get_best_match_with_index("tset") == (2, 100)
+    assert index.get_best_match_with_index("whatever") is None
+
+
+def test_index_get_best_matches_many():
+    index = Match().index(["test", "nope", "tset"])
+    assert index.get_best_matches_many(["test", "nope", "whatever"]) == [
+        ["test", "tset"],
+        ["nope"],
+        [],
+    ]
+    assert index.get_best_matches_many_with_ratio(
+        ["test", "nope"], limit=1, workers=2
+    ) == [[("test", 100)], [("nope", 100)]]
+
+
+@pytest.mark.pure_python
+def test_index_same_as_match():
+    for match in [
+        Match(),
+        Match(include_partial=True),
+        Match(include_partial=True, alphanumeric=True, scorer=JaroScorer),
+        Match(latinise=True, remove_punctuation=True, ignore_case=False),
+    ]:
+        index = match.index(searches)  # type: ignore
+
+        for query in ["stringmatch", "official", "s", "", "africa"]:
+            for score in [0, 40, 70]:
+                assert index.get_best_matches_with_ratio(
+                    query, score=score, limit=None
+                ) == match.get_best_matches_with_ratio(
+                    query, searches, score=score, limit=None  # type: ignore
+                )
+                assert index.get_best_match_with_ratio(
+                    query, score=score
+                ) == match.get_best_match_with_ratio(
+                    query, searches, score=score  # type: ignore
+                )
+
+
+@pytest.mark.pure_python
+def test_index_ngrams():
+    random.seed(1415)
+
+    strings = [
+        "".join(random.choice("abcde ") for _ in range(random.randint(0, 30)))
+        for _ in range(1000)
+    ] + searches
+    queries = random.sample(strings[:1000], 8) + ["abcde", "a", "", "ABC DE!"]
+
+    for match in [Match(), Match(alphanumeric=True, ignore_case=False)]:
+        full = match.index(strings)  # type: ignore
+
+        for ngram_size in [1, 2, 3]:
+            index = match.index(strings, ngram_size=ngram_size)  # type: ignore
+            assert index.ngram_size == ngram_size
+
+            for query in queries:
+                for score in [0, 50, 70, 90]:
+                    assert index.get_best_matches_with_ratio(
+                        query, score=score, limit=None
+                    ) == full.get_best_matches_with_ratio(
+                        query, score=score, limit=None
+                    )
+
+    index = Match().index(strings, ngram_size=2)  # type: ignore
+    # With a high cutoff score, only a small part of the strings gets scored.
+    candidates, pruned = index._candidates("abcde abcde abcde", 90)
+    assert candidates is not None
+    assert sum(map(len, candidates)) < len(strings) / 10
+    assert sum(map(len, candidates)) + pruned == len(
+        [s for s in index.prepared_list if s]
+    )
+
+    # Without the n-gram index, the candidates are the lists of positions of the index itself.
+    plain = Match().index(strings)  # type: ignore
+    candidates, pruned = plain._candidates("abcde", 90)
+    assert candidates is not None
+    assert all(any(c is b for b in plain._length_buckets.values()) for c in candidates)
+
+    # Without a cutoff score every string gets scored.
+    assert index._candidates("abcde", 0) == (None, 0)
+    assert index._candidates("", 90) == (None, 0)
+
+    # Partial matches and other scorers only skip strings by their length, not by their n-grams.
+    for match in [Match(include_partial=True), Match(scorer=JaroScorer)]:
+        assert match.index(strings, ngram_size=2)._candidates(  # type: ignore
+            "abcde", 90
+        ) == match.index(
+            strings
+        )._candidates(  # type: ignore
+            "abcde", 90
+        )
+    assert Match(scorer=LevenshteinScorer).index(strings)._candidates(
+        "abcde", 90
+    ) != index._candidates(  # type: ignore
+        "abcde", 90
+    )
+
+
+@pytest.mark.pure_python
+def test_index_save_load(tmp_path):
+    random.seed(1618)
+
+    strings = [
+        "".join(random.choice("abcdé ") for _ in range(random.randint(0, 30)))
+        for _ in range(1000)
+    ] + searches
+    queries = random.sample(strings[:1000], 5) + ["stringmatch", "", None]
+
+    for match in [Match(), Match(latinise=True, scorer=JaroScorer)]:
+        for ngram_size in [0, 3]:
+            path = str(tmp_path / f"strings{ngram_size}.idx")
+            index = match.index(strings, ngram_size=ngram_size)  # type: ignore
+            index.save(path)
+
+            loaded = match.load_index(path)
+            assert len(loaded) == len(index)
+            assert loaded.ngram_size == ngram_size
+            # The strings are read from the file when they are needed.
+            assert list(loaded.prepared_list) == index.prepared_list
+            assert loaded.lengths == index.lengths
+            # Non-strings are loaded as None.
+            assert list(loaded.string_list) == [
+                s if isinstance(s, str) else None for s in strings
+            ]
+            assert loaded.string_list[-1] is None
+            assert loaded.string_list[-3:-1] == ["Africa", None]
+            assert loaded._postings == index._postings
+            assert list(loaded._positions) == list(index._positions)
+            assert list(loaded._counts) == list(index._counts)
+
+            for query in queries:
+                for score in [50, 90]:
+                    assert loaded.get_best_matches_with_ratio(
+                        query, score=score, limit=None  # type: ignore
+                    ) == index.get_best_matches_with_ratio(
+                        query, score=score, limit=None  # type: ignore
+                    )
+
+            # A different Match class with the same settings can load it too.
+            assert (
+                Match(latinise=match.latinise, scorer=match.scorer)
+                .load_index(path)
+                .prepared_list[:]
+                == index.prepared_list
+            )
+
+    # Lone surrogates cannot be encoded as UTF-8 on their own.
+    surrogates = str(tmp_path / "surrogates.idx")
+    index = Match().index(["\ud800test", "tes\udfff", "test"], ngram_size=2)
+    index.save(surrogates)
+    loaded = Match().load_index(surrogates)
+    assert list(loaded.string_list) == ["\ud800test", "tes\udfff", "test"]
+    assert loaded._postings == index._postings
+    assert loaded.get_best_matches_with_ratio(
+        "\ud800tes"
+    ) == index.get_best_matches_with_ratio("\ud800tes")
+
+    # The n-grams are looked up in the directory of the file.
+    assert len(loaded._postings) == len(index._postings) == 2
+    assert dict(loaded._postings[4]) == index._postings[4]
+    assert "te" in loaded._postings[4] and 1 not in loaded._postings[4]
+    with pytest.raises(KeyError):
+        loaded._postings[3]
+    with pytest.raises(KeyError):
+        loaded._postings[4]["xx"]
+    with pytest.raises(IndexError):
+        loaded.string_list[3]
+
+    empty = str(tmp_path / "empty.idx")
+    Match().index([]).save(empty)
+    assert len(Match().load_index(empty)) == 0
+
+
+def test_index_load_errors(tmp_path):
+    path = str(tmp_path / "strings.idx")
+    Match(ignore_case=False).index(searches, ngram_size=2).save(path)  # type: ignore
+
+    # The settings have to match.
+    with pytest.raises(ValueError):
+        Match().load_index(path)
+    with pytest.raises(ValueError):
+        Match(ignore_case=False, scorer=JaroScorer).load_index(path)
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    other = str(tmp_path / "other.idx")
+
+    with open(other, "wb") as f:
+        f.write(b"not an index" + data)
+    with pytest.raises(ValueError):
+        Match(ignore_case=False).load_index(other)
+
+    # Pretends the file was written on a machine with the other byte order.
+    with open(other, "wb") as f:
+        f.write(
+            data.replace(
+                f'"byteorder": "{sys.byteorder}"'.encode(),
+                f'"byteorder": "{sys.byteorder[::-1]}"'.encode(),
+            )
+        )
+    with pytest.raises(ValueError):
+        Match(ignore_case=False).load_index(other)
+
+
+def test_index_find_duplicates():
+    index = Match(include_partial=True).index(
+        ["test", "This is a test!", "something else", "tset", None]  # type: ignore
+    )
+
+    assert index.find_duplicates() == [["test", "This is a test!", "tset"]]
+    assert index.find_duplicates_with_ratio(score=75) == [
+        ("test", "This is a test!", 75),
+        ("test", "tset", 75),
+    ]
+
+    # Pairs of strings whose length cannot reach the cutoff score are not compared.
+    index = Match().index(["a", "ab", "abcdefgh", "abcdefghi"])
+    assert index.find_duplicates_with_ratio(score=90) == [("abcdefgh", "abcdefghi", 94)]
+    assert index.pruned == 5
+
+
+@pytest.mark.pure_python
+def test_index_join():
+    index = Match().index(["strmatch", "test", "something else", "tset"], ngram_size=2)
+
+    left_positions, right_positions, scores = index.join(
+        ["stringmatch", "nothing", "tset", "stringmatch", None]  # type: ignore
+    )
+    assert left_positions.typecode == "Q"
+    assert right_positions.typecode == "I"
+    assert scores.typecode == "B"
+    assert list(left_positions) == [0, 2, 3]
+    assert list(right_positions) == [0, 3, 0]
+    assert list(scores) == [84, 100, 84]
+
+    assert index.join(["test"], limit=0) == (
+        array("Q", [0, 0]),
+        array("I", [1, 3]),
+        array("B", [100, 75]),
+    )
+    assert index.join(iter([])) == (array("Q"), array("I"), array("B"))
+
+
+def test_index_join_workers(monkeypatch):
+    import concurrent.futures
+
+    pools = []
+
+    class CountingPool(concurrent.futures.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", CountingPool)
+
+    index = Match().index(["strmatch", "test", "something else", "tset"])
+    left = [f"test{i}" for i in range(3000)] + ["stringmatch"]
+
+    # Every chunk of strings is searched by the same threads.
+    assert index.join(left, workers=2) == index.join(left)
+    assert len(pools) == 1
@@ -1,4 +1,10 @@
+import itertools
+import random
+
+import pytest
+
 from stringmatch.match import Match
+from stringmatch.ratio import Ratio
 from stringmatch.scorer import (
     BaseScorer,
     JaroScorer,
@@ -184,6 +190,7 @@ def test_get_best_matches():
     ) == ["Link", "Pichu", "Sonic", "Incineroar"]
 
 
+@pytest.mark.pure_python
 def test_get_best_matches_with_ratio():
     assert Match().get_best_matches_with_ratio("test", ["test", "nope", "tset"]) == [
         ("test", 100),
@@ -264,3 +271,315 @@ def test_get_best_matches_with_ratio():
         ("divxy", 95),
         ("d", 95),
     ]
+
+
+@pytest.mark.pure_python
+def test_get_best_matches_with_ratio_limit():
+    random.seed(5678)
+
+    # Enough strings for multiple chunks, with lots of ties.
+    searches = [
+        "".join(random.choice("abc ") for _ in range(random.randint(0, 8)))
+        for _ in range(3000)
+    ] + [None, 5]
+
+    for match in [Match(), Match(include_partial=True, scorer=JaroScorer)]:
+        for string in ["abc", "ab ca", None]:
+            ratio = Ratio(scorer=match.scorer, include_partial=match.include_partial)
+
+            # This is how the matches were sorted before, with every match in one list.
+            expected = sorted(
+                [(s, r) for s in searches if (r := ratio.ratio(string, s)) >= 60],  # type: ignore
+                key=lambda x: (
+                    x[1],
+                    -abs(
+                        len(string) - len(x[0])  # type: ignore
+                        if all(isinstance(c, str) for c in [x[0], string])
+                        else float("-inf")
+                    ),
+                    len(x[0]) if isinstance(x[0], str) else float("-inf"),
+                ),
+                reverse=True,
+            )
+
+            for limit in [1, 5, 100, None]:
+                assert (
+                    match.get_best_matches_with_ratio(
+                        string, searches, score=60, limit=limit  # type: ignore
+                    )
+                    == expected[:limit]
+                )
+
+
+@pytest.mark.pure_python
+def test_get_best_matches_many():
+    searches = ["test", "nope", "tset", "stringmatch", None, ""]
+    strings = ["test", "nope", "strmatch", None, "", "whatever"]
+
+    for workers in [1, 2, -1]:
+        assert Match().get_best_matches_many(
+            strings, searches, workers=workers  # type: ignore
+        ) == [
+            Match().get_best_matches(s, searches) for s in strings
+        ]  # type: ignore
+
+        assert Match(include_partial=True).get_best_matches_many_with_ratio(
+            strings, searches, score=20, limit=2, workers=workers  # type: ignore
+        ) == [
+            Match(include_partial=True).get_best_matches_with_ratio(
+                s, searches, score=20, limit=2  # type: ignore
+            )
+            for s in strings
+        ]
+
+    assert Match().get_best_matches_many([], searches) == []
+
+
+@pytest.mark.pure_python
+def test_get_best_matches_pruned():
+    random.seed(9012)
+
+    searches = [
+        "".join(random.choice("abcd ") for _ in range(random.randint(0, 40)))
+        for _ in range(2000)
+    ] + [None, 5]
+
+    for scorer in [LevenshteinScorer, JaroScorer, JaroWinklerScorer]:
+        for include_partial in [False, True]:
+            match = Match(scorer=scorer, include_partial=include_partial)
+            ratio = Ratio(scorer=scorer, include_partial=include_partial)
+            indexes = [match.index(searches), match.index(searches, ngram_size=2)]  # type: ignore
+
+            for string in ["abcd", "ab cd ab cd ab cd ab", "a"]:
+                for score in [50, 80, 95]:
+                    # Every string gets scored here, so nothing is skipped.
+                    expected = sorted(
+                        [
+                            (s, r, i)
+                            for i, s in enumerate(searches)
+                            if (r := ratio.ratio(string, s)) >= score  # type: ignore
+                        ],
+                        key=lambda x: (
+                            x[1],
+                            -abs(len(string) - len(x[0])),
+                            len(x[0]),
+                            -x[2],
+                        ),
+                        reverse=True,
+                    )
+
+                    for limit in [1, 5, None]:
+                        assert [
+                            (s, r) for s, r, _ in expected[:limit]
+                        ] == match.get_best_matches_with_ratio(
+                            string, searches, score=score, limit=limit  # type: ignore
+                        )
+
+                        for index in indexes:
+                            assert [
+                                (s, r) for s, r, _ in expected[:limit]
+                            ] == index.get_best_matches_with_ratio(
+                                string, score=score, limit=limit
+                            )
+
+            assert match.pruned > 0
+            assert all(index.pruned > 0 for index in indexes)
+
+    # Custom scorers have no upper bound, so nothing gets skipped.
+    class MyOwnScorer(BaseScorer):
+        def score(self, string1: str, string2: str) -> int:
+            return 100 if string1 == string2 else 0
+
+    match = Match(scorer=MyOwnScorer)
+    assert match.get_best_matches("abcd", searches + ["abcd"], score=90) == ["abcd"]  # type: ignore
+    assert match.pruned == 0
+
+
+def test_get_best_matches_with_index():
+    random.seed(8642)
+
+    records = [
+        {"id": i, "name": "".join(random.choice("abc ") for _ in range(8))}
+        for i in range(3000)
+    ]
+    names = [r["name"] for r in records]
+
+    for match in [Match(), Match(include_partial=True, scorer=JaroScorer)]:
+        for limit in [1, 5, None]:
+            # The same matches in the same order as matching the names.
+            matches = match.get_best_matches_with_index(
+                "abc ab", records, score=60, limit=limit, key=lambda r: r["name"]
+            )
+            assert [(names[p], r) for p, r in matches] == (
+                match.get_best_matches_with_ratio("abc ab", names, score=60, limit=limit)  # type: ignore
+            )
+
+    match = Match()
+    assert match.get_best_matches_with_index("test", ["tset", "test", "test"]) == [
+        (1, 100),
+        (2, 100),
+        (0, 75),
+    ]
+    assert match.get_best_matches_with_index("test", ["test", "tset"], limit=0) == [
+        (0, 100),
+        (1, 75),
+    ]
+    assert match.get_best_match_with_index(
+        "stringmatch", [("test", 1), ("strmatch", 2)], key=lambda r: r[0]
+    ) == (1, 84)
+    assert match.get_best_match_with_index("whatever", ["test"]) is None
+
+
+@pytest.mark.pure_python
+def test_iter_matches():
+    random.seed(1357)
+
+    searches = [
+        "".join(random.choice("abc ") for _ in range(random.randint(0, 8)))
+        for _ in range(3000)
+    ] + [None, 5]
+
+    for match in [Match(), Match(include_partial=True, scorer=JaroScorer)]:
+        for string in ["abc", "ab ca", None]:
+            for score in [0, 60, 90]:
+                expected = [
+                    (i, s, r)
+                    for i, s in enumerate(searches)
+                    if (r := match.match_with_ratio(string, s, score=score)[1]) >= score  # type: ignore
+                ]
+
+                assert (
+                    list(match.iter_matches(string, iter(searches), score=score))  # type: ignore
+                    == expected
+                )
+
+    # The strings are read lazily, so this works on endless generators too.
+    endless = (f"test{i}" for i in itertools.count())
+    assert list(itertools.islice(Match().iter_matches("test5", endless), 3)) == [
+        (0, "test0", 80),
+        (1, "test1", 80),
+        (2, "test2", 80),
+    ]
+    assert next(endless) == "test1024"
+
+    records = ({"name": s} for s in ["test", "tset", "whatever"])
+    assert list(Match().iter_matches("test", records, key=lambda r: r["name"])) == [
+        (0, "test", 100),
+        (1, "tset", 75),
+    ]
+
+
+@pytest.mark.pure_python
+def test_stream_best_matches():
+    random.seed(2468)
+
+    searches = [
+        "".join(random.choice("abc ") for _ in range(random.randint(0, 8)))
+        for _ in range(3000)
+    ] + [None, 5]
+
+    for match in [Match(), Match(include_partial=True, scorer=JaroScorer)]:
+        for string in ["abc", "ab ca", None]:
+            for limit in [1, 5, 0, None]:
+                expected = match.get_best_matches_with_ratio(
+                    string, searches, score=60, limit=limit  # type: ignore
+                )
+                streamed = match.stream_best_matches(
+                    string, (s for s in searches), score=60, limit=limit  # type: ignore
+                )
+
+                assert [(s, r) for _, s, r in streamed] == expected
+                assert all(searches[i] == s for i, s, _ in streamed)
+
+    assert Match().stream_best_matches("test", iter([])) == []
+    assert Match().stream_best_matches(
+        "test", iter([("tset",), ("test",)]), key=lambda r: r[0]
+    ) == [(1, "test", 100), (0, "tset", 75)]
+
+
+def test_find_duplicates():
+    string_list = ["stringmatch", "test", "strmatch", "tset", "something else", "tést"]
+
+    assert Match().find_duplicates(string_list) == [
+        ["stringmatch", "strmatch"],
+        ["test", "tset", "tést"],
+    ]
+    assert Match(latinise=True).find_duplicates(string_list, score=80) == [
+        ["stringmatch", "strmatch"],
+        ["test", "tést"],
+    ]
+    assert Match(latinise=True).find_duplicates_with_ratio(string_list, workers=2) == [
+        ("test", "tést", 100),
+        ("stringmatch", "strmatch", 84),
+        ("test", "tset", 75),
+        ("tset", "tést", 75),
+    ]
+    # Strings end up in the same group through other strings, even if they are not similar themselves.
+    assert Match().find_duplicates(["abcd", "abfe", "xyz", "abce"]) == [
+        ["abcd", "abfe", "abce"]
+    ]
+    assert Match().find_duplicates(["test", "", None, "", 5, "test"]) == [  # type: ignore
+        ["test", "test"]
+    ]
+    assert Match().find_duplicates([]) == []
+
+
+def test_find_duplicates_all_pairs():
+    random.seed(1357)
+
+    string_list = [
+        "".join(random.choice("abc ") for _ in range(random.randint(0, 8)))
+        for _ in range(300)
+    ] + [None, 5]
+
+    for match in [Match(), Match(scorer=JaroWinklerScorer)]:
+        for score in [50, 80, 100]:
+            # The same pairs as comparing every string to every other string.
+            expected = sorted(
+                (
+                    (a, b, r)
+                    for i, a in enumerate(string_list)
+                    for b in string_list[i + 1 :]
+                    if isinstance(a, str) and isinstance(b, str) and a and b
+                    for r in [match.match_with_ratio(a, b, score=score)[1]]
+                    if r >= score
+                ),
+                key=lambda p: -p[2],
+            )
+
+            assert (
+                match.find_duplicates_with_ratio(string_list, score=score)  # type: ignore
+                == expected
+            )
+
+
+@pytest.mark.pure_python
+def test_join():
+    random.seed(8642)
+
+    right = [
+        "".join(random.choice("abc ") for _ in range(random.randint(0, 8)))
+        for _ in range(300)
+    ] + [None, 5]
+    left = [
+        "".join(random.choice("abcd") for _ in range(random.randint(0, 6)))
+        for _ in range(300)
+    ] + [None, 5, "abc"]
+
+    for match in [Match(), Match(scorer=JaroScorer, include_partial=True)]:
+        for limit in [1, 3, None]:
+            left_positions, right_positions, scores = match.join(
+                iter(left), right, score=60, limit=limit, workers=2  # type: ignore
+            )
+
+            # The same matches as searching for every string on its own.
+            assert [
+                (i, right[p], r)
+                for i, p, r in zip(left_positions, right_positions, scores)
+            ] == [
+                (i, s, r)
+                for i, string in enumerate(left)
+                for s, r in match.get_best_matches_with_ratio(
+                    string, right, score=60, limit=limit  # type: ignore
+                )
+            ]
@@ -0,0 +1,193 @@
+import random
+import threading
+
+import pytest
+
+from stringmatch.index import MatchIndex, _build_postings
+from stringmatch.match import Match
+from stringmatch.mutable import MutableMatchIndex
+
+
+def random_string() -> str:
+    return "".join(random.choice("abcde ") for _ in range(random.randint(0, 9)))
+
+
+def postings(index: MatchIndex) -> dict:
+    return {
+        (length, ngram): sorted(
+            zip(index._positions[start:end], index._counts[start:end])
+        )
+        for length, length_postings in index._postings.items()
+        for ngram, (start, end) in length_postings.items()
+    }
+
+
+def test_mutable_index():
+    index = Match().mutable_index(["strmatch", "test", "something else"])
+    assert isinstance(index, MutableMatchIndex)
+    assert len(index) == 3
+    assert index.version == 0
+
+    assert index.add("stringmatch") == 3
+    assert index.add_many(["tset", "test"]) == [4, 5]
+    assert index.get_best_matches("stringmatch") == ["stringmatch", "strmatch"]
+
+    snapshot = index.snapshot()
+    index.remove(3)
+    index.update(1, "text")
+    assert index.version == 4
+    assert len(index) == 5
+
+    assert index.get_best_match("stringmatch") == "strmatch"
+    assert index.get_best_match_with_ratio("tset") == ("tset", 100)
+    assert index.get_best_matches_with_ratio("test") == [
+        ("test", 100),
+        ("text", 75),
+        ("tset", 75),
+    ]
+    assert index.get_best_matches_many(["stringmatch", "tst"]) == [
+        ["strmatch"],
+        ["tset", "test"],
+    ]
+    assert index.get_best_matches_many_with_ratio(["stringmatch"]) == [
+        [("strmatch", 84)]
+    ]
+    # The positions stay the same after removing strings.
+    assert index.get_best_matches_with_index("test") == [(5, 100), (1, 75), (4, 75)]
+    assert index.get_best_match_with_index("stringmatch") == (0, 84)
+    # Removed strings are never returned, even with a score of 0.
+    assert sorted(index.get_best_matches("stringmatch", score=0, limit=None)) == [
+        "something else",
+        "strmatch",
+        "test",
+        "text",
+        "tset",
+    ]
+    assert index.snapshot().string_list[3] is None
+    assert index.snapshot().find_duplicates() == [["text", "tset", "test"]]
+
+    # The snapshot from before does not change.
+    assert len(snapshot) == 6
+    assert snapshot.get_best_match("stringmatch") == "stringmatch"
+    assert snapshot.get_best_match("text", score=100) is None
+
+    index.get_best_matches("a", score=90)
+    assert index.pruned == index.snapshot().pruned > 0
+
+
+def test_mutable_index_errors():
+    index = Match().mutable_index(["test", "tset"])
+    index.remove(0)
+
+    for position in [0, 2, -1]:
+        with pytest.raises(IndexError):
+            index.remove(position)
+        with pytest.raises(IndexError):
+            index.update(position, "test")
+
+    # None would remove a string, so nothing else than strings can be added.
+    for string in [None, 5]:
+        with pytest.raises(TypeError):
+            index.add(string)  # type: ignore
+        with pytest.raises(TypeError):
+            index.add_many(["test", string])  # type: ignore
+        with pytest.raises(TypeError):
+            index.update(1, string)  # type: ignore
+
+    assert index.version == 1
+    assert len(index) == 1
+
+
+@pytest.mark.pure_python
+def test_mutable_index_random():
+    random.seed(97531)
+
+    for ngram_size in [0, 2, 3]:
+        for match in [Match(), Match(latinise=True, include_partial=True)]:
+            string_list = [random_string() for _ in range(200)] + [None, 5]
+            index = match.mutable_index(string_list, ngram_size=ngram_size)  # type: ignore
+            current = list(string_list)
+            removed = set()
+
+            for step in range(200):
+                live = [i for i in range(len(current)) if i not in removed]
+                action = random.random()
+
+                if action < 0.4:
+                    string = random_string()
+                    assert index.add(string) == len(current)
+                    current.append(string)
+                elif action < 0.7:
+                    position = random.choice(live)
+                    index.remove(position)
+                    removed.add(position)
+                else:
+                    position = random.choice(live)
+                    current[position] = random_string()
+                    index.update(position, current[position])
+
+                if step % 40:
+                    continue
+
+                # The same results as an index of the strings that are left.
+                expected = match.index(
+                    [s for i, s in enumerate(current) if i not in removed]  # type: ignore
+                )
+                for string in [random_string() for _ in range(3)]:
+                    for score in [0, 60]:
+                        assert index.get_best_matches_with_ratio(
+                            string, score=score, limit=None
+                        ) == expected.get_best_matches_with_ratio(
+                            string, score=score, limit=None
+                        )
+
+                if not ngram_size:
+                    continue
+
+                # The same n-gram index as building it again.
+                snapshot = index.snapshot()
+                postings_list = _build_postings(snapshot.prepared_list, ngram_size)
+                rebuilt = MatchIndex(match, [])
+                rebuilt._postings, rebuilt._positions, rebuilt._counts = postings_list
+                assert postings(snapshot) == postings(rebuilt)
+
+
+def test_mutable_index_loaded(tmp_path):
+    path = str(tmp_path / "strings.idx")
+    Match().index(["strmatch", "test", "tset"], ngram_size=2).save(path)
+
+    # A loaded index can be changed too, the file stays the same.
+    index = MutableMatchIndex(Match(), [])
+    index._index = Match().load_index(path)
+    index.update(0, "stringmatch")
+    index.remove(2)
+    assert index.get_best_matches("stringmatch") == ["stringmatch"]
+    assert index.get_best_matches("tset") == ["test"]
+    assert Match().load_index(path).get_best_matches("tset") == ["tset", "test"]
+
+
+def test_mutable_index_threads():
+    index = Match().mutable_index([f"name {i}" for i in range(500)], ngram_size=2)
+    errors = []
+    done = threading.Event()
+
+    def search():
+        while not done.is_set():
+            # Every change adds two names, a search never sees only one of them.
+            matches = index.get_best_matches("changed", score=90, limit=None)
+            if len(matches) % 2:
+                errors.append(matches)
+
+    threads = [threading.Thread(target=search) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for _ in range(50):
+        index.add_many(["changed", "changed"])
+
+    done.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(index) == 600
@@ -1,4 +1,7 @@
+import random
+
 import pytest
+from rapidfuzz.distance import Levenshtein
 
 from stringmatch.ratio import Ratio
 from stringmatch.scorer import (
@@ -9,6 +12,7 @@ from stringmatch.scorer import (
 )
 
 
+@pytest.mark.pure_python
 def test_ratio():
     assert Ratio().ratio("test", "test") == 100
     assert Ratio().ratio("bla", "nope") == 0
@@ -29,6 +33,11 @@ def test_ratio():
     assert Ratio(scorer=JaroWinklerScorer).ratio("test", "th test") == 60
     assert Ratio(scorer=JaroScorer).ratio("test", "th test") == 60
 
+    ratio = Ratio()
+    assert ratio.ratio("TESTbot test", "testbot") == 74
+    ratio.ignore_case = False
+    assert ratio.ratio("TESTbot test", "testbot") == 42
+
     with pytest.raises(TypeError):
         assert Ratio(scorer="nope").ratio("searchlib", "srechlib") == 82  # type: ignore
 
@@ -36,6 +45,7 @@ def test_ratio():
         assert Ratio(scorer=BaseScorer).ratio("searchlib", "srechlib") == 82
 
 
+@pytest.mark.pure_python
 def test_ratio_list():
     assert Ratio().ratio_list("test", ["test", "nope"]) == [100, 25]
     assert Ratio().ratio_list(
@@ -59,8 +69,65 @@ def test_ratio_list():
     assert Ratio(scorer=JaroWinklerScorer).ratio_list(
         "test", ["th test", "hwatever"]
     ) == [60, 58]
+    assert Ratio(scorer=JaroScorer).ratio_list("test", ["th test", "hwatever"]) == [
+        60,
+        58,
+    ]
+
+    assert Ratio().ratio_list(1, ["test", "nope"]) == [0, 0]  # type: ignore
+    assert Ratio().ratio_list("test", ["", None, "tset"]) == [0, 0, 75]  # type: ignore
+    assert Ratio(include_partial=True).ratio_list(
+        "test", ["testbot test", None, "tset"]  # type: ignore
+    ) == [85, 0, 75]
+
+    class MyOwnScorer(BaseScorer):
+        def score(self, string1: str, string2: str) -> float:
+            return 49.5
+
+    assert Ratio(scorer=MyOwnScorer).ratio_list("test", ["tset", ""]) == [50, 0]
+
+
+@pytest.mark.pure_python
+def test_iter_ratio_list():
+    strings = ["searchlib", "slib", None, "", "searching library", "spam"] * 500
+
+    assert list(Ratio().iter_ratio_list("srechlib", iter(strings))) == Ratio().ratio_list(  # type: ignore
+        "srechlib", strings  # type: ignore
+    )
+    assert list(Ratio().iter_ratio_list(None, iter(strings))) == [0] * len(strings)  # type: ignore
+    assert list(Ratio().iter_ratio_list("test", iter([]))) == []
 
+    # Only one chunk of strings is read at a time.
+    lines = iter(strings)
+    scores = Ratio().iter_ratio_list("srechlib", lines)  # type: ignore
+    assert next(scores) == 82
+    assert len(list(lines)) == len(strings) - 1024
 
+
+@pytest.mark.pure_python
+def test_ratio_matrix():
+    assert Ratio().ratio_matrix(["test", "srechlib"], ["tset", "searchlib"]) == [
+        [75, 15],
+        [33, 82],
+    ]
+    assert Ratio(include_partial=True).ratio_matrix(
+        ["test", 1, ""], ["testbot test", None]  # type: ignore
+    ) == [[85, 0], [0, 0], [0, 0]]
+    assert Ratio().ratio_matrix(
+        ["test", "srechlib", "x"], ["tset", "searchlib"], workers=2
+    ) == [[75, 15], [33, 82], [0, 0]]
+    assert Ratio().ratio_matrix([], ["tset"], workers=-1) == []
+
+
+def test_ratio_array():
+    numpy = pytest.importorskip("numpy")
+
+    array = Ratio().ratio_array("srechlib", ["searchlib", "slib", "spam", ""])
+    assert isinstance(array, numpy.ndarray)
+    assert array.tolist() == [82, 67, 17, 0]
+
+
+@pytest.mark.pure_python
 def test_partial_ratio():
     assert Ratio().partial_ratio("test124", "93210") == 17
     assert Ratio().partial_ratio("93210", "test124") == 17
@@ -84,3 +151,82 @@ def test_partial_ratio():
 
     assert Ratio(ignore_case=True).partial_ratio("TESTbot test", "testbot") == 85
     assert Ratio(ignore_case=False).partial_ratio("TESTbot test", "testbot") == 42
+
+
+def reference_partial_ratio(ratio: Ratio, string1: str, string2: str) -> int:
+    """The implementation of partial_ratio before the substrings were deduplicated."""
+    string1, string2 = ratio._prepare_strings(string1, string2)
+
+    if not string1 or not string2:
+        return 0
+
+    if len(string1) >= len(string2):
+        longer_string, shorter_string = string1, string2
+    else:
+        longer_string, shorter_string = string2, string1
+
+    blocks = [
+        block
+        for block in Levenshtein.editops(
+            longer_string, shorter_string
+        ).as_matching_blocks()
+        if (block.size > 1 or (block.size == 1 and block.a == 0))
+    ]
+
+    diff = len(longer_string) - len(shorter_string)
+
+    multiplier = 1.00
+
+    if diff >= 20:
+        multiplier = 0.65
+    elif diff >= 10:
+        multiplier = 0.75
+    elif diff >= 4:
+        multiplier = 0.85
+    elif diff >= 1:
+        multiplier = 0.95
+
+    scores = []
+
+    for block in blocks:
+        start = max((block.a - block.b), 0)
+        substring = longer_string[start : start + len(shorter_string)]
+
+        scores.append(
+            round(ratio.scorer().score(substring, shorter_string) * multiplier)
+        )
+
+    scores.append(round(ratio.scorer().score(string1, string2)))
+
+    return max(scores, default=0)
+
+
+def test_partial_ratio_regression():
+    random.seed(91011)
+
+    words = ["test", "string", "match", "word", "long", "a", "the", "official"]
+
+    def random_string() -> str:
+        if random.random() < 0.5:
+            return "".join(
+                random.choice("abcdefg ") for _ in range(random.randint(1, 250))
+            )
+        return " ".join(random.choice(words) for _ in range(random.randint(1, 40)))
+
+    strings = [random_string() for _ in range(400)]
+    pairs = list(zip(strings, reversed(strings))) + [
+        (random.choice(words), s) for s in strings
+    ]
+
+    for scorer in [LevenshteinScorer, JaroScorer, JaroWinklerScorer]:
+        ratio = Ratio(scorer=scorer)
+
+        for string1, string2 in pairs:
+            expected = reference_partial_ratio(ratio, string1, string2)
+            assert ratio.partial_ratio(string1, string2) == expected
+
+            for cutoff in [50, 70, expected, expected + 1]:
+                r = ratio.partial_ratio(string1, string2, score_cutoff=cutoff)
+                assert (r >= cutoff) == (expected >= cutoff)
+                if expected >= cutoff:
+                    assert r == expected
@@ -0,0 +1,142 @@
+import random
+
+import pytest
+
+from stringmatch.match import Match
+from stringmatch.ratio import Ratio
+from stringmatch.scorer import (
+    BaseScorer,
+    JaroScorer,
+    JaroWinklerScorer,
+    LevenshteinScorer,
+)
+
+
+def test_score():
+    assert LevenshteinScorer().score("test", "tset") == 75
+    assert round(JaroScorer().score("test", "th test")) == 60
+    assert round(JaroWinklerScorer().score("test", "th test")) == 60
+
+    with pytest.raises(NotImplementedError):
+        BaseScorer().score("test", "tset")
+
+
+def test_score_with_cutoff():
+    assert LevenshteinScorer().score_with_cutoff("test", "tset") == 75
+    assert LevenshteinScorer().score_with_cutoff("test", "tset", 80) == 0
+    assert LevenshteinScorer().score_with_cutoff("test", "test", 150) == 100
+    assert JaroScorer().score_with_cutoff("test", "th test", 70) == 0
+    assert JaroWinklerScorer().score_with_cutoff("test", "th test", 70) == 0
+
+    class MyOwnScorer(BaseScorer):
+        def score(self, string1: str, string2: str) -> float:
+            return 50
+
+    assert MyOwnScorer().score_with_cutoff("test", "tset", 80) == 50
+
+
+def test_score_list():
+    assert LevenshteinScorer().score_list("test", ["tset", "test", "nope"]) == [
+        75,
+        100,
+        25,
+    ]
+    assert LevenshteinScorer().score_list("test", ["tset", "test", "nope"], 80) == [
+        0,
+        100,
+        0,
+    ]
+
+    class MyOwnScorer(BaseScorer):
+        def score(self, string1: str, string2: str) -> float:
+            return len(string2)
+
+    assert MyOwnScorer().score_list("test", ["a", "ab"], 80) == [1, 2]
+
+    class MyListScorer(BaseScorer):
+        calls = 0
+
+        def score_list(self, string, string_list, score_cutoff=0):
+            MyListScorer.calls += 1
+            return [100 if s == string else 0 for s in string_list]
+
+    # The whole list is scored in a single call.
+    assert Ratio(scorer=MyListScorer).ratio_list("test", ["Test", "tset"]) == [100, 0]
+    assert MyListScorer.calls == 1
+
+
+def test_score_cutoff_consistency():
+    random.seed(1234)
+
+    strings = [
+        "".join(random.choice("abcde fg") for _ in range(random.randint(1, 30)))
+        for _ in range(200)
+    ]
+
+    for scorer in [LevenshteinScorer, JaroScorer, JaroWinklerScorer]:
+        for include_partial in [False, True]:
+            ratio = Ratio(scorer=scorer, include_partial=include_partial)
+
+            for string1, string2 in zip(strings, reversed(strings)):
+                r = ratio.ratio(string1, string2)
+
+                for cutoff in [0, 30, 50, r, r + 1, 70, 100]:
+                    r_cutoff = ratio.ratio(string1, string2, score_cutoff=cutoff)
+                    # Scores reaching the cutoff have to stay exactly the same.
+                    assert (r_cutoff >= cutoff) == (r >= cutoff)
+                    if r >= cutoff:
+                        assert r_cutoff == r
+
+
+def test_upper_bound():
+    random.seed(3456)
+
+    strings = [
+        "".join(random.choice("abcab ") for _ in range(random.randint(1, 25)))
+        for _ in range(300)
+    ]
+
+    for scorer in [LevenshteinScorer(), JaroScorer(), JaroWinklerScorer()]:
+        for string1, string2 in zip(strings, reversed(strings)):
+            assert (
+                scorer.score(string1, string2)
+                <= scorer.upper_bound(len(string1), len(string2)) + 1e-9
+            )
+
+        # Two equal strings reach the bound.
+        assert scorer.upper_bound(4, 4) == 100
+
+    assert LevenshteinScorer().upper_bound(4, 6) == 80
+    assert round(JaroScorer().upper_bound(2, 8), 2) == 75
+    assert round(JaroWinklerScorer().upper_bound(2, 8), 2) == 80
+
+    class MyOwnScorer(BaseScorer):
+        def score(self, string1: str, string2: str) -> float:
+            return 50
+
+    assert MyOwnScorer().upper_bound(1, 100) == 100
+
+
+def test_score_only_subclass():
+    for scorer in [LevenshteinScorer, JaroScorer, JaroWinklerScorer]:
+        # A subclass that only overrides score() does not use the rapidfuzz fast paths.
+        class Always(scorer):  # type: ignore
+            def score(self, string1: str, string2: str) -> float:
+                return 100
+
+        assert Always().score_with_cutoff("abc", "xyz", 50) == 100
+        assert Always().upper_bound(1, 100) == 100
+        assert Ratio(scorer=Always).ratio("abc", "xyz") == 100
+        assert Match(scorer=Always).match("abc", "xyzxyzxyz")
+        assert Always().score_list("abc", ["xyz", "abcdefgh"], 50) == [100, 100]
+        assert Ratio(scorer=Always).ratio_list("abc", ["xyz", ""]) == [100, 0]
+        assert Match(scorer=Always).get_best_match("abc", ["xyzxyzxyz"]) == "xyzxyzxyz"
+
+        class Inherited(scorer):  # type: ignore
+            pass
+
+        assert Inherited().score_with_cutoff("abc", "xyz", 50) == 0
+        assert Inherited().upper_bound(4, 6) == scorer().upper_bound(4, 6)
+        assert Inherited().score_list("test", ["tset"]) == scorer().score_list(
+            "test", ["tset"]
+        )
@@ -0,0 +1,133 @@
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from stringmatch import sharded
+from stringmatch.indexfile import _string_sections
+from stringmatch.match import Match
+from stringmatch.scorer import JaroWinklerScorer
+from stringmatch.sharded import ShardedMatchIndex
+from stringmatch.stats import Stats
+
+STRINGS = [
+    "test",
+    "tset",
+    "testing",
+    "tester",
+    "text",
+    "stringmatch",
+    "strmatch",
+    "Stringmatch!",
+    "",
+    None,
+    "something completely different",
+    "tést",
+    "test",
+]
+
+
+@pytest.mark.pure_python
+def test_sharded_index():
+    match = Match(latinise=True)
+
+    with match.sharded_index(STRINGS, shards=3, ngram_size=2) as index:  # type: ignore
+        assert isinstance(index, ShardedMatchIndex)
+        assert index.shards == 3
+        assert len(index) == len(STRINGS)
+
+        # The same results in the same order as without shards.
+        for string in ["test", "stringmatch", "txt", "", 1]:
+            for score in [0, 50, 70]:
+                for limit in [None, 0, 1, 3]:
+                    assert index.get_best_matches_with_ratio(
+                        string, score=score, limit=limit  # type: ignore
+                    ) == match.get_best_matches_with_ratio(
+                        string, STRINGS, score=score, limit=limit  # type: ignore
+                    )
+
+        assert index.get_best_match("strmatch") == "strmatch"
+        assert index.get_best_match_with_ratio("testt") == ("test", 89)
+        assert index.get_best_match("nothing like it") is None
+        assert index.get_best_matches("tets", limit=2) == match.get_best_matches(
+            "tets", STRINGS, limit=2  # type: ignore
+        )
+        assert index.get_best_matches_many(["tset", "strmatch"], limit=1) == [
+            ["tset"],
+            ["strmatch"],
+        ]
+        assert index.get_best_matches_many_with_ratio(["tset"], limit=1) == [
+            [("tset", 100)]
+        ]
+
+
+def test_sharded_index_settings():
+    stats = Stats()
+    match = Match(scorer=JaroWinklerScorer, cache_size=10, stats=stats)
+    string_list = ["stringmatch", "strmatch", "test"]
+
+    # There are never more shards than strings, or less than one.
+    with match.sharded_index(string_list, shards=10) as index:
+        assert index.shards == 3
+        assert index.get_best_matches_with_ratio(
+            "stringmatch"
+        ) == match.get_best_matches_with_ratio("stringmatch", string_list)
+
+    with ShardedMatchIndex(Match(), [], shards=-1) as index:
+        assert index.shards == 1
+        assert index.get_best_matches("test") == []
+
+    index = Match(ignore_case=False).sharded_index(["test", "Test", "TEST"], shards=2)
+    assert index.get_best_matches("TEST", score=100) == ["TEST"]
+    index.close()
+
+    # Strings skipped by their length are counted.
+    with Match(stats=stats).sharded_index(STRINGS, shards=2) as index:  # type: ignore
+        index.get_best_matches("test", score=90)
+        assert index.pruned > 0
+        assert stats.counts["pruned"] == index.pruned
+
+
+def test_sharded_index_closed():
+    index = Match().sharded_index(["test"])
+    index.close()
+
+    with pytest.raises(RuntimeError):
+        index.get_best_matches("test")
+
+
+def test_sharded_index_worker():
+    # What every worker process does when it starts, run in this process.
+    sections = _string_sections(["strmatch", None], ["strmatch", None])
+    layout = {}
+    offset = 0
+    for name, data in sections.items():
+        layout[name] = (offset, len(data))
+        offset += len(data)
+
+    shm = SharedMemory(create=True, size=offset)
+    try:
+        shm.buf[:offset] = b"".join(sections.values())
+        sharded._init_shard(shm.name, layout, 10, {"latinise": True}, 2)
+
+        assert sharded._shard_ready()
+        # The positions are in the whole list, the shard starts at 10.
+        assert sharded._search_shard(["stringmatch", "test"], 70, 5) == [
+            ([(10, "strmatch", 84)], 0),
+            ([], 1),
+        ]
+    finally:
+        sharded._SHARD = None
+        shm.close()
+        shm.unlink()
+
+
+def _fail(*args):
+    raise ValueError
+
+
+def test_sharded_index_broken(monkeypatch):
+    monkeypatch.setattr(sharded, "_init_shard", _fail)
+
+    with pytest.raises(BrokenProcessPool):
+        Match().sharded_index(["test"])
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import stringmatch
+from stringmatch.match import Match
+
+# These take a while to import, and are not needed by every program.
+HEAVY_MODULES = ["asyncio", "concurrent.futures", "json", "unidecode"]
+
+
+def imported_modules(statement: str) -> list:
+    # Runs in a new interpreter, since this one already imported everything.
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    ).stdout.split()
+
+    return [m for m in HEAVY_MODULES + ["rapidfuzz"] if m in output]
+
+
+def test_lazy_imports():
+    assert imported_modules("import stringmatch") == []
+    assert imported_modules("from stringmatch import Distance") == ["rapidfuzz"]
+    assert imported_modules(
+        "from stringmatch import Match; Match().match('a', 'b')"
+    ) == ["rapidfuzz"]
+    assert "asyncio" in imported_modules("from stringmatch import AsyncMatch")
+    assert imported_modules("import stringmatch; stringmatch.warmup()") == (
+        HEAVY_MODULES + ["rapidfuzz"]
+    )
+
+
+def test_getattr():
+    assert stringmatch.Match is Match
+    assert "Match" in dir(stringmatch)
+    assert "warmup" in dir(stringmatch)
+    assert set(stringmatch.__all__) <= set(dir(stringmatch))
+
+    with pytest.raises(AttributeError):
+        stringmatch.Something  # type: ignore
+
+    stringmatch.warmup()
+    for name in stringmatch.__all__:
+        assert getattr(stringmatch, name) is not None
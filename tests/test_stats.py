@@ -0,0 +1,157 @@
+import asyncio
+from typing import List, Tuple
+
+from stringmatch.asyncmatch import AsyncMatch
+from stringmatch.asyncratio import AsyncRatio
+from stringmatch.match import Match
+from stringmatch.ratio import Ratio
+from stringmatch.stats import Stats
+from stringmatch.strings import Normalizer
+
+
+def test_stats():
+    recorded: List[Tuple[str, int, float]] = []
+    stats = Stats(
+        callback=lambda stage, count, seconds: recorded.append((stage, count, seconds))
+    )
+
+    stats._record("score", 3, 0.5)
+    stats._record("score", 2, 0.25)
+    stats._record("pruned", 4)
+
+    assert stats.counts["score"] == 5
+    assert stats.times["score"] == 0.75
+    assert stats.as_dict()["pruned"] == {"count": 4, "seconds": 0.0}
+    assert stats.as_dict()["sort"] == {"count": 0, "seconds": 0.0}
+    assert recorded == [("score", 3, 0.5), ("score", 2, 0.25), ("pruned", 4, 0.0)]
+
+    stats.reset()
+    assert stats.counts["score"] == 0
+    assert stats.times["score"] == 0.0
+
+    # Without a callback, things still get counted.
+    Stats()._record("score", 1)
+
+
+def test_stats_disabled():
+    assert Match().stats is None
+    assert Ratio().stats is None
+    assert Match()._get_ratio().stats is None
+
+
+def test_stats_normalize():
+    stats = Stats()
+    normalizer = Normalizer(latinise=True, alphanumeric=True, stats=stats)
+
+    assert normalizer.normalize("Héllö, world!") == "hello world"
+    assert normalizer._normalize_list(["Héllö", None, "wörld"]) == [  # type: ignore
+        "hello",
+        None,
+        "world",
+    ]
+    assert stats.counts["latinise"] == 3
+    assert stats.counts["normalize"] == 3
+    assert stats.times["latinise"] > 0
+    # There is no cache to count.
+    assert stats.counts["cache_hits"] == stats.counts["cache_misses"] == 0
+
+    # Without stats the result is the same.
+    assert Normalizer(latinise=True, alphanumeric=True)._normalize_list(
+        ["Héllö", None, "wörld"]  # type: ignore
+    ) == ["hello", None, "world"]
+
+
+def test_stats_ratio():
+    stats = Stats()
+    ratio = Ratio(latinise=True, cache_size=10, stats=stats)
+
+    assert ratio.ratio("séärçh", "search") == 100
+    assert ratio.ratio_list("séärçh", ["search", "", "seek", 1]) == [  # type: ignore
+        100,
+        0,
+        40,
+        0,
+    ]
+    # Every string is latinised, but ascii strings never go through the cache.
+    assert stats.counts["latinise"] == 6
+    assert stats.counts["cache_hits"] == 1
+    assert stats.counts["cache_misses"] == 1
+    # Empty strings and non-strings are not scored.
+    assert stats.counts["score"] == 3
+    assert stats.counts["partial"] == 0
+
+    # The stats are shared, even if the settings change.
+    ratio.include_partial = True
+    assert ratio.partial_ratio("test", "This is a test!") == 75
+    assert ratio.ratio_list("test", ["This is a test!", "test"]) == [75, 100]
+    assert stats.counts["score"] == 6
+    assert stats.counts["partial"] == 4
+
+    assert Ratio(stats=stats).ratio_matrix(["search"], ["search", "seek"]) == [
+        [100, 40]
+    ]
+    assert stats.counts["score"] == 8
+
+
+def test_stats_match():
+    stats = Stats()
+    match = Match(stats=stats)
+    string_list = ["search", "seek", "find", "something completely different"]
+
+    assert match.get_best_matches("searchh", string_list, score=70) == ["search"]
+    # The last string is too long to reach the cutoff score.
+    assert stats.counts["pruned"] == 1
+    assert stats.counts["score"] == 3
+    assert stats.counts["sort"] == 1
+    assert stats.counts["normalize"] == 5
+    assert stats.times["sort"] > 0
+
+    stats.reset()
+    index = match.index(string_list, ngram_size=2)
+    assert stats.counts["normalize"] == 4
+
+    assert index.get_best_matches("searchh", score=70) == ["search"]
+    # Every string is either skipped or scored.
+    assert stats.counts["pruned"] == index.pruned
+    assert stats.counts["pruned"] + stats.counts["score"] == len(string_list)
+    assert stats.counts["normalize"] == 5
+
+    stats.reset()
+    assert match.get_best_matches_many(["search", "find"], string_list) == [
+        ["search"],
+        ["find"],
+    ]
+    assert stats.counts["normalize"] == 6
+
+
+def test_stats_async():
+    stats = Stats()
+
+    async def run():
+        assert await AsyncMatch(stats=stats).get_best_matches(
+            "search", ["search", "seek"]
+        ) == ["search"]
+        assert await AsyncRatio(stats=stats).ratio_list("search", ["search"]) == [100]
+
+    asyncio.run(run())
+
+    assert AsyncMatch(stats=stats).stats is stats
+    assert AsyncRatio(stats=stats).stats is stats
+    assert stats.counts["score"] == 3
+
+
+def test_stats_find_duplicates():
+    stats = Stats()
+    string_list = ["test", "tset", "This is a test!", "a"]
+
+    assert Match(stats=stats).find_duplicates(string_list) == [["test", "tset"]]
+    # Only the pair of "test" and "tset" can reach the cutoff score by their length.
+    assert stats.counts["score"] == 1
+    assert stats.counts["pruned"] == 5
+
+    stats.reset()
+    assert Match(include_partial=True, stats=stats).find_duplicates(string_list) == [
+        ["test", "tset", "This is a test!"]
+    ]
+    assert stats.counts["score"] + stats.counts["pruned"] == 6
+    assert stats.counts["partial"] > 0
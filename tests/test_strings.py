@@ -1,4 +1,6 @@
-from stringmatch.strings import Strings
+import itertools
+
+from stringmatch.strings import Normalizer, Strings
 
 
 def test_latinise():
@@ -21,3 +23,58 @@ def test_alphanumeric():
 def test_ignore_case():
     assert Strings().ignore_case("Héllö, world!") == "héllö, world!"
     assert Strings().ignore_case("test test!", lower=False) == "TEST TEST!"
+
+
+def test_normalizer():
+    assert Normalizer().normalize("Héllö, World!") == "héllö, world!"
+    assert Normalizer(latinise=True).normalize("Héllö, World!") == "hello, world!"
+    assert (
+        Normalizer(ignore_case=False, remove_punctuation=True).normalize(
+            "Héllö, World!"
+        )
+        == "Héllö World"
+    )
+    assert Normalizer(alphanumeric=True).normalize("Héllö, World!") == "hll world"
+    assert (
+        Normalizer(latinise=True, alphanumeric=True).normalize("Héllö, World!")
+        == "hello world"
+    )
+    # The Kelvin sign is a "k" in lower case.
+    assert Normalizer(alphanumeric=True).normalize("\u212a!") == "k"
+    assert Normalizer(ignore_case=False, alphanumeric=True).normalize("\u212a!") == ""
+
+
+def test_normalizer_same_as_strings():
+    strings = [
+        "Héllö, world!",
+        "ỲṖßɆȜǼǄ",
+        "ジャパニーズ",
+        "「 Tournament Official 」",
+        "...Hello!!!",
+        "What? À special word!",
+        "\u212a elvin",
+        "",
+    ]
+
+    for latinise, ignore_case, remove_punctuation, alphanumeric in itertools.product(
+        [False, True], repeat=4
+    ):
+        normalizer = Normalizer(
+            latinise=latinise,
+            ignore_case=ignore_case,
+            remove_punctuation=remove_punctuation,
+            alphanumeric=alphanumeric,
+        )
+
+        for string in strings:
+            expected = string
+            if latinise:
+                expected = Strings().latinise(expected)
+            if ignore_case:
+                expected = Strings().ignore_case(expected)
+            if remove_punctuation:
+                expected = Strings().remove_punctuation(expected)
+            if alphanumeric:
+                expected = Strings().alphanumeric(expected)
+
+            assert normalizer.normalize(string) == expected